@@ -12,3 +12,13 @@ class ColorMode(IntEnum):
     WIRE_COLOR_RGB = 2
     OVERRIDE_COLOR_INDEX = 3
     OVERRIDE_COLOR_RGB = 4
+
+
+class PivotMode(IntEnum):
+    """
+    Enum class of all available selection pivot modes.
+    """
+
+    BOUNDING_BOX = 0
+    CENTROID = 1
+    MEDIAN = 2
@@ -0,0 +1,759 @@
+import time
+import numpy as np
+
+try:
+
+    from maya.api import OpenMaya as om
+    from maya.api import OpenMayaAnim as oma
+    from dcc.maya.decorators import undo
+
+except ImportError:
+
+    # Baking requires Maya, the stand-ins only allow dependent modules to be imported
+    #
+    from .standins import OpenMaya as om, undo
+    oma = None
+
+from . import solverutils, profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def getDagPath(node):
+    """
+    Returns a dag path to the supplied node.
+
+    :type node: Union[om.MObject, om.MDagPath, mpynode.MPyNode]
+    :rtype: om.MDagPath
+    """
+
+    if isinstance(node, om.MDagPath):
+
+        return node
+
+    elif isinstance(node, om.MObject):
+
+        return om.MDagPath.getAPathTo(node)
+
+    else:
+
+        return om.MDagPath.getAPathTo(node.object())
+
+
+def findPlug(dagPath, name, instanced=False):
+    """
+    Returns the named plug from the supplied dag path.
+    Instanced attributes, such as `worldMatrix`, will return the element associated with the dag path's instance.
+
+    :type dagPath: om.MDagPath
+    :type name: str
+    :type instanced: bool
+    :rtype: om.MPlug
+    """
+
+    plug = om.MFnDagNode(dagPath).findPlug(name, False)
+
+    if instanced:
+
+        return plug.elementByLogicalIndex(dagPath.instanceNumber())
+
+    else:
+
+        return plug
+
+
+def getMatrixArray(plug):
+    """
+    Returns the matrix from the supplied plug as a (4, 4) array.
+
+    :type plug: om.MPlug
+    :rtype: np.ndarray
+    """
+
+    matrix = om.MFnMatrixData(plug.asMObject()).matrix()
+    return np.array(tuple(matrix), dtype=float).reshape(4, 4)
+
+
+def getOrientArray(dagPath, name):
+    """
+    Returns the orientation matrix from the supplied angular compound as a (3, 3) array.
+    Orientations, such as `jointOrient` and `rotateAxis`, always use the xyz rotate order.
+
+    :type dagPath: om.MDagPath
+    :type name: str
+    :rtype: np.ndarray
+    """
+
+    fnDagNode = om.MFnDagNode(dagPath)
+
+    if not fnDagNode.hasAttribute(name):
+
+        return np.eye(3)
+
+    plug = fnDagNode.findPlug(name, False)
+    radians = [plug.child(i).asDouble() for i in range(3)]
+
+    return solverutils.createRotationMatrices(radians, rotateOrder=0)[0]
+
+
+class MatchBaker(object):
+    """
+    Base class used to bake matches across a frame range.
+    Driver matrices are sampled once per frame into a preallocated array, solved in bulk and then written as keys through `MFnAnimCurve.addKeys`.
+    The optional callback is invoked with the current stage and a normalized progress value, returning False cancels the bake.
+    """
+
+    # region Dunderscores
+    def __init__(self, startTime, endTime, step=1.0, callback=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type startTime: Union[int, float]
+        :type endTime: Union[int, float]
+        :type step: Union[int, float]
+        :type callback: Union[Callable[[str, float], bool], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(MatchBaker, self).__init__()
+
+        # Declare private variables
+        #
+        self._times = np.arange(startTime, endTime + (step * 0.5), step, dtype=float)
+        self._callback = callback
+        self._cancelled = False
+        self._timings = {}
+        self._sources = []
+        self._sourceIndices = {}
+        self._samples = None
+        self._channels = []
+        self._dgModifier = om.MDGModifier()
+        self._animCurveChange = oma.MAnimCurveChange()
+    # endregion
+
+    # region Properties
+    @property
+    def times(self):
+        """
+        Getter method that returns the frames being baked.
+
+        :rtype: np.ndarray
+        """
+
+        return self._times
+
+    @property
+    def frameCount(self):
+        """
+        Getter method that returns the number of frames being baked.
+
+        :rtype: int
+        """
+
+        return len(self._times)
+
+    @property
+    def cancelled(self):
+        """
+        Getter method that returns the cancelled flag.
+
+        :rtype: bool
+        """
+
+        return self._cancelled
+    # endregion
+
+    # region Methods
+    def timings(self):
+        """
+        Returns the elapsed time, in seconds, for each stage.
+
+        :rtype: Dict[str, float]
+        """
+
+        return dict(self._timings)
+
+    def notify(self, stage, progress):
+        """
+        Notifies the callback of the current progress.
+        If the callback returns False then the bake is flagged as cancelled.
+
+        :type stage: str
+        :type progress: float
+        :rtype: bool
+        """
+
+        if self._callback is not None and not self._cancelled:
+
+            self._cancelled = self._callback(stage, progress) is False
+
+        return not self._cancelled
+
+    def addSource(self, plug):
+        """
+        Registers the supplied matrix plug for sampling and returns its index.
+        Duplicate plugs are only sampled once.
+
+        :type plug: om.MPlug
+        :rtype: int
+        """
+
+        name = plug.partialName(includeNodeName=True, useFullAttributePath=True, useLongNames=True)
+        index = self._sourceIndices.get(name, None)
+
+        if index is None:
+
+            index = len(self._sources)
+
+            self._sources.append(plug)
+            self._sourceIndices[name] = index
+
+        return index
+
+    @profileutils.profile
+    def sample(self):
+        """
+        Samples all of the registered source plugs across the frame range.
+        The results are stored as an (F, S, 4, 4) array.
+
+        :rtype: bool
+        """
+
+        # Preallocate samples
+        #
+        startTime = time.perf_counter()
+
+        numFrames, numSources = self.frameCount, len(self._sources)
+        samples = np.empty((numFrames, numSources, 16), dtype=float)
+
+        # Iterate through frames
+        #
+        unit = om.MTime.uiUnit()
+
+        for (i, frame) in enumerate(self._times):
+
+            context = om.MDGContext(om.MTime(frame, unit))
+            previousContext = context.makeCurrent()
+
+            try:
+
+                for (j, plug) in enumerate(self._sources):
+
+                    samples[i, j] = tuple(om.MFnMatrixData(plug.asMObject()).matrix())
+
+            finally:
+
+                previousContext.makeCurrent()
+
+            if not self.notify('sample', float(i + 1) / numFrames):
+
+                break
+
+        self._samples = samples.reshape(numFrames, numSources, 4, 4)
+        self._timings['sample'] = time.perf_counter() - startTime
+
+        return not self._cancelled
+
+    def samples(self, index):
+        """
+        Returns the sampled (F, 4, 4) matrices for the specified source index.
+
+        :type index: int
+        :rtype: np.ndarray
+        """
+
+        return self._samples[:, index]
+
+    def addChannel(self, plug, values):
+        """
+        Queues the supplied values to be keyed on the specified plug.
+
+        :type plug: om.MPlug
+        :type values: np.ndarray
+        :rtype: None
+        """
+
+        # Check if plug is writable
+        #
+        if plug.isLocked:
+
+            log.warning(f'Skipping locked plug: {plug.info}')
+            return
+
+        source = plug.source()
+
+        if not source.isNull and not source.node().hasFn(om.MFn.kAnimCurve):
+
+            log.warning(f'Skipping connected plug: {plug.info}')
+            return
+
+        self._channels.append((plug, np.asarray(values, dtype=float)))
+
+    def addTranslateChannels(self, dagPath, translations):
+        """
+        Queues the supplied (F, 3) translations to be keyed on the specified node.
+
+        :type dagPath: om.MDagPath
+        :type translations: np.ndarray
+        :rtype: None
+        """
+
+        for (i, name) in enumerate(('translateX', 'translateY', 'translateZ')):
+
+            self.addChannel(findPlug(dagPath, name), translations[:, i])
+
+    def addRotateChannels(self, dagPath, radians):
+        """
+        Queues the supplied (F, 3) euler angles to be keyed on the specified node.
+        Angles are unwrapped across the frame range to avoid flipping.
+
+        :type dagPath: om.MDagPath
+        :type radians: np.ndarray
+        :rtype: None
+        """
+
+        radians = np.unwrap(radians, axis=0)
+
+        for (i, name) in enumerate(('rotateX', 'rotateY', 'rotateZ')):
+
+            self.addChannel(findPlug(dagPath, name), radians[:, i])
+
+    def findAnimCurve(self, plug):
+        """
+        Returns the anim-curve function set for the supplied plug.
+        If no anim-curve exists then one is created through the internal modifier.
+
+        :type plug: om.MPlug
+        :rtype: oma.MFnAnimCurve
+        """
+
+        animCurves = oma.MAnimUtil.findAnimation(plug)
+
+        if len(animCurves) > 0:
+
+            return oma.MFnAnimCurve(animCurves[0])
+
+        else:
+
+            fnAnimCurve = oma.MFnAnimCurve()
+            fnAnimCurve.create(plug, modifier=self._dgModifier)
+
+            return fnAnimCurve
+
+    @profileutils.profile
+    def write(self):
+        """
+        Writes all of the queued channels as keys.
+        Each channel only requires a single `addKeys` call, existing keys inside the bake range are replaced.
+
+        :rtype: bool
+        """
+
+        # Check if bake was cancelled
+        #
+        if self._cancelled:
+
+            return False
+
+        # Create any missing anim-curves
+        #
+        startTime = time.perf_counter()
+
+        animCurves = [self.findAnimCurve(plug) for (plug, values) in self._channels]
+        self._dgModifier.doIt()
+
+        # Add keys to anim-curves
+        #
+        unit = om.MTime.uiUnit()
+        times = om.MTimeArray([om.MTime(frame, unit) for frame in self._times])
+
+        numChannels = len(self._channels)
+
+        for (i, (fnAnimCurve, (plug, values))) in enumerate(zip(animCurves, self._channels)):
+
+            self.clearKeys(fnAnimCurve)
+
+            fnAnimCurve.addKeys(
+                times,
+                om.MDoubleArray(values.tolist()),
+                tangentInType=oma.MFnAnimCurve.kTangentGlobal,
+                tangentOutType=oma.MFnAnimCurve.kTangentGlobal,
+                keepExistingKeys=True,
+                change=self._animCurveChange
+            )
+
+            if not self.notify('write', float(i + 1) / numChannels):
+
+                break
+
+        # Commit changes to undo queue
+        # Any keys written before a cancel are still undoable!
+        #
+        undo.commit(self.undoIt, self.doIt)
+
+        self._timings['write'] = time.perf_counter() - startTime
+
+        return not self._cancelled
+
+    def clearKeys(self, fnAnimCurve):
+        """
+        Removes any existing keys inside the bake range from the supplied anim-curve.
+        Keys outside of the bake range are left untouched.
+
+        :type fnAnimCurve: oma.MFnAnimCurve
+        :rtype: None
+        """
+
+        unit = om.MTime.uiUnit()
+        startTime, endTime = (self._times[0] - 1e-3), (self._times[-1] + 1e-3)
+
+        for index in reversed(range(fnAnimCurve.numKeys)):
+
+            frame = fnAnimCurve.input(index).asUnits(unit)
+
+            if startTime <= frame <= endTime:
+
+                fnAnimCurve.remove(index, change=self._animCurveChange)
+
+    def doIt(self):
+        """
+        Reapplies any keys and anim-curves created by this baker.
+
+        :rtype: None
+        """
+
+        self._dgModifier.doIt()
+        self._animCurveChange.redoIt()
+
+    def undoIt(self):
+        """
+        Reverts any keys and anim-curves created by this baker.
+
+        :rtype: None
+        """
+
+        self._animCurveChange.undoIt()
+        self._dgModifier.undoIt()
+
+    def solve(self):
+        """
+        Solves the sampled matrices and queues the resulting channels.
+        Overload this method in order to implement a match.
+
+        :rtype: None
+        """
+
+        pass
+
+    def bake(self):
+        """
+        Executes the sample, solve and write stages.
+
+        :rtype: bool
+        """
+
+        # Sample source matrices
+        #
+        success = self.sample()
+
+        if not success:
+
+            log.warning('Bake cancelled while sampling!')
+            return False
+
+        # Solve sampled matrices
+        #
+        startTime = time.perf_counter()
+
+        self.solve()
+        self._timings['solve'] = time.perf_counter() - startTime
+
+        if not self.notify('solve', 1.0):
+
+            log.warning('Bake cancelled while solving!')
+            return False
+
+        # Write solved channels
+        #
+        success = self.write()
+
+        if not success:
+
+            log.warning('Bake cancelled while writing!')
+            return False
+
+        timings = ', '.join([f'{stage}: {seconds:.3f}s' for (stage, seconds) in self._timings.items()])
+        log.info(f'Baked {len(self._channels)} channels across {self.frameCount} frames ({timings})')
+
+        return True
+    # endregion
+
+
+class ForwardToInverseBaker(MatchBaker):
+    """
+    Overload of `MatchBaker` that matches forward chains to their inverse chains.
+    Scale is not matched, mirroring `kinematicutils.forwardToInverse`.
+    """
+
+    # region Dunderscores
+    def __init__(self, chains, startTime, endTime, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :type chains: List[Tuple[List[om.MObject], List[om.MObject]]]
+        :type startTime: Union[int, float]
+        :type endTime: Union[int, float]
+        :key step: Union[int, float]
+        :key callback: Union[Callable[[str, float], bool], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(ForwardToInverseBaker, self).__init__(startTime, endTime, **kwargs)
+
+        # Declare private variables
+        #
+        self._targets = []
+
+        # Register chain sources
+        #
+        for (fkNodes, ikNodes) in chains:
+
+            # Check if list lengths are identical
+            #
+            if len(fkNodes) != len(ikNodes):
+
+                raise TypeError('ForwardToInverseBaker() expects chains with identical lengths!')
+
+            # Iterate through chain
+            #
+            fkPaths = [getDagPath(fkNode) for fkNode in fkNodes]
+            ikPaths = [getDagPath(ikNode) for ikNode in ikNodes]
+
+            for (i, (fkPath, ikPath)) in enumerate(zip(fkPaths, ikPaths)):
+
+                # Evaluate parent space
+                # If the parent is the previous forward node, then its matched world-matrix is identical to the previous inverse node!
+                #
+                worldIndex = self.addSource(findPlug(ikPath, 'worldMatrix', instanced=True))
+                isChained = i > 0 and om.MFnDagNode(fkPath).parent(0) == fkPaths[i - 1].node()
+
+                if isChained:
+
+                    parentIndex = self.addSource(findPlug(ikPaths[i - 1], 'worldMatrix', instanced=True))
+
+                else:
+
+                    parentIndex = self.addSource(findPlug(fkPath, 'parentMatrix', instanced=True))
+
+                # Store static transform components
+                #
+                fnDagNode = om.MFnDagNode(fkPath)
+                hasOffsetParentMatrix = fnDagNode.hasAttribute('offsetParentMatrix')
+
+                offsetParentMatrix = getMatrixArray(findPlug(fkPath, 'offsetParentMatrix')) if hasOffsetParentMatrix else np.eye(4)
+                rotateAxis = getOrientArray(fkPath, 'rotateAxis')
+                jointOrient = getOrientArray(fkPath, 'jointOrient')
+                rotateOrder = findPlug(fkPath, 'rotateOrder').asInt()
+
+                self._targets.append((fkPath, worldIndex, parentIndex, isChained, offsetParentMatrix, rotateAxis, jointOrient, rotateOrder))
+    # endregion
+
+    # region Methods
+    def solve(self):
+        """
+        Solves the sampled matrices and queues the resulting channels.
+
+        :rtype: None
+        """
+
+        for (fkPath, worldIndex, parentIndex, isChained, offsetParentMatrix, rotateAxis, jointOrient, rotateOrder) in self._targets:
+
+            # Remove scale from matched matrices
+            #
+            worldMatrices = np.array(self.samples(worldIndex))
+            worldMatrices[:, :3, :3] = solverutils.normalizeVectors(worldMatrices[:, :3, :3])
+
+            parentMatrices = np.array(self.samples(parentIndex))
+
+            if isChained:
+
+                parentMatrices[:, :3, :3] = solverutils.normalizeVectors(parentMatrices[:, :3, :3])
+
+            # Calculate local matrices
+            #
+            localMatrices = np.matmul(np.matmul(worldMatrices, np.linalg.inv(parentMatrices)), np.linalg.inv(offsetParentMatrix))
+
+            translations = localMatrices[:, 3, :3]
+            rotationMatrices = solverutils.normalizeVectors(localMatrices[:, :3, :3])
+            rotationMatrices = np.matmul(np.matmul(rotateAxis.T, rotationMatrices), jointOrient.T)
+
+            radians = solverutils.decomposeRotationMatrices(rotationMatrices, rotateOrder=rotateOrder)
+
+            # Queue channels
+            #
+            self.addTranslateChannels(fkPath, translations)
+            self.addRotateChannels(fkPath, radians)
+    # endregion
+
+
+class InverseToForwardBaker(MatchBaker):
+    """
+    Overload of `MatchBaker` that matches inverse effectors to their forward chains.
+    Only translation is matched, mirroring `kinematicutils.inverseToForward`.
+    """
+
+    # region Dunderscores
+    def __init__(self, chains, startTime, endTime, **kwargs):
+        """
+        Private method called after a new instance has been created.
+        Each chain consists of the forward nodes, the start and end effectors and an optional pole vector.
+
+        :type chains: List[Tuple[List[om.MObject], om.MObject, om.MObject, Union[om.MObject, None]]]
+        :type startTime: Union[int, float]
+        :type endTime: Union[int, float]
+        :key step: Union[int, float]
+        :key callback: Union[Callable[[str, float], bool], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(InverseToForwardBaker, self).__init__(startTime, endTime, **kwargs)
+
+        # Declare private variables
+        #
+        self._targets = []
+
+        # Register chain sources
+        #
+        for (fkNodes, startEffector, endEffector, poleVector) in chains:
+
+            # Check if there are enough nodes
+            #
+            numFkNodes = len(fkNodes)
+
+            if numFkNodes < 2:
+
+                raise TypeError(f'InverseToForwardBaker() expects at least 2 forward nodes ({numFkNodes} given)!')
+
+            # Register forward sources
+            #
+            fkPaths = [getDagPath(fkNode) for fkNode in fkNodes]
+            fkIndices = [self.addSource(findPlug(fkPath, 'worldMatrix', instanced=True)) for fkPath in fkPaths]
+
+            # Register effector sources
+            #
+            effectorPaths = [getDagPath(startEffector), getDagPath(endEffector)]
+            effectorIndices = [self.addSource(findPlug(effectorPath, 'parentMatrix', instanced=True)) for effectorPath in effectorPaths]
+
+            if poleVector is not None and numFkNodes >= 3:
+
+                poleVectorPath = getDagPath(poleVector)
+                poleVectorIndex = self.addSource(findPlug(poleVectorPath, 'parentMatrix', instanced=True))
+
+            else:
+
+                poleVectorPath, poleVectorIndex = None, None
+
+            self._targets.append((fkIndices, effectorPaths, effectorIndices, poleVectorPath, poleVectorIndex))
+    # endregion
+
+    # region Methods
+    def toLocalTranslations(self, dagPath, parentIndex, points):
+        """
+        Returns the supplied (F, 3) world points in the local space of the specified node.
+
+        :type dagPath: om.MDagPath
+        :type parentIndex: int
+        :type points: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        fnDagNode = om.MFnDagNode(dagPath)
+        hasOffsetParentMatrix = fnDagNode.hasAttribute('offsetParentMatrix')
+
+        offsetParentMatrix = getMatrixArray(findPlug(dagPath, 'offsetParentMatrix')) if hasOffsetParentMatrix else np.eye(4)
+        parentMatrices = np.matmul(offsetParentMatrix, self.samples(parentIndex))
+
+        homogeneousPoints = np.concatenate([points, np.ones((len(points), 1))], axis=-1)
+
+        return np.matmul(homogeneousPoints[:, None, :], np.linalg.inv(parentMatrices))[:, 0, :3]
+
+    def solve(self):
+        """
+        Solves the sampled matrices and queues the resulting channels.
+
+        :rtype: None
+        """
+
+        for (fkIndices, effectorPaths, effectorIndices, poleVectorPath, poleVectorIndex) in self._targets:
+
+            # Snap effectors to forward nodes
+            #
+            startPoints = self.samples(fkIndices[0])[:, 3, :3]
+            endPoints = self.samples(fkIndices[-1])[:, 3, :3]
+
+            for (effectorPath, parentIndex, points) in zip(effectorPaths, effectorIndices, (startPoints, endPoints)):
+
+                self.addTranslateChannels(effectorPath, self.toLocalTranslations(effectorPath, parentIndex, points))
+
+            # Check if pole vector requires matching
+            #
+            if poleVectorPath is None:
+
+                continue
+
+            chainPoints = np.stack([self.samples(fkIndex)[:, 3, :3] for fkIndex in fkIndices], axis=1)
+            fallbackVectors = self.samples(fkIndices[0])[:, 1, :3]
+
+            polePoints = solverutils.calculatePolePositions(chainPoints, fallbackVectors=fallbackVectors)
+
+            self.addTranslateChannels(poleVectorPath, self.toLocalTranslations(poleVectorPath, poleVectorIndex, polePoints))
+    # endregion
+
+
+@profileutils.profile
+@undo.Undo(name='Bake Forward to Inverse')
+def bakeForwardToInverse(chains, startTime, endTime, step=1.0, callback=None):
+    """
+    Matches the forward systems to the inverse systems across the specified frame range.
+
+    :type chains: List[Tuple[List[om.MObject], List[om.MObject]]]
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type step: Union[int, float]
+    :type callback: Union[Callable[[str, float], bool], None]
+    :rtype: ForwardToInverseBaker
+    """
+
+    baker = ForwardToInverseBaker(chains, startTime, endTime, step=step, callback=callback)
+    baker.bake()
+
+    return baker
+
+
+@profileutils.profile
+@undo.Undo(name='Bake Inverse to Forward')
+def bakeInverseToForward(chains, startTime, endTime, step=1.0, callback=None):
+    """
+    Matches the inverse systems to the forward systems across the specified frame range.
+
+    :type chains: List[Tuple[List[om.MObject], om.MObject, om.MObject, Union[om.MObject, None]]]
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type step: Union[int, float]
+    :type callback: Union[Callable[[str, float], bool], None]
+    :rtype: InverseToForwardBaker
+    """
+
+    baker = InverseToForwardBaker(chains, startTime, endTime, step=step, callback=callback)
+    baker.bake()
+
+    return baker
@@ -0,0 +1,181 @@
+from maya import cmds as mc
+from dcc.maya.decorators import undo
+from functools import wraps
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class Batch(object):
+    """
+    Base class used to group bulk operations into a single undo chunk.
+    While a batch is open, viewport refreshes are suspended and any deferred callbacks are merged until the outermost batch closes.
+    Batches can be nested and used as either a context manager or decorator.
+    """
+
+    # region Dunderscores
+    __depth__ = 0
+    __undo__ = None
+    __suspended__ = False
+    __deferred__ = {}
+
+    def __init__(self, name='Batch', suspendRefresh=True):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :type suspendRefresh: bool
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(Batch, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = name
+        self._suspendRefresh = suspendRefresh
+
+    def __enter__(self):
+        """
+        Private method that opens this batch.
+        Only the outermost batch opens an undo chunk and suspends refresh.
+
+        :rtype: Batch
+        """
+
+        cls = self.__class__
+        cls.__depth__ += 1
+
+        if cls.__depth__ == 1:
+
+            cls.__undo__ = undo.Undo(name=self._name)
+            cls.__undo__.__enter__()
+
+            if self._suspendRefresh:
+
+                mc.refresh(suspend=True)
+                cls.__suspended__ = True
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that closes this batch.
+        Once the outermost batch closes, the undo chunk is closed, refresh is resumed and deferred callbacks are fired.
+
+        :type exc_type: Union[Type[Exception], None]
+        :type exc_val: Union[Exception, None]
+        :type exc_tb: Union[traceback, None]
+        :rtype: None
+        """
+
+        cls = self.__class__
+        cls.__depth__ -= 1
+
+        if cls.__depth__ > 0:
+
+            return
+
+        # Close undo chunk and resume refresh
+        #
+        try:
+
+            cls.__undo__.__exit__(exc_type, exc_val, exc_tb)
+
+        finally:
+
+            cls.__undo__ = None
+
+            if cls.__suspended__:
+
+                mc.refresh(suspend=False)
+                cls.__suspended__ = False
+
+        # Fire deferred callbacks
+        #
+        flush()
+
+    def __call__(self, func):
+        """
+        Private method that wraps the supplied function inside this batch.
+
+        :type func: Callable
+        :rtype: Callable
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            with Batch(name=self._name, suspendRefresh=self._suspendRefresh):
+
+                return func(*args, **kwargs)
+
+        return wrapper
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of this batch.
+
+        :rtype: str
+        """
+
+        return self._name
+    # endregion
+
+
+def isBatching():
+    """
+    Evaluates if a batch is currently open.
+
+    :rtype: bool
+    """
+
+    return Batch.__depth__ > 0
+
+
+def defer(func, *args, **kwargs):
+    """
+    Defers the supplied function until the outermost batch closes.
+    Repeated deferrals of the same function are merged, keeping the most recent arguments.
+    If no batch is open then the function is called immediately.
+
+    :type func: Callable
+    :rtype: None
+    """
+
+    if isBatching():
+
+        Batch.__deferred__.pop(func, None)
+        Batch.__deferred__[func] = (args, kwargs)
+
+    else:
+
+        func(*args, **kwargs)
+
+
+def flush():
+    """
+    Fires any deferred functions in the order they were last deferred.
+
+    :rtype: None
+    """
+
+    deferred = list(Batch.__deferred__.items())
+    Batch.__deferred__.clear()
+
+    for (func, (args, kwargs)) in deferred:
+
+        try:
+
+            func(*args, **kwargs)
+
+        except Exception as exception:
+
+            log.error(f'Unable to fire deferred callback: {exception}')
@@ -0,0 +1,433 @@
+import os
+import math
+import json
+import time
+import numpy as np
+
+try:
+
+    from maya.api import OpenMaya as om
+    HAS_MAYA = True
+
+except ImportError:
+
+    from .standins import OpenMaya as om
+    HAS_MAYA = False
+
+from . import solverutils, kinematicutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'benchmarkbaseline.json')
+
+
+def asArray(value, size=3):
+    """
+    Returns the supplied point or vector as a flat float array.
+    Both the stand-ins and the real OpenMaya types are supported.
+
+    :type value: Union[om.MVector, om.MPoint]
+    :type size: int
+    :rtype: np.ndarray
+    """
+
+    return np.array(tuple(value), dtype=float)[:size]
+
+
+def referenceIk2BoneChain(startPoint, startLength, endPoint, endLength, poleVector):
+    """
+    Scalar reference for `kinematicutils.solveIk2BoneChain` that returns the joint positions rather than matrices.
+    The middle joint is placed directly from the law of cosines, bending towards the pole vector, so this shares no code with the matrix solvers.
+    Unreachable configurations are clamped to either a straight or fully folded chain.
+
+    :type startPoint: Union[np.ndarray, om.MPoint]
+    :type startLength: float
+    :type endPoint: Union[np.ndarray, om.MPoint]
+    :type endLength: float
+    :type poleVector: Union[np.ndarray, om.MVector]
+    :rtype: np.ndarray
+    """
+
+    # Evaluate aim and bend directions
+    #
+    startPoint, endPoint, poleVector = asArray(startPoint), asArray(endPoint), asArray(poleVector)
+
+    aimVector = endPoint - startPoint
+    aimLength = math.sqrt(float(np.dot(aimVector, aimVector)))
+    forwardVector = aimVector / aimLength
+
+    bendVector = poleVector - (forwardVector * float(np.dot(poleVector, forwardVector)))
+    bendVector = bendVector / math.sqrt(float(np.dot(bendVector, bendVector)))
+
+    # Place middle joint from the start angle
+    #
+    startCosine = ((startLength ** 2.0) + (aimLength ** 2.0) - (endLength ** 2.0)) / (2.0 * startLength * aimLength)
+    startCosine = min(max(startCosine, -1.0), 1.0)
+    startSine = math.sqrt(1.0 - (startCosine ** 2.0))
+
+    midPoint = startPoint + (((forwardVector * startCosine) + (bendVector * startSine)) * startLength)
+
+    # Point the end bone at the target
+    #
+    endVector = endPoint - midPoint
+    endPoint = midPoint + ((endVector / math.sqrt(float(np.dot(endVector, endVector)))) * endLength)
+
+    return np.array([startPoint, midPoint, endPoint])
+
+
+def referenceSoftIk(startPoint, endPoint, chainLength, softDistance):
+    """
+    Pure NumPy reference for `kinematicutils.solveSoftIk`.
+    A soft distance of zero resolves to the hard limit of the chain.
+
+    :type startPoint: Union[np.ndarray, om.MPoint]
+    :type endPoint: Union[np.ndarray, om.MPoint]
+    :type chainLength: float
+    :type softDistance: float
+    :rtype: Tuple[np.ndarray, float]
+    """
+
+    startPoint, endPoint = asArray(startPoint), asArray(endPoint)
+
+    aimVector = endPoint - startPoint
+    distance = float(np.linalg.norm(aimVector))
+
+    threshold = math.fabs(chainLength) - softDistance
+
+    if 0.0 <= distance < threshold:
+
+        softLength = distance
+
+    elif softDistance > 0.0:
+
+        softLength = (softDistance * (1.0 - math.exp(min(-(distance - threshold) / softDistance, 700.0)))) + threshold
+
+    else:
+
+        softLength = min(distance, threshold)
+
+    softScale = (distance / softLength) if softLength != 0.0 else 1.0
+    forwardVector = (aimVector / distance) if distance > 0.0 else aimVector
+
+    return endPoint - (forwardVector * (distance - softLength)), softScale
+
+
+def referencePoleVector(startPoint, midPoint, endPoint):
+    """
+    Pure NumPy reference for `kinematicutils.solvePoleVector`.
+
+    :type startPoint: Union[np.ndarray, om.MPoint]
+    :type midPoint: Union[np.ndarray, om.MPoint]
+    :type endPoint: Union[np.ndarray, om.MPoint]
+    :rtype: np.ndarray
+    """
+
+    def normalize(vector):
+
+        length = np.linalg.norm(vector)
+        return vector / length if length > 0.0 else vector
+
+    startPoint, midPoint, endPoint = asArray(startPoint), asArray(midPoint), asArray(endPoint)
+
+    forwardVector = normalize(endPoint - startPoint)
+    crossProduct = np.cross(normalize(midPoint - startPoint), forwardVector)
+
+    return np.cross(forwardVector, crossProduct)
+
+
+def referenceFit2BoneIKto3BoneIK(points):
+    """
+    Pure NumPy reference for `kinematicutils.fit2BoneIKto3BoneIK`.
+    Straight chains, where the fitted length is undefined, return NaN for the middle point.
+
+    :type points: Union[np.ndarray, List[om.MPoint]]
+    :rtype: np.ndarray
+    """
+
+    points = np.array([asArray(point) for point in points], dtype=float)
+
+    chainLength = float(np.linalg.norm(np.diff(points, axis=0), axis=-1).sum())
+    initialVector = points[1] - points[0]
+    initialLength = np.linalg.norm(initialVector)
+    initialVector = (initialVector / initialLength) if initialLength > 0.0 else initialVector
+    aimVector = points[-1] - points[0]
+
+    denominator = 2.0 * (np.dot(aimVector, initialVector) - chainLength)
+    length = ((np.dot(aimVector, aimVector) - (chainLength ** 2.0)) / denominator) if denominator != 0.0 else math.nan
+
+    return np.array([points[0], points[0] + (initialVector * length), points[-1]])
+
+
+def createRandomChains(numChains, numJoints=3, seed=0):
+    """
+    Returns (M, N, 3) randomized joint chains with bone lengths between 1 and 10 units.
+
+    :type numChains: int
+    :type numJoints: int
+    :type seed: int
+    :rtype: np.ndarray
+    """
+
+    generator = np.random.default_rng(seed)
+
+    directions = solverutils.normalizeVectors(generator.normal(size=(numChains, numJoints - 1, 3)))
+    lengths = generator.uniform(1.0, 10.0, size=(numChains, numJoints - 1, 1))
+    origins = generator.uniform(-100.0, 100.0, size=(numChains, 1, 3))
+
+    return np.concatenate([origins, origins + np.cumsum(directions * lengths, axis=1)], axis=1)
+
+
+def createDegenerateChains():
+    """
+    Returns a dictionary of degenerate 3-joint chains keyed by case name.
+    Each chain is paired with the target point used by the IK solvers.
+
+    :rtype: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    """
+
+    return {
+        'zeroLength': (np.array([(0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (5.0, 0.0, 0.0)]), np.array((3.0, 1.0, 0.0))),
+        'zeroDistance': (np.array([(0.0, 0.0, 0.0), (5.0, 1.0, 0.0), (10.0, 0.0, 0.0)]), np.array((0.0, 0.0, 0.0))),
+        'collinear': (np.array([(0.0, 0.0, 0.0), (5.0, 0.0, 0.0), (10.0, 0.0, 0.0)]), np.array((5.0, 0.0, 0.0))),
+        'coincident': (np.array([(1.0, 1.0, 1.0), (1.0, 1.0, 1.0), (1.0, 1.0, 1.0)]), np.array((1.0, 1.0, 1.0))),
+        'overExtended': (np.array([(0.0, 0.0, 0.0), (5.0, 1.0, 0.0), (10.0, 0.0, 0.0)]), np.array((50.0, 0.0, 0.0)))
+    }
+
+
+def timeit(func, *args, repeat=3, **kwargs):
+    """
+    Returns the fastest execution time, in seconds, of the supplied function.
+
+    :type func: Callable
+    :type repeat: int
+    :rtype: float
+    """
+
+    timings = []
+
+    for i in range(repeat):
+
+        startTime = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - startTime)
+
+    return min(timings)
+
+
+def measureThroughput(chains, softDistance=1.0, repeat=3):
+    """
+    Returns the number of chains solved per second, per function, for both the scalar and batched paths.
+    The scalar paths always evaluate `kinematicutils`, against the stand-in types when Maya is unavailable.
+
+    :type chains: np.ndarray
+    :type softDistance: float
+    :type repeat: int
+    :rtype: Dict[str, Dict[str, float]]
+    """
+
+    # Derive inputs from chains
+    #
+    numChains = len(chains)
+    startPoints, midPoints, endPoints = chains[:, 0], chains[:, 1], chains[:, 2]
+
+    startLengths = np.linalg.norm(midPoints - startPoints, axis=-1)
+    endLengths = np.linalg.norm(endPoints - midPoints, axis=-1)
+    chainLengths = startLengths + endLengths
+    poleVectors = solverutils.calculatePoleVectors(startPoints, midPoints, endPoints)
+
+    scalarChains = [[om.MPoint(*point) for point in points] for points in chains]
+    scalarPoles = [om.MVector(*vector) for vector in poleVectors]
+
+    # Time scalar paths
+    #
+    def solveScalarIks():
+
+        for (points, startLength, endLength, poleVector) in zip(scalarChains, startLengths, endLengths, scalarPoles):
+
+            kinematicutils.solveIk2BoneChain(points[0], startLength, points[2], endLength, poleVector)
+
+    def solveScalarSoftIks():
+
+        for (points, chainLength) in zip(scalarChains, chainLengths):
+
+            kinematicutils.solveSoftIk(points[0], points[2], chainLength, softDistance)
+
+    def solveScalarPoleVectors():
+
+        for points in scalarChains:
+
+            kinematicutils.solvePoleVector(*points)
+
+    def solveScalarFits():
+
+        for points in scalarChains:
+
+            kinematicutils.fit2BoneIKto3BoneIK(points)
+
+    # Time batched paths
+    #
+    def solveBatchedIks():
+
+        solverutils.solveIk2BoneChains(startPoints, startLengths, endPoints, endLengths, poleVectors)
+
+    def solveBatchedSoftIks():
+
+        solverutils.solveSoftIks(startPoints, endPoints, chainLengths, softDistance)
+
+    def solveBatchedPoleVectors():
+
+        solverutils.calculatePoleVectors(startPoints, midPoints, endPoints)
+
+    def solveBatchedFits():
+
+        solverutils.fit2BoneIKto3BoneIKs(chains)
+
+    paths = {
+        'solveIk2BoneChain': (solveScalarIks, solveBatchedIks),
+        'solveSoftIk': (solveScalarSoftIks, solveBatchedSoftIks),
+        'solvePoleVector': (solveScalarPoleVectors, solveBatchedPoleVectors),
+        'fit2BoneIKto3BoneIK': (solveScalarFits, solveBatchedFits)
+    }
+
+    throughput = {}
+
+    for (name, (scalarFunc, batchedFunc)) in paths.items():
+
+        throughput[name] = {
+            'scalar': numChains / max(timeit(scalarFunc, repeat=repeat), 1e-9),
+            'batched': numChains / max(timeit(batchedFunc, repeat=repeat), 1e-9)
+        }
+
+    return throughput
+
+
+def calculateSpeedups(throughput):
+    """
+    Returns the batched speedup, per function, from the supplied throughput.
+    Speedups are relative to the scalar path on the same machine so they can be compared between machines.
+
+    :type throughput: Dict[str, Dict[str, float]]
+    :rtype: Dict[str, float]
+    """
+
+    return {name: rates['batched'] / max(rates['scalar'], 1e-9) for (name, rates) in throughput.items()}
+
+
+def runSuite(numChains=1000, seed=0, softDistance=1.0, repeat=3):
+    """
+    Runs the throughput checks on randomized chains.
+    See the `tests` directory for the accuracy and degenerate checks.
+
+    :type numChains: int
+    :type seed: int
+    :type softDistance: float
+    :type repeat: int
+    :rtype: Dict[str, Any]
+    """
+
+    chains = createRandomChains(numChains, seed=seed)
+    throughput = measureThroughput(chains, softDistance=softDistance, repeat=repeat)
+
+    return {
+        'numChains': numChains,
+        'seed': seed,
+        'hasMaya': HAS_MAYA,
+        'throughput': throughput,
+        'speedups': calculateSpeedups(throughput)
+    }
+
+
+def loadBaseline(filePath=BASELINE_PATH):
+    """
+    Returns the stored baseline results.
+    If no baseline exists then none is returned.
+
+    :type filePath: str
+    :rtype: Union[Dict[str, Any], None]
+    """
+
+    if not os.path.isfile(filePath):
+
+        return None
+
+    with open(filePath, 'r') as jsonFile:
+
+        return json.load(jsonFile)
+
+
+def saveBaseline(results, filePath=BASELINE_PATH):
+    """
+    Stores the relative speedups from the supplied results as the new baseline.
+    Absolute throughput is machine dependent and is therefore not stored!
+
+    :type results: Dict[str, Any]
+    :type filePath: str
+    :rtype: None
+    """
+
+    baseline = {key: results[key] for key in ('numChains', 'seed', 'hasMaya', 'speedups')}
+
+    with open(filePath, 'w') as jsonFile:
+
+        json.dump(baseline, jsonFile, indent=4, sort_keys=True)
+
+
+def compareBaseline(results, baseline, speedupTolerance=0.5):
+    """
+    Returns a list of regressions between the supplied results and baseline.
+    Batched speedups may not drop below the specified fraction of the baseline.
+    Baselines recorded against different scalar types, either Maya or the stand-ins, are skipped.
+
+    :type results: Dict[str, Any]
+    :type baseline: Dict[str, Any]
+    :type speedupTolerance: float
+    :rtype: List[str]
+    """
+
+    if results['hasMaya'] != baseline.get('hasMaya', False):
+
+        log.warning('Skipping baseline recorded with different scalar types!')
+        return []
+
+    regressions = []
+
+    for (name, speedup) in results['speedups'].items():
+
+        expected = baseline['speedups'].get(name, None)
+
+        if expected is not None and speedup < (expected * speedupTolerance):
+
+            regressions.append(f'{name} batched speedup dropped from {expected:.1f}x to {speedup:.1f}x!')
+
+    return regressions
+
+
+if __name__ == '__main__':
+
+    # Run suite and compare against baseline
+    #
+    results = runSuite()
+    baseline = loadBaseline()
+
+    for (name, rates) in results['throughput'].items():
+
+        log.info(f'{name}: {rates["scalar"]:.0f} scalar vs {rates["batched"]:.0f} batched chains/s ({results["speedups"][name]:.1f}x)')
+
+    if baseline is None:
+
+        saveBaseline(results)
+        log.info(f'Saved baseline to: {BASELINE_PATH}')
+
+    else:
+
+        regressions = compareBaseline(results, baseline)
+
+        for regression in regressions:
+
+            log.warning(regression)
+
+        log.info(f'{len(regressions)} regression(s) found.')
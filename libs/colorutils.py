@@ -0,0 +1,155 @@
+import numpy as np
+
+from . import profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+INDEX_PALETTE = np.array(
+    [
+        (0.627, 0.627, 0.627),  # Index 0 is reserved for the default colour!
+        (0.0, 0.0, 0.0),
+        (0.251, 0.251, 0.251),
+        (0.6, 0.6, 0.6),
+        (0.608, 0.0, 0.157),
+        (0.0, 0.016, 0.376),
+        (0.0, 0.0, 1.0),
+        (0.0, 0.275, 0.098),
+        (0.149, 0.0, 0.263),
+        (0.784, 0.0, 0.784),
+        (0.541, 0.282, 0.2),
+        (0.247, 0.137, 0.122),
+        (0.6, 0.149, 0.0),
+        (1.0, 0.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (0.0, 0.255, 0.6),
+        (1.0, 1.0, 1.0),
+        (1.0, 1.0, 0.0),
+        (0.392, 0.863, 1.0),
+        (0.263, 1.0, 0.639),
+        (1.0, 0.69, 0.69),
+        (0.894, 0.675, 0.475),
+        (1.0, 1.0, 0.388),
+        (0.0, 0.6, 0.329),
+        (0.631, 0.416, 0.188),
+        (0.624, 0.631, 0.188),
+        (0.408, 0.631, 0.188),
+        (0.188, 0.631, 0.365),
+        (0.188, 0.631, 0.631),
+        (0.188, 0.404, 0.631),
+        (0.435, 0.188, 0.631),
+        (0.631, 0.188, 0.412)
+    ],
+    dtype=float
+)  # Maya's default display palette indexed by `overrideColor`
+
+
+OBJECT_PALETTE_OFFSET = 24  # The 8 user-defined object colours default to the last 8 palette entries
+
+
+def rgbToXyz(colors):
+    """
+    Returns the CIE XYZ values, under a D65 white point, for the supplied (N, 3) sRGB colours.
+
+    :type colors: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    colors = np.clip(np.asarray(colors, dtype=float).reshape(-1, 3), 0.0, 1.0)
+    linearColors = np.where(colors <= 0.04045, colors / 12.92, ((colors + 0.055) / 1.055) ** 2.4)
+
+    matrix = np.array(
+        [
+            (0.4124564, 0.3575761, 0.1804375),
+            (0.2126729, 0.7151522, 0.0721750),
+            (0.0193339, 0.1191920, 0.9503041)
+        ]
+    )
+
+    return linearColors @ matrix.T
+
+
+def rgbToLab(colors):
+    """
+    Returns the CIE Lab values for the supplied (N, 3) sRGB colours.
+
+    :type colors: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    # Normalize by reference white
+    #
+    xyz = rgbToXyz(colors) / np.array([0.95047, 1.0, 1.08883])
+
+    epsilon, kappa = 216.0 / 24389.0, 24389.0 / 27.0
+    f = np.where(xyz > epsilon, np.cbrt(xyz), ((kappa * xyz) + 16.0) / 116.0)
+
+    # Compose Lab values
+    #
+    lab = np.empty_like(f)
+    lab[:, 0] = (116.0 * f[:, 1]) - 16.0
+    lab[:, 1] = 500.0 * (f[:, 0] - f[:, 1])
+    lab[:, 2] = 200.0 * (f[:, 1] - f[:, 2])
+
+    return lab
+
+
+INDEX_PALETTE_LAB = rgbToLab(INDEX_PALETTE)  # Precomputed for nearest-colour lookups
+
+
+@profileutils.profile
+def findNearestIndices(colors, start=1, stop=None):
+    """
+    Returns the nearest palette index for each of the supplied (N, 3) sRGB colours.
+    Distances are measured in Lab space and every colour is evaluated at once.
+    The start and stop indices can be used to limit the search to a slice of the palette.
+
+    :type colors: np.ndarray
+    :type start: int
+    :type stop: Union[int, None]
+    :rtype: np.ndarray
+    """
+
+    stop = len(INDEX_PALETTE_LAB) if stop is None else stop
+
+    lab = rgbToLab(colors)
+    distances = np.sum((lab[:, None, :] - INDEX_PALETTE_LAB[None, start:stop, :]) ** 2.0, axis=-1)
+
+    return np.argmin(distances, axis=-1) + start
+
+
+@profileutils.profile
+def findNearestObjectColors(colors):
+    """
+    Returns the nearest `objectColor` value, from 0 to 7, for each of the supplied (N, 3) sRGB colours.
+
+    :type colors: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    return findNearestIndices(colors, start=OBJECT_PALETTE_OFFSET) - OBJECT_PALETTE_OFFSET
+
+
+def getIndexColor(index):
+    """
+    Returns the sRGB colour for the specified palette index.
+
+    :type index: int
+    :rtype: Tuple[float, float, float]
+    """
+
+    return tuple(INDEX_PALETTE[index].tolist())
+
+
+def getObjectColor(index):
+    """
+    Returns the sRGB colour for the specified `objectColor` value.
+
+    :type index: int
+    :rtype: Tuple[float, float, float]
+    """
+
+    return getIndexColor(OBJECT_PALETTE_OFFSET + index)
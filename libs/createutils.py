@@ -1,8 +1,22 @@
-from maya.api import OpenMaya as om
-from mpy import mpyscene, mpynode
-from dcc.python import stringutils
-from dcc.maya.decorators import undo
-from . import kinematicutils
+import time
+import numpy as np
+
+try:
+
+    from maya.api import OpenMaya as om
+    from mpy import mpyscene, mpynode
+    from dcc.python import stringutils
+    from dcc.maya.libs import transformutils
+    from dcc.maya.decorators import undo
+
+except ImportError:
+
+    # Without Maya only the bulk operations can be evaluated, against an active `HeadlessScene`
+    #
+    from .standins import OpenMaya as om, transformutils, undo
+    mpyscene, mpynode, stringutils = None, None, None
+
+from . import kinematicutils, nameutils, bakeutils, profileutils, sceneutils
 
 import logging
 logging.basicConfig()
@@ -10,6 +24,96 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+def setTransformValues(dagModifier, node, matrix, skipScale=False, parentScale=None):
+    """
+    Queues the translate, rotate and scale values that reproduce the supplied local matrix onto the modifier.
+    The node's rotate order, rotate axis and pivots are honoured so the node lands on the supplied pose.
+    Joints also keep their joint orient, and any parent scale feeding their inverse scale is compensated for.
+    Returns the scale values that were queued, or the current scale values if scale was skipped.
+
+    :type dagModifier: om.MDagModifier
+    :type node: om.MObject
+    :type matrix: om.MMatrix
+    :type skipScale: bool
+    :type parentScale: Union[Tuple[float, float, float], None]
+    :rtype: Tuple[float, float, float]
+    """
+
+    fnNode = om.MFnDependencyNode(node)
+    isJoint = node.hasFn(om.MFn.kJoint)
+
+    def getValues(name):
+
+        return tuple(fnNode.findPlug(f'{name}{axis}', False).asDouble() for axis in 'XYZ')
+
+    # Evaluate the matrices surrounding the rotation
+    # Row-major matrices compose as `scale * rotateAxis * rotate * jointOrient * inverseScale`
+    #
+    rotateOrder = fnNode.findPlug('rotateOrder', False).asInt()
+    rotateAxisMatrix = om.MEulerRotation(*getValues('rotateAxis')).asMatrix()
+    jointOrientMatrix = om.MEulerRotation(*getValues('jointOrient')).asMatrix() if isJoint else om.MMatrix.kIdentity
+    inverseScaleMatrix = om.MMatrix.kIdentity
+
+    if isJoint and parentScale is not None and fnNode.findPlug('segmentScaleCompensate', False).asBool():
+
+        inverseScaleMatrix = createScaleMatrix([(1.0 / value) if value != 0.0 else 1.0 for value in parentScale])
+
+    # Decompose scale and rotation
+    #
+    linearMatrix = om.MMatrix(matrix)
+
+    for i in range(3):
+
+        linearMatrix.setElement(3, i, 0.0)
+
+    transformationMatrix = om.MTransformationMatrix(linearMatrix * inverseScaleMatrix.inverse())
+    scale = getValues('scale') if skipScale else tuple(transformationMatrix.scale(om.MSpace.kTransform))
+
+    rotationMatrix = transformationMatrix.rotation(asQuaternion=True).asMatrix()
+    eulerRotation = om.MTransformationMatrix(rotateAxisMatrix.inverse() * rotationMatrix * jointOrientMatrix.inverse()).rotation()
+    eulerRotation.reorderIt(rotateOrder)
+
+    # Solve translation
+    # Joints ignore pivots while transforms offset their translation by them!
+    #
+    translation = om.MVector(matrix.getElement(3, 0), matrix.getElement(3, 1), matrix.getElement(3, 2))
+
+    if not isJoint:
+
+        scalePivot, rotatePivot = om.MVector(getValues('scalePivot')), om.MVector(getValues('rotatePivot'))
+        scalePivotTranslate, rotatePivotTranslate = om.MVector(getValues('scalePivotTranslate')), om.MVector(getValues('rotatePivotTranslate'))
+
+        pivotMatrix = transformutils.createTranslateMatrix(-scalePivot) * createScaleMatrix(scale) * transformutils.createTranslateMatrix(scalePivot + scalePivotTranslate)
+        pivotMatrix *= transformutils.createTranslateMatrix(-rotatePivot) * rotateAxisMatrix * eulerRotation.asMatrix() * transformutils.createTranslateMatrix(rotatePivot + rotatePivotTranslate)
+
+        translation -= om.MVector(pivotMatrix.getElement(3, 0), pivotMatrix.getElement(3, 1), pivotMatrix.getElement(3, 2))
+
+    # Queue transform values
+    #
+    for (i, axis) in enumerate('XYZ'):
+
+        dagModifier.newPlugValueDouble(fnNode.findPlug(f'translate{axis}', False), translation[i])
+        dagModifier.newPlugValueDouble(fnNode.findPlug(f'rotate{axis}', False), eulerRotation[i])
+
+        if not skipScale:
+
+            dagModifier.newPlugValueDouble(fnNode.findPlug(f'scale{axis}', False), scale[i])
+
+    return scale
+
+
+def createScaleMatrix(scale):
+    """
+    Returns a scale matrix from the supplied scale values.
+
+    :type scale: Tuple[float, float, float]
+    :rtype: om.MMatrix
+    """
+
+    return om.MMatrix([(scale[0], 0.0, 0.0, 0.0), (0.0, scale[1], 0.0, 0.0), (0.0, 0.0, scale[2], 0.0), (0.0, 0.0, 0.0, 1.0)])
+
+
+@profileutils.profile
 @undo.Undo(name='Create Node')
 def createNode(typeName, **kwargs):
     """
@@ -27,9 +131,10 @@ def createNode(typeName, **kwargs):
     # Create node
     #
     scene = mpyscene.MPyScene()
+    nameIndex = nameutils.NameIndex.getInstance()
 
     name = stringutils.slugify(kwargs.get('name', ''))
-    uniqueName = name if (scene.isNameAvailable(name) and not stringutils.isNullOrEmpty(name)) else scene.makeNameUnique(f'{typeName}1')
+    uniqueName = name if (nameIndex.isNameAvailable(name) and not stringutils.isNullOrEmpty(name)) else nameIndex.makeNameUnique(f'{typeName}1')
 
     node = scene.createNode(typeName, name=uniqueName)
 
@@ -65,6 +170,7 @@ def createNode(typeName, **kwargs):
     return node
 
 
+@profileutils.profile
 @undo.Undo(name='Create Nodes from Selection')
 def createNodesFromSelection(typeName, selection, **kwargs):
     """
@@ -75,12 +181,20 @@ def createNodesFromSelection(typeName, selection, **kwargs):
     :key locator: bool
     :key helper: bool
     :key colorRGB = Tuple[float, float, float]
+    :key batch: bool
     :rtype: mpynode.MPyNode
     """
 
+    # Check if batch mode was requested
+    #
+    if kwargs.get('batch', False):
+
+        return batchCreateNodesFromSelection(typeName, selection, **kwargs)
+
     # Iterate through selection
     #
     scene = mpyscene.MPyScene()
+    nameIndex = nameutils.NameIndex.getInstance()
 
     locator = kwargs.get('locator', False)
     helper = kwargs.get('helper', False)
@@ -101,7 +215,7 @@ def createNodesFromSelection(typeName, selection, **kwargs):
 
         # Create node and copy transform
         #
-        name = scene.makeNameUnique(selectedNode.name())
+        name = nameIndex.makeNameUnique(selectedNode.name())
         skipScale = typeName == 'joint'
 
         node = scene.createNode(typeName, name=name)
@@ -130,13 +244,155 @@ def createNodesFromSelection(typeName, selection, **kwargs):
     return nodes
 
 
+def createHeadlessNodes(scene, typeName, sources, matrices, shapeType=None, colorRGB=None, skipScale=False):
+    """
+    Returns nodes, derived from the supplied sources, created inside a headless scene.
+    This is the headless equivalent of the modifier used by `batchCreateNodesFromSelection`.
+
+    :type scene: headlessutils.HeadlessScene
+    :type typeName: str
+    :type sources: List[headlessutils.HeadlessNode]
+    :type matrices: List[np.ndarray]
+    :type shapeType: Union[str, None]
+    :type colorRGB: Union[Tuple[float, float, float], None]
+    :type skipScale: bool
+    :rtype: List[headlessutils.HeadlessNode]
+    """
+
+    # Create nodes and copy transforms
+    #
+    indices = scene.createNodes(typeName, names=[source.name() for source in sources])
+    numNodes = len(indices)
+
+    if numNodes == 0:
+
+        return []
+
+    scene.setMatrices(indices, np.array(matrices), skipScale=skipScale)
+
+    # Check if shapes are required
+    #
+    if shapeType is not None:
+
+        shapes = scene.createNodes(shapeType, names=[f'{scene.node(index).name()}Shape' for index in indices.tolist()], parents=indices)
+
+        if colorRGB is not None:
+
+            scene.setPlugValues(shapes, 'useObjectColor', np.full(numNodes, 2))
+            scene.setPlugValues(shapes, 'wireColorRGB', np.tile(colorRGB, (numNodes, 1)))
+
+    return [scene.node(index) for index in indices.tolist()]
+
+
+@profileutils.profile
+@undo.Undo(name='Create Nodes from Selection')
+def batchCreateNodesFromSelection(typeName, selection, **kwargs):
+    """
+    Returns a sequence of nodes derived from the active selection.
+    Unlike `createNodesFromSelection`, every node, shape and transform value is created through a single dag modifier.
+    All source world matrices are read up front in one pass.
+
+    :type typeName: str
+    :type selection: List[mpynode.MPyNode]
+    :key locator: bool
+    :key helper: bool
+    :key colorRGB = Tuple[float, float, float]
+    :rtype: List[mpynode.MPyNode]
+    """
+
+    # Collect valid transforms
+    #
+    scene = sceneutils.getScene()
+    startTime = time.perf_counter()
+
+    sources = [node for node in selection if node.hasFn(om.MFn.kTransform) and not node.hasFn(om.MFn.kConstraint, om.MFn.kPluginConstraintNode)]
+    matrices = [node.worldMatrix() for node in sources]
+
+    # Evaluate shape properties
+    #
+    locator = kwargs.get('locator', False)
+    helper = kwargs.get('helper', False)
+    colorRGB = kwargs.get('colorRGB', None)
+
+    shapeType = 'locator' if locator else 'pointHelper' if helper else None
+    skipScale = typeName == 'joint'
+
+    # Check if scene is headless
+    #
+    if sceneutils.isHeadless(scene):
+
+        nodes = createHeadlessNodes(scene, typeName, sources, matrices, shapeType=shapeType, colorRGB=colorRGB, skipScale=skipScale)
+        scene.setSelection(nodes, replace=True)
+
+        return nodes
+
+    # Iterate through sources
+    # The name index reserves each name since the modifier has yet to be executed!
+    #
+    nameIndex = nameutils.NameIndex.getInstance()
+
+    with nameIndex.reserve():
+
+        dagModifier = om.MDagModifier()
+        objects = []
+
+        for (source, matrix) in zip(sources, matrices):
+
+            # Create node
+            #
+            name = nameIndex.makeNameUnique(source.name())
+            obj = dagModifier.createNode(typeName)
+            dagModifier.renameNode(obj, name)
+
+            objects.append(obj)
+
+            # Queue transform values
+            #
+            setTransformValues(dagModifier, obj, matrix, skipScale=skipScale)
+
+            # Check if shape is required
+            #
+            if shapeType is None:
+
+                continue
+
+            shape = dagModifier.createNode(shapeType, obj)
+            dagModifier.renameNode(shape, f'{name}Shape')
+
+            if colorRGB is not None:
+
+                fnShape = om.MFnDependencyNode(shape)
+                dagModifier.newPlugValueInt(fnShape.findPlug('useObjectColor', False), 2)
+
+                for (i, channel) in enumerate('RGB'):
+
+                    dagModifier.newPlugValueFloat(fnShape.findPlug(f'wireColor{channel}', False), colorRGB[i])
+
+        # Execute modifier
+        #
+        dagModifier.doIt()
+        undo.commit(dagModifier.undoIt, dagModifier.doIt)
+
+    # Update active selection
+    #
+    nodes = [mpynode.MPyNode(obj) for obj in objects]
+    scene.setSelection(nodes, replace=True)
+
+    elapsed = time.perf_counter() - startTime
+    log.info(f'Created {len(nodes)} nodes in {elapsed:.3f}s')
+
+    return nodes
+
+
+@profileutils.profile
 @undo.Undo(name='Add IK-Solver')
-def addIKSolver(startJoint, endJoint):
+def addIKSolver(startJoint, endJoint, jointIndex=None):
     """
     Adds an IK solver to the supplied start and end joints.
 
     :type startJoint: mpynode.MPyNode
     :type endJoint: mpynode.MPyNode
+    :type jointIndex: Union[kinematicutils.JointIndex, None]
     :rtype: None
     """
 
@@ -148,20 +404,15 @@ def addIKSolver(startJoint, endJoint):
 
     # Evaluate hierarchy
     #
-    ancestors = endJoint.ancestors(apiType=om.MFn.kJoint)
+    numJoints = kinematicutils.getChainLength(startJoint, endJoint, jointIndex=jointIndex)
 
-    if startJoint not in ancestors:
+    if numJoints == 0:
 
         log.warning(f'Cannot trace hierarchy between {startJoint} and {endJoint}')
         return
 
     # Evaluate which solver to apply
     #
-    index = ancestors.index(startJoint)
-
-    joints = ancestors[index:] + [endJoint]
-    numJoints = len(joints)
-
     if numJoints == 2:
 
         kinematicutils.applySingleChainSolver(startJoint, endJoint)
@@ -175,18 +426,95 @@ def addIKSolver(startJoint, endJoint):
         kinematicutils.applySpringSolver(startJoint, endJoint)
 
 
+@profileutils.profile
+@undo.Undo(name='Add IK-Solvers')
+def addIKSolvers(pairs, solver=None, jointIndex=None):
+    """
+    Adds IK solvers to the supplied start and end joint pairs.
+    All hierarchies are validated up front before any nodes are created.
+    If no solver is supplied then one is derived from the number of joints in each chain.
+
+    :type pairs: List[Tuple[mpynode.MPyNode, mpynode.MPyNode]]
+    :type solver: Union[kinematicutils.IkSolver, None]
+    :type jointIndex: Union[kinematicutils.JointIndex, None]
+    :rtype: List[Tuple[mpynode.MPyNode, mpynode.MPyNode]]
+    """
+
+    # Iterate through pairs
+    #
+    startTime = time.perf_counter()
+    chains = []
+
+    for (startJoint, endJoint) in pairs:
+
+        # Evaluate supplied nodes
+        #
+        if not (startJoint.hasFn(om.MFn.kJoint) and endJoint.hasFn(om.MFn.kJoint)):
+
+            log.warning(f'Skipping non-joint pair: {startJoint} and {endJoint}')
+            continue
+
+        # Evaluate hierarchy
+        #
+        numJoints = kinematicutils.getChainLength(startJoint, endJoint, jointIndex=jointIndex)
+
+        if numJoints == 0:
+
+            log.warning(f'Cannot trace hierarchy between {startJoint} and {endJoint}')
+            continue
+
+        # Evaluate which solver to apply
+        #
+        if solver is not None:
+
+            chains.append((startJoint, endJoint, solver))
+
+        elif numJoints == 2:
+
+            chains.append((startJoint, endJoint, kinematicutils.IkSolver.SINGLE_CHAIN))
+
+        elif numJoints == 3:
+
+            chains.append((startJoint, endJoint, kinematicutils.IkSolver.ROTATION_PLANE))
+
+        else:
+
+            chains.append((startJoint, endJoint, kinematicutils.IkSolver.SPRING))
+
+    # Apply solvers in bulk
+    #
+    handles = kinematicutils.applySolvers(chains, jointIndex=jointIndex)
+
+    elapsed = time.perf_counter() - startTime
+    numHandles = len(handles)
+    throughput = (numHandles / elapsed) if (elapsed > 0.0) else 0.0
+
+    log.info(f'Created {numHandles} IK-handles in {elapsed:.3f}s ({throughput:.1f} handles/s)')
+
+    return handles
+
+
+@profileutils.profile
 @undo.Undo(name='Create Intermediate')
-def createIntermediate(*nodes):
+def createIntermediate(*nodes, batch=False):
     """
     Returns an intermediate parent to the supplied node.
 
     :type nodes: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
+    :type batch: bool
     :rtype: mpynode.MPyNode
     """
 
+    # Check if batch mode was requested
+    #
+    if batch:
+
+        return batchCreateIntermediates(*nodes)
+
     # Iterate through nodes
     #
     scene = mpyscene.MPyScene()
+    nameIndex = nameutils.NameIndex.getInstance()
     intermediates = []
 
     for node in nodes:
@@ -202,7 +530,7 @@ def createIntermediate(*nodes):
         ancestor = node.parent()
         typeName = node.typeName
 
-        parent = scene.createNode(typeName, name='group1', parent=ancestor)
+        parent = scene.createNode(typeName, name=nameIndex.makeNameUnique('group1'), parent=ancestor)
         parent.copyTransform(node, skipScale=True)
 
         # Re-parent node
@@ -214,3 +542,186 @@ def createIntermediate(*nodes):
         intermediates.append(parent)
 
     return intermediates
+
+
+def createHeadlessIntermediates(scene, *nodes):
+    """
+    Returns intermediate parents, created inside a headless scene, to the supplied nodes.
+    This is the headless equivalent of the modifier used by `batchCreateIntermediates`.
+    Every group is created, transformed and re-parented in a single vectorized pass.
+
+    :type scene: headlessutils.HeadlessScene
+    :type nodes: Union[headlessutils.HeadlessNode, List[headlessutils.HeadlessNode]]
+    :rtype: List[headlessutils.HeadlessNode]
+    """
+
+    # Collect unique transforms
+    #
+    indices = np.array(sorted({node.index for node in nodes if node.hasFn(om.MFn.kTransform)}), dtype=int)
+    numNodes = len(indices)
+
+    if numNodes == 0:
+
+        return []
+
+    # Snapshot world matrices
+    # Inserting a group never changes the world matrix of its child so the snapshot remains valid for any descendants!
+    #
+    worldMatrices = scene.worldMatrices()
+    nodeMatrices = worldMatrices[indices]
+
+    parents = np.array([parent.index if parent is not None else -1 for parent in (scene.node(index).parent() for index in indices.tolist())], dtype=int)
+    parentMatrices = np.where((parents >= 0)[:, None, None], worldMatrices[parents], np.eye(4))
+
+    # Create groups
+    # Group matrices exclude scale to match `copyTransform(skipScale=True)`
+    #
+    groups = scene.createNodes([scene.node(index).typeName for index in indices.tolist()], names=['group1'] * numNodes, parents=parents)
+
+    scales = np.linalg.norm(nodeMatrices[:, :3, :3], axis=-1, keepdims=True)
+
+    groupMatrices = nodeMatrices.copy()
+    groupMatrices[:, :3, :3] /= np.where(scales > 0.0, scales, 1.0)
+
+    scene.setMatrices(groups, np.matmul(groupMatrices, np.linalg.inv(parentMatrices)))
+
+    # Re-parent nodes
+    # The local matrix is whatever remains of the world matrix, which is typically just scale
+    #
+    scene.reparentNodes(indices, groups)
+    scene.setMatrices(indices, np.matmul(nodeMatrices, np.linalg.inv(groupMatrices)))
+
+    return [scene.node(group) for group in groups.tolist()]
+
+
+@profileutils.profile
+@undo.Undo(name='Create Intermediates')
+def batchCreateIntermediates(*nodes):
+    """
+    Returns intermediate parents to the supplied nodes.
+    Unlike `createIntermediate`, every group is created and re-parented through a single dag modifier.
+    Nodes are processed by dag depth and all transforms are derived from a single snapshot of world matrices.
+    Since inserting a group never changes the world matrix of its child, the snapshot remains valid for any descendants!
+
+    :type nodes: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
+    :rtype: List[mpynode.MPyNode]
+    """
+
+    # Check if scene is headless
+    #
+    scene = sceneutils.getScene()
+    startTime = time.perf_counter()
+
+    if sceneutils.isHeadless(scene):
+
+        return createHeadlessIntermediates(scene, *nodes)
+
+    # Collect unique transforms
+    #
+    nameIndex = nameutils.NameIndex.getInstance()
+    dagPaths = {}
+
+    for node in nodes:
+
+        if not node.hasFn(om.MFn.kTransform):
+
+            continue
+
+        dagPath = bakeutils.getDagPath(node)
+        dagPaths.setdefault(om.MObjectHandle(dagPath.node()).hashCode(), dagPath)
+
+    # Snapshot world matrices
+    # Be sure to sort by depth so parents are always processed before their descendants!
+    #
+    dagPaths = list(dagPaths.values())
+    order = sorted(range(len(dagPaths)), key=lambda i: dagPaths[i].length())
+
+    worldMatrices = [dagPath.inclusiveMatrix() for dagPath in dagPaths]
+    parentMatrices = [dagPath.exclusiveMatrix() for dagPath in dagPaths]
+
+    # Iterate through nodes
+    #
+    with nameIndex.reserve():
+
+        dagModifier = om.MDagModifier()
+        identityMatrix = om.MFnMatrixData().create(om.MMatrix.kIdentity)
+        groups = [None] * len(dagPaths)
+        scales = {}  # Queued scales keyed by node hash code, these feed the inverse scale of any joints below them
+
+        for i in order:
+
+            # Create parent node
+            # Group matrices exclude scale to match `copyTransform(skipScale=True)`
+            #
+            dagPath, worldMatrix, parentMatrix = dagPaths[i], worldMatrices[i], parentMatrices[i]
+
+            obj = dagPath.node()
+            fnNode = om.MFnDagNode(dagPath)
+            parentObj = fnNode.parent(0) if fnNode.parentCount() > 0 else om.MObject.kNullObj
+
+            if parentObj.hasFn(om.MFn.kWorld):
+
+                parentObj = om.MObject.kNullObj
+
+            group = dagModifier.createNode(fnNode.typeName, parentObj)
+            dagModifier.renameNode(group, nameIndex.makeNameUnique('group1'))
+
+            groups[i] = group
+            fnGroup = om.MFnDependencyNode(group)
+
+            # Check if the group's inverse scale requires connecting
+            #
+            isJoint = obj.hasFn(om.MFn.kJoint)
+            parentScale = None
+
+            if isJoint and not parentObj.isNull() and parentObj.hasFn(om.MFn.kJoint):
+
+                fnParent = om.MFnDependencyNode(parentObj)
+                parentScale = scales.get(om.MObjectHandle(parentObj).hashCode(), None)
+
+                if parentScale is None:
+
+                    parentScale = tuple(fnParent.findPlug(f'scale{axis}', False).asDouble() for axis in 'XYZ')
+
+                dagModifier.connect(fnParent.findPlug('scale', False), fnGroup.findPlug('inverseScale', False))
+
+            transformationMatrix = om.MTransformationMatrix(worldMatrix)
+            transformationMatrix.setScale((1.0, 1.0, 1.0), om.MSpace.kTransform)
+            groupMatrix = transformationMatrix.asMatrix()
+
+            setTransformValues(dagModifier, group, groupMatrix * parentMatrix.inverse(), skipScale=True, parentScale=parentScale)
+
+            # Re-parent node
+            # The local matrix is whatever remains of the world matrix, which is typically just scale
+            #
+            dagModifier.reparentNode(obj, group)
+            dagModifier.newPlugValue(fnNode.findPlug('offsetParentMatrix', False), identityMatrix)
+
+            # Check if the node's inverse scale requires reconnecting
+            # Joint groups are created without scale so there is nothing to compensate for!
+            #
+            if isJoint:
+
+                inverseScalePlug = fnNode.findPlug('inverseScale', False)
+                source = inverseScalePlug.source()
+
+                if not source.isNull:
+
+                    dagModifier.disconnect(source, inverseScalePlug)
+
+                dagModifier.connect(fnGroup.findPlug('scale', False), inverseScalePlug)
+
+            scales[om.MObjectHandle(obj).hashCode()] = setTransformValues(dagModifier, obj, worldMatrix * groupMatrix.inverse(), parentScale=(1.0, 1.0, 1.0) if isJoint else None)
+
+        # Execute modifier
+        #
+        dagModifier.doIt()
+        undo.commit(dagModifier.undoIt, dagModifier.doIt)
+
+    intermediates = [mpynode.MPyNode(group) for group in groups]
+
+    elapsed = time.perf_counter() - startTime
+    log.info(f'Created {len(intermediates)} intermediates in {elapsed:.3f}s')
+
+    return intermediates
+
@@ -0,0 +1,1267 @@
+import re
+import numpy as np
+
+from enum import IntEnum
+from . import hierarchyutils, colorutils, sceneutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class HeadlessFn(IntEnum):
+    """
+    Enum class of the function sets supported by the headless scene.
+    These mirror the `om.MFn` constants that rigomatic evaluates through `hasFn`.
+    """
+
+    kDependencyNode = 0
+    kDagNode = 1
+    kTransform = 2
+    kJoint = 3
+    kShape = 4
+    kLocator = 5
+    kPluginLocatorNode = 6
+    kCurve = 7
+    kNurbsCurve = 8
+    kMesh = 9
+    kSurface = 10
+    kConstraint = 11
+    kPluginConstraintNode = 12
+    kIkHandle = 13
+
+
+def getApiTypes():
+    """
+    Returns a dictionary of headless function sets keyed by their `om.MFn` constants.
+    This allows rigomatic's `hasFn` queries to be evaluated against headless nodes.
+    If Maya is unavailable then the stand-in constants are used instead.
+
+    :rtype: Dict[int, HeadlessFn]
+    """
+
+    try:
+
+        from maya.api import OpenMaya as om
+
+    except ImportError:
+
+        from .standins import OpenMaya as om
+
+    return {getattr(om.MFn, functionSet.name): functionSet for functionSet in HeadlessFn}
+
+
+API_TYPES = getApiTypes()
+
+
+NODE_TYPES = {
+    'network': {HeadlessFn.kDependencyNode},
+    'transform': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kTransform},
+    'joint': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kTransform, HeadlessFn.kJoint},
+    'ikHandle': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kTransform, HeadlessFn.kIkHandle},
+    'parentConstraint': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kTransform, HeadlessFn.kConstraint},
+    'locator': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kShape, HeadlessFn.kLocator},
+    'pointHelper': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kShape, HeadlessFn.kLocator, HeadlessFn.kPluginLocatorNode},
+    'nurbsCurve': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kShape, HeadlessFn.kCurve, HeadlessFn.kNurbsCurve},
+    'mesh': {HeadlessFn.kDependencyNode, HeadlessFn.kDagNode, HeadlessFn.kShape, HeadlessFn.kMesh, HeadlessFn.kSurface}
+}
+
+
+COLOR_PLUGS = {
+    'useObjectColor': ('_useObjectColors', int),
+    'objectColor': ('_objectColors', int),
+    'wireColorRGB': ('_wireColors', tuple),
+    'overrideEnabled': ('_overrideEnabled', bool),
+    'overrideRGBColors': ('_overrideRGBColors', bool),
+    'overrideColor': ('_overrideColors', int),
+    'overrideColorRGB': ('_overrideColorRGBs', tuple)
+}
+
+
+__suffix__ = re.compile(r'^(.*?)(\d*)$')
+
+
+class HeadlessNode(object):
+    """
+    Overload of the `MPyNode` interface that wraps a node inside a `HeadlessScene`.
+    Instances are lightweight handles so any number of wrappers can reference the same node.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_scene', '_index')
+
+    def __init__(self, scene, index):
+        """
+        Private method called after a new instance has been created.
+
+        :type scene: HeadlessScene
+        :type index: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(HeadlessNode, self).__init__()
+
+        # Declare private variables
+        #
+        self._scene = scene
+        self._index = index
+
+    def __eq__(self, other):
+        """
+        Private method that evaluates if the supplied object references the same node.
+
+        :type other: HeadlessNode
+        :rtype: bool
+        """
+
+        return isinstance(other, HeadlessNode) and other._scene is self._scene and other._index == self._index
+
+    def __hash__(self):
+        """
+        Private method that returns a hashable representation of this node.
+
+        :rtype: int
+        """
+
+        return hash((id(self._scene), self._index))
+
+    def __repr__(self):
+        """
+        Private method that returns a string representation of this node.
+
+        :rtype: str
+        """
+
+        return f'<{self.typeName}:{self.name()} @ {self._index}>'
+
+    def __getattr__(self, name):
+        """
+        Private method that provides property access to the color plugs.
+
+        :type name: str
+        :rtype: Any
+        """
+
+        if name in COLOR_PLUGS:
+
+            return self.getAttr(name)
+
+        raise AttributeError(f'__getattr__() cannot locate attribute: {name}')
+
+    def __setattr__(self, name, value):
+        """
+        Private method that provides property access to the color plugs.
+
+        :type name: str
+        :type value: Any
+        :rtype: None
+        """
+
+        if name in COLOR_PLUGS:
+
+            self.setAttr(name, value)
+
+        else:
+
+            super(HeadlessNode, self).__setattr__(name, value)
+    # endregion
+
+    # region Properties
+    @property
+    def scene(self):
+        """
+        Getter method that returns the associated scene.
+
+        :rtype: HeadlessScene
+        """
+
+        return self._scene
+
+    @property
+    def index(self):
+        """
+        Getter method that returns the index of this node.
+
+        :rtype: int
+        """
+
+        return self._index
+
+    @property
+    def typeName(self):
+        """
+        Getter method that returns the type name of this node.
+
+        :rtype: str
+        """
+
+        return self._scene._typeNames[self._index]
+
+    @property
+    def apiTypeStr(self):
+        """
+        Getter method that returns the api type name of this node.
+
+        :rtype: str
+        """
+
+        return f'k{self.typeName[0].upper()}{self.typeName[1:]}'
+
+    @property
+    def isFromReferencedFile(self):
+        """
+        Getter method that evaluates if this node is referenced.
+
+        :rtype: bool
+        """
+
+        return False
+    # endregion
+
+    # region Methods
+    def object(self):
+        """
+        Returns the index of this node.
+        This stands in for the `om.MObject` returned by `MPyNode.object`.
+
+        :rtype: int
+        """
+
+        return self._index
+
+    def isValid(self):
+        """
+        Evaluates if this node still exists.
+
+        :rtype: bool
+        """
+
+        return self._scene.isAlive(self._index)
+
+    def hasFn(self, *functionSets):
+        """
+        Evaluates if this node is compatible with any of the supplied function sets.
+        Both headless function sets and `om.MFn` constants are accepted.
+
+        :type functionSets: Union[HeadlessFn, int, List[Union[HeadlessFn, int]]]
+        :rtype: bool
+        """
+
+        nodeType = NODE_TYPES[self.typeName]
+
+        return any((functionSet if isinstance(functionSet, HeadlessFn) else API_TYPES.get(functionSet, None)) in nodeType for functionSet in functionSets)
+
+    def name(self):
+        """
+        Returns the name of this node, including its namespace.
+
+        :rtype: str
+        """
+
+        namespace = self._scene._namespaces[self._index]
+        name = self._scene._names[self._index]
+
+        return f'{namespace}:{name}' if namespace else name
+
+    def setName(self, name):
+        """
+        Updates the name of this node.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._scene.renameNode(self._index, name)
+
+    def namespace(self):
+        """
+        Returns the namespace of this node.
+
+        :rtype: str
+        """
+
+        return self._scene._namespaces[self._index]
+
+    def setNamespace(self, namespace):
+        """
+        Updates the namespace of this node.
+
+        :type namespace: str
+        :rtype: None
+        """
+
+        name = self._scene._names[self._index]
+        namespace = namespace.strip(':')
+
+        self._scene.renameNode(self._index, f'{namespace}:{name}' if namespace else name)
+
+    def select(self, replace=True):
+        """
+        Selects this node.
+
+        :type replace: bool
+        :rtype: None
+        """
+
+        self._scene.setSelection([self], replace=replace)
+
+    def parent(self):
+        """
+        Returns the parent of this node.
+
+        :rtype: Union[HeadlessNode, None]
+        """
+
+        parent = int(self._scene._parents[self._index])
+        return self._scene.node(parent) if parent >= 0 else None
+
+    def setParent(self, parent):
+        """
+        Updates the parent of this node.
+        Like Maya, the world matrix is preserved by compensating the local matrix.
+
+        :type parent: Union[HeadlessNode, None]
+        :rtype: None
+        """
+
+        worldMatrix = self.worldMatrix()
+
+        self._scene.reparentNode(self._index, parent.index if parent is not None else -1)
+        self.setWorldMatrix(worldMatrix)
+
+    def children(self):
+        """
+        Returns the children of this node.
+
+        :rtype: List[HeadlessNode]
+        """
+
+        return [self._scene.node(index) for index in self._scene.childIndices(self._index)]
+
+    def shapes(self):
+        """
+        Returns the shapes below this transform.
+
+        :rtype: List[HeadlessNode]
+        """
+
+        return [child for child in self.children() if child.hasFn(HeadlessFn.kShape)]
+
+    def iterShapes(self):
+        """
+        Returns a generator that yields the shapes below this transform.
+
+        :rtype: Iterator[HeadlessNode]
+        """
+
+        return iter(self.shapes())
+
+    def ancestors(self):
+        """
+        Returns the ancestors of this node, starting with the parent.
+
+        :rtype: List[HeadlessNode]
+        """
+
+        return [self._scene.node(index) for index in self._scene.ancestorIndices(self._index)]
+
+    def descendants(self):
+        """
+        Returns the descendants of this node in depth-first order.
+
+        :rtype: List[HeadlessNode]
+        """
+
+        descendants = []
+        queue = list(reversed(self._scene.childIndices(self._index)))
+
+        while len(queue) > 0:
+
+            index = queue.pop()
+            descendants.append(self._scene.node(index))
+            queue.extend(reversed(self._scene.childIndices(index)))
+
+        return descendants
+
+    def matrix(self):
+        """
+        Returns the local matrix of this node.
+
+        :rtype: np.ndarray
+        """
+
+        return self._scene._matrices[self._index].copy()
+
+    localMatrix = matrix
+
+    def setMatrix(self, matrix, skipScale=False):
+        """
+        Updates the local matrix of this node.
+
+        :type matrix: np.ndarray
+        :type skipScale: bool
+        :rtype: None
+        """
+
+        self._scene.setMatrices([self._index], np.asarray(matrix, dtype=float).reshape(1, 4, 4), skipScale=skipScale)
+
+    setLocalMatrix = setMatrix
+
+    def resetMatrix(self):
+        """
+        Resets the local matrix of this node.
+
+        :rtype: None
+        """
+
+        self.setMatrix(np.eye(4))
+
+    def worldMatrix(self):
+        """
+        Returns the world matrix of this node.
+
+        :rtype: np.ndarray
+        """
+
+        return self._scene.worldMatrices()[self._index].copy()
+
+    def parentMatrix(self):
+        """
+        Returns the world matrix of this node's parent.
+
+        :rtype: np.ndarray
+        """
+
+        parent = int(self._scene._parents[self._index])
+        return self._scene.worldMatrices()[parent].copy() if parent >= 0 else np.eye(4)
+
+    def setWorldMatrix(self, worldMatrix, skipScale=False):
+        """
+        Updates the world matrix of this node.
+
+        :type worldMatrix: np.ndarray
+        :type skipScale: bool
+        :rtype: None
+        """
+
+        self.setMatrix(np.asarray(worldMatrix, dtype=float) @ np.linalg.inv(self.parentMatrix()), skipScale=skipScale)
+
+    def translation(self, space=None):
+        """
+        Returns the translation of this node.
+        Any space other than none returns the world translation.
+
+        :type space: Any
+        :rtype: np.ndarray
+        """
+
+        matrix = self.matrix() if space is None else self.worldMatrix()
+        return matrix[3, :3].copy()
+
+    def copyTransform(self, node, skipScale=False):
+        """
+        Copies the world matrix from the supplied node.
+
+        :type node: HeadlessNode
+        :type skipScale: bool
+        :rtype: None
+        """
+
+        self.setWorldMatrix(node.worldMatrix(), skipScale=skipScale)
+
+    def getAttr(self, name):
+        """
+        Returns the value of the specified plug.
+
+        :type name: str
+        :rtype: Any
+        """
+
+        return self._scene.getPlugValue(self._index, name)
+
+    def setAttr(self, name, value):
+        """
+        Updates the value of the specified plug.
+
+        :type name: str
+        :type value: Any
+        :rtype: None
+        """
+
+        self._scene.setPlugValues([self._index], name, [value])
+
+    def hasAttr(self, name):
+        """
+        Evaluates if this node has the specified plug.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        return name in COLOR_PLUGS or name in self._scene._userAttributes.get(self._index, {})
+
+    def dormantColor(self):
+        """
+        Returns the colour this node is drawn with when it is not selected.
+
+        :rtype: Tuple[float, float, float]
+        """
+
+        return self._scene.dormantColors([self._index])[0]
+
+    def controlPoints(self):
+        """
+        Returns the control points from this shape.
+
+        :rtype: np.ndarray
+        """
+
+        return self._scene._controlPoints.get(self._index, np.zeros((0, 3))).copy()
+
+    def setControlPoints(self, points):
+        """
+        Updates the control points on this shape.
+
+        :type points: np.ndarray
+        :rtype: None
+        """
+
+        self._scene._controlPoints[self._index] = np.asarray(points, dtype=float).reshape(-1, 3).copy()
+
+    def addShape(self, typeName, controlPoints=None, colorRGB=None):
+        """
+        Adds a shape, of the specified type, below this transform.
+
+        :type typeName: str
+        :type controlPoints: Union[np.ndarray, None]
+        :type colorRGB: Union[Tuple[float, float, float], None]
+        :rtype: HeadlessNode
+        """
+
+        shape = self._scene.createNode(typeName, name=f'{self._scene._names[self._index]}Shape', parent=self)
+
+        if controlPoints is not None:
+
+            shape.setControlPoints(controlPoints)
+
+        if colorRGB is not None:
+
+            shape.useObjectColor = 2
+            shape.wireColorRGB = colorRGB
+
+        return shape
+
+    def addLocator(self, colorRGB=None):
+        """
+        Adds a locator shape below this transform.
+
+        :type colorRGB: Union[Tuple[float, float, float], None]
+        :rtype: HeadlessNode
+        """
+
+        return self.addShape('locator', colorRGB=colorRGB)
+
+    def addPointHelper(self, colorRGB=None):
+        """
+        Adds a point helper shape below this transform.
+
+        :type colorRGB: Union[Tuple[float, float, float], None]
+        :rtype: HeadlessNode
+        """
+
+        return self.addShape('pointHelper', colorRGB=colorRGB)
+    # endregion
+
+
+class HeadlessScene(object):
+    """
+    Overload of the `MPyScene` interface that stores an entire scene in memory.
+    Node data is stored in flat arrays, indexed by node, so bulk operations can be vectorized.
+    While used as a context manager, the bulk operations in createutils, modifyutils and nameutils act on this scene instead of Maya.
+    """
+
+    # region Dunderscores
+    isHeadless = True
+
+    def __init__(self, capacity=1024):
+        """
+        Private method called after a new instance has been created.
+
+        :type capacity: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(HeadlessScene, self).__init__()
+
+        # Declare private variables
+        #
+        self._size = 0
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._parents = np.full(capacity, -1, dtype=int)
+        self._matrices = np.tile(np.eye(4), (capacity, 1, 1))
+        self._worldMatrices = None
+        self._hierarchy = None
+
+        self._useObjectColors = np.zeros(capacity, dtype=int)
+        self._objectColors = np.zeros(capacity, dtype=int)
+        self._wireColors = np.zeros((capacity, 3), dtype=float)
+        self._overrideEnabled = np.zeros(capacity, dtype=bool)
+        self._overrideRGBColors = np.zeros(capacity, dtype=bool)
+        self._overrideColors = np.zeros(capacity, dtype=int)
+        self._overrideColorRGBs = np.zeros((capacity, 3), dtype=float)
+
+        self._typeNames = []
+        self._names = []
+        self._namespaces = []
+        self._nameLookup = {}
+        self._suffixes = {}
+        self._controlPoints = {}
+        self._userAttributes = {}
+        self._selection = []
+        self._previousScene = None
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of nodes in this scene.
+
+        :rtype: int
+        """
+
+        return int(np.count_nonzero(self._alive[:self._size]))
+
+    def __call__(self, name):
+        """
+        Private method that returns the node with the specified name.
+
+        :type name: str
+        :rtype: HeadlessNode
+        """
+
+        return self.getNodeByName(name)
+
+    def __enter__(self):
+        """
+        Private method that activates this scene.
+
+        :rtype: HeadlessScene
+        """
+
+        self._previousScene = sceneutils.__scene__
+        sceneutils.setScene(self)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that restores the previously active scene.
+
+        :type exc_type: Union[Type[Exception], None]
+        :type exc_val: Union[Exception, None]
+        :type exc_tb: Union[traceback, None]
+        :rtype: None
+        """
+
+        sceneutils.setScene(self._previousScene)
+        self._previousScene = None
+    # endregion
+
+    # region Properties
+    @property
+    def size(self):
+        """
+        Getter method that returns the number of allocated nodes, including deleted nodes.
+
+        :rtype: int
+        """
+
+        return self._size
+    # endregion
+
+    # region Methods
+    def reserve(self, capacity):
+        """
+        Grows the node arrays to fit the specified capacity.
+
+        :type capacity: int
+        :rtype: None
+        """
+
+        currentCapacity = len(self._alive)
+
+        if capacity <= currentCapacity:
+
+            return
+
+        capacity = max(capacity, currentCapacity * 2)
+        extra = capacity - currentCapacity
+
+        self._alive = np.concatenate([self._alive, np.zeros(extra, dtype=bool)])
+        self._parents = np.concatenate([self._parents, np.full(extra, -1, dtype=int)])
+        self._matrices = np.concatenate([self._matrices, np.tile(np.eye(4), (extra, 1, 1))])
+
+        self._useObjectColors = np.concatenate([self._useObjectColors, np.zeros(extra, dtype=int)])
+        self._objectColors = np.concatenate([self._objectColors, np.zeros(extra, dtype=int)])
+        self._wireColors = np.concatenate([self._wireColors, np.zeros((extra, 3), dtype=float)])
+        self._overrideEnabled = np.concatenate([self._overrideEnabled, np.zeros(extra, dtype=bool)])
+        self._overrideRGBColors = np.concatenate([self._overrideRGBColors, np.zeros(extra, dtype=bool)])
+        self._overrideColors = np.concatenate([self._overrideColors, np.zeros(extra, dtype=int)])
+        self._overrideColorRGBs = np.concatenate([self._overrideColorRGBs, np.zeros((extra, 3), dtype=float)])
+
+    def invalidate(self):
+        """
+        Invalidates the cached world matrices and hierarchy.
+
+        :rtype: None
+        """
+
+        self._worldMatrices = None
+        self._hierarchy = None
+
+    def node(self, index):
+        """
+        Returns a node wrapper for the specified index.
+
+        :type index: int
+        :rtype: HeadlessNode
+        """
+
+        return HeadlessNode(self, int(index))
+
+    def isAlive(self, index):
+        """
+        Evaluates if the specified node still exists.
+
+        :type index: int
+        :rtype: bool
+        """
+
+        return 0 <= index < self._size and bool(self._alive[index])
+
+    def isNameAvailable(self, name):
+        """
+        Evaluates if the supplied name is not in use.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        return name not in self._nameLookup
+
+    def makeNameUnique(self, name):
+        """
+        Returns a unique name derived from the supplied name.
+
+        :type name: str
+        :rtype: str
+        """
+
+        if self.isNameAvailable(name):
+
+            return name
+
+        baseName, suffix = __suffix__.match(name).groups()
+        suffix = max(self._suffixes.get(baseName, 0), int(suffix) if suffix else 0) + 1
+
+        return f'{baseName}{suffix}'
+
+    def registerName(self, index, name):
+        """
+        Registers the supplied name with the specified node.
+
+        :type index: int
+        :type name: str
+        :rtype: None
+        """
+
+        self._nameLookup[name] = index
+
+        baseName, suffix = __suffix__.match(name).groups()
+        self._suffixes[baseName] = max(self._suffixes.get(baseName, 0), int(suffix) if suffix else 0)
+
+    def getNodeByName(self, name):
+        """
+        Returns the node with the specified name.
+
+        :type name: str
+        :rtype: HeadlessNode
+        """
+
+        index = self._nameLookup.get(name, None)
+
+        if index is None:
+
+            raise TypeError(f'getNodeByName() cannot locate node: {name}')
+
+        return self.node(index)
+
+    def createNodes(self, typeNames, names=None, parents=None):
+        """
+        Creates multiple nodes at once and returns their indices.
+        Parents must be supplied as indices and can reference nodes created in the same call.
+
+        :type typeNames: Union[str, List[str]]
+        :type names: Union[List[str], None]
+        :type parents: Union[np.ndarray, List[int], None]
+        :rtype: np.ndarray
+        """
+
+        # Allocate node arrays
+        #
+        count = len(names) if names is not None else len(parents) if parents is not None else len(typeNames)
+        typeNames = [typeNames] * count if isinstance(typeNames, str) else list(typeNames)
+
+        startIndex = self._size
+        indices = np.arange(startIndex, startIndex + count)
+
+        self.reserve(startIndex + count)
+        self._size += count
+        self._alive[indices] = True
+        self._parents[indices] = -1 if parents is None else np.asarray(parents, dtype=int)
+
+        # Register names
+        #
+        names = [f'{typeName}1' for typeName in typeNames] if names is None else names
+
+        for (index, typeName, name) in zip(indices.tolist(), typeNames, names):
+
+            if typeName not in NODE_TYPES:
+
+                raise TypeError(f'createNodes() expects a supported type ({typeName} given)!')
+
+            namespace, sep, shortName = name.rpartition(':')
+            uniqueName = self.makeNameUnique(name)
+
+            self._typeNames.append(typeName)
+            self._namespaces.append(namespace.strip(':'))
+            self._names.append(uniqueName.rpartition(':')[2])
+
+            self.registerName(index, uniqueName)
+
+        self.invalidate()
+
+        return indices
+
+    def createNode(self, typeName, name='', parent=None):
+        """
+        Returns a new node derived from the specified type.
+
+        :type typeName: str
+        :type name: str
+        :type parent: Union[HeadlessNode, None]
+        :rtype: HeadlessNode
+        """
+
+        name = name if name else f'{typeName}1'
+        parent = parent.index if parent is not None else -1
+
+        return self.node(self.createNodes([typeName], names=[name], parents=[parent])[0])
+
+    def deleteNode(self, node):
+        """
+        Deletes the supplied node along with its descendants.
+
+        :type node: HeadlessNode
+        :rtype: None
+        """
+
+        for descendant in [node] + node.descendants():
+
+            self._alive[descendant.index] = False
+            self._nameLookup.pop(descendant.name(), None)
+            self._controlPoints.pop(descendant.index, None)
+
+        self._selection = [selected for selected in self._selection if self.isAlive(selected)]
+        self.invalidate()
+
+    def renameNode(self, index, name):
+        """
+        Renames the specified node.
+        Name clashes are resolved by incrementing the numeric suffix.
+
+        :type index: int
+        :type name: str
+        :rtype: str
+        """
+
+        self._nameLookup.pop(self.node(index).name(), None)
+
+        uniqueName = self.makeNameUnique(name)
+        namespace, sep, shortName = uniqueName.rpartition(':')
+
+        self._namespaces[index] = namespace.strip(':')
+        self._names[index] = shortName
+
+        self.registerName(index, uniqueName)
+
+        return uniqueName
+
+    def reparentNode(self, index, parent):
+        """
+        Re-parents the specified node.
+
+        :type index: int
+        :type parent: int
+        :rtype: None
+        """
+
+        if parent >= 0 and (parent == index or index in self.ancestorIndices(parent)):
+
+            raise TypeError(f'reparentNode() cannot parent a node under itself!')
+
+        self._parents[index] = parent
+        self.invalidate()
+
+    def reparentNodes(self, indices, parents):
+        """
+        Re-parents multiple nodes at once.
+        Like `om.MDagModifier.reparentNode`, the local matrices are preserved.
+
+        :type indices: Union[np.ndarray, List[int]]
+        :type parents: Union[np.ndarray, List[int]]
+        :rtype: None
+        """
+
+        self._parents[np.asarray(indices, dtype=int)] = np.asarray(parents, dtype=int)
+        self.invalidate()
+
+    def childIndices(self, index):
+        """
+        Returns the indices of the children below the specified node.
+
+        :type index: int
+        :rtype: List[int]
+        """
+
+        size = self._size
+        return np.flatnonzero((self._parents[:size] == index) & self._alive[:size]).tolist()
+
+    def ancestorIndices(self, index):
+        """
+        Returns the indices of the ancestors above the specified node.
+
+        :type index: int
+        :rtype: List[int]
+        """
+
+        ancestors = []
+        parent = int(self._parents[index])
+
+        while parent >= 0:
+
+            ancestors.append(parent)
+            parent = int(self._parents[parent])
+
+        return ancestors
+
+    def hierarchy(self):
+        """
+        Returns the hierarchy index for this scene.
+
+        :rtype: hierarchyutils.HierarchyIndex
+        """
+
+        if self._hierarchy is None:
+
+            self._hierarchy = hierarchyutils.HierarchyIndex(self._parents[:self._size])
+
+        return self._hierarchy
+
+    def setMatrices(self, indices, matrices, skipScale=False):
+        """
+        Updates the local matrices for the specified nodes.
+
+        :type indices: Union[np.ndarray, List[int]]
+        :type matrices: np.ndarray
+        :type skipScale: bool
+        :rtype: None
+        """
+
+        matrices = np.array(matrices, dtype=float).reshape(-1, 4, 4)
+
+        if skipScale:
+
+            lengths = np.linalg.norm(matrices[:, :3, :3], axis=-1, keepdims=True)
+            matrices[:, :3, :3] /= np.where(lengths > 0.0, lengths, 1.0)
+
+        self._matrices[np.asarray(indices, dtype=int)] = matrices
+        self._worldMatrices = None
+
+    def worldMatrices(self):
+        """
+        Returns the world matrices for every node.
+        Matrices are evaluated one depth level at a time so each level is a single batched product.
+
+        :rtype: np.ndarray
+        """
+
+        if self._worldMatrices is not None:
+
+            return self._worldMatrices
+
+        hierarchy = self.hierarchy()
+        depths = hierarchy.depths
+
+        worldMatrices = self._matrices[:self._size].copy()
+
+        for depth in range(1, int(depths.max(initial=0)) + 1):
+
+            indices = np.flatnonzero(depths == depth)
+            worldMatrices[indices] = np.matmul(worldMatrices[indices], worldMatrices[self._parents[indices]])
+
+        self._worldMatrices = worldMatrices
+
+        return worldMatrices
+
+    def getPlugValue(self, index, name):
+        """
+        Returns the value of the specified plug.
+
+        :type index: int
+        :type name: str
+        :rtype: Any
+        """
+
+        attribute = COLOR_PLUGS.get(name, None)
+
+        if attribute is None:
+
+            return self._userAttributes.get(index, {})[name]
+
+        arrayName, valueType = attribute
+        value = getattr(self, arrayName)[index]
+
+        return tuple(value.tolist()) if valueType is tuple else valueType(value)
+
+    def setPlugValues(self, indices, name, values):
+        """
+        Updates the specified plug on multiple nodes at once.
+
+        :type indices: Union[np.ndarray, List[int]]
+        :type name: str
+        :type values: Union[np.ndarray, List[Any]]
+        :rtype: None
+        """
+
+        attribute = COLOR_PLUGS.get(name, None)
+
+        if attribute is None:
+
+            for (index, value) in zip(indices, values):
+
+                self._userAttributes.setdefault(int(index), {})[name] = value
+
+            return
+
+        arrayName, valueType = attribute
+        getattr(self, arrayName)[np.asarray(indices, dtype=int)] = np.asarray(values)
+
+    def dormantColors(self, indices):
+        """
+        Returns the colours the specified nodes are drawn with when they are not selected.
+        This resolves drawing overrides, wire colours and object colours in order of precedence.
+
+        :type indices: Union[np.ndarray, List[int]]
+        :rtype: np.ndarray
+        """
+
+        indices = np.asarray(indices, dtype=int)
+
+        colors = np.tile(colorutils.INDEX_PALETTE[0], (len(indices), 1))
+
+        isObjectColor = self._useObjectColors[indices] == 1
+        colors[isObjectColor] = colorutils.INDEX_PALETTE[colorutils.OBJECT_PALETTE_OFFSET + self._objectColors[indices[isObjectColor]]]
+
+        isWireColor = self._useObjectColors[indices] == 2
+        colors[isWireColor] = self._wireColors[indices[isWireColor]]
+
+        isOverrideIndex = self._overrideEnabled[indices] & ~self._overrideRGBColors[indices] & (self._overrideColors[indices] > 0)
+        colors[isOverrideIndex] = colorutils.INDEX_PALETTE[self._overrideColors[indices[isOverrideIndex]]]
+
+        isOverrideRGB = self._overrideEnabled[indices] & self._overrideRGBColors[indices]
+        colors[isOverrideRGB] = self._overrideColorRGBs[indices[isOverrideRGB]]
+
+        return colors
+
+    def iterNodes(self):
+        """
+        Returns a generator that yields every node in this scene.
+
+        :rtype: Iterator[HeadlessNode]
+        """
+
+        for index in np.flatnonzero(self._alive[:self._size]).tolist():
+
+            yield self.node(index)
+
+    def iterNodesByTypeName(self, *typeNames):
+        """
+        Returns a generator that yields nodes of the specified types.
+
+        :type typeNames: Union[str, List[str]]
+        :rtype: Iterator[HeadlessNode]
+        """
+
+        for node in self.iterNodes():
+
+            if node.typeName in typeNames:
+
+                yield node
+
+    def iterNodesByApiType(self, *functionSets):
+        """
+        Returns a generator that yields nodes compatible with the specified function sets.
+
+        :type functionSets: Union[HeadlessFn, List[HeadlessFn]]
+        :rtype: Iterator[HeadlessNode]
+        """
+
+        for node in self.iterNodes():
+
+            if node.hasFn(*functionSets):
+
+                yield node
+
+    def selection(self, apiType=None):
+        """
+        Returns the active selection.
+
+        :type apiType: Union[HeadlessFn, None]
+        :rtype: List[HeadlessNode]
+        """
+
+        nodes = [self.node(index) for index in self._selection]
+        return nodes if apiType is None else [node for node in nodes if node.hasFn(apiType)]
+
+    def setSelection(self, nodes, replace=True):
+        """
+        Updates the active selection.
+
+        :type nodes: List[HeadlessNode]
+        :type replace: bool
+        :rtype: None
+        """
+
+        indices = [node.index for node in nodes]
+
+        if replace:
+
+            self._selection = indices
+
+        else:
+
+            self._selection.extend([index for index in indices if index not in self._selection])
+
+    def clearSelection(self):
+        """
+        Clears the active selection.
+
+        :rtype: None
+        """
+
+        self._selection = []
+    # endregion
+
+
+def createRigFixture(numNodes, numChains=None, numJoints=4, shapeRatio=0.25, numControlPoints=8, seed=0):
+    """
+    Returns a headless scene populated with a synthetic rig of roughly the specified size.
+    The rig consists of joint chains, parented below a root, with a fraction of the joints driven by curve controls.
+    Every node is created in a handful of batched calls so fixtures of 100k nodes build in seconds.
+
+    :type numNodes: int
+    :type numChains: Union[int, None]
+    :type numJoints: int
+    :type shapeRatio: float
+    :type numControlPoints: int
+    :type seed: int
+    :rtype: HeadlessScene
+    """
+
+    # Evaluate rig layout
+    # Each control consists of a transform and a shape
+    #
+    generator = np.random.default_rng(seed)
+
+    numJointsTotal = max(numJoints, int(numNodes / (1.0 + (2.0 * shapeRatio))))
+    numChains = max(1, numJointsTotal // numJoints) if numChains is None else numChains
+    numJointsTotal = numChains * numJoints
+    numControls = int(numJointsTotal * shapeRatio)
+
+    scene = HeadlessScene(capacity=1 + numJointsTotal + (numControls * 2))
+    root = scene.createNode('transform', name='root')
+
+    # Create joint chains
+    # Chains branch off random joints from previous chains to create a deep hierarchy
+    #
+    jointIndices = np.arange(numJointsTotal).reshape(numChains, numJoints) + root.index + 1
+    parents = np.empty((numChains, numJoints), dtype=int)
+    parents[:, 1:] = jointIndices[:, :-1]
+    parents[:, 0] = root.index
+
+    if numChains > 1:
+
+        branchChains = generator.integers(0, np.arange(1, numChains))
+        branchJoints = generator.integers(0, numJoints, size=numChains - 1)
+        parents[1:, 0] = jointIndices[branchChains, branchJoints]
+
+    names = [f'joint_{chain}_{joint}' for chain in range(numChains) for joint in range(numJoints)]
+    joints = scene.createNodes('joint', names=names, parents=parents.reshape(-1))
+
+    matrices = np.tile(np.eye(4), (numJointsTotal, 1, 1))
+    matrices[:, 3, 0] = generator.uniform(1.0, 10.0, size=numJointsTotal)
+    matrices[:, 3, 1:3] = generator.normal(scale=0.5, size=(numJointsTotal, 2))
+    scene.setMatrices(joints, matrices)
+
+    # Create controls
+    #
+    drivenJoints = np.sort(generator.choice(joints, size=numControls, replace=False))
+    controls = scene.createNodes('transform', names=[f'{scene._names[joint]}_CTRL' for joint in drivenJoints.tolist()], parents=drivenJoints)
+
+    shapes = scene.createNodes('nurbsCurve', names=[f'{scene._names[control]}Shape' for control in controls.tolist()], parents=controls)
+
+    angles = np.linspace(0.0, 2.0 * np.pi, num=numControlPoints, endpoint=False)
+    circle = np.stack([np.zeros_like(angles), np.cos(angles), np.sin(angles)], axis=-1) * 2.0
+
+    for shape in shapes.tolist():
+
+        scene._controlPoints[shape] = circle.copy()
+
+    # Colour controls
+    #
+    scene.setPlugValues(shapes, 'overrideEnabled', np.ones(numControls, dtype=bool))
+    scene.setPlugValues(shapes, 'overrideColor', generator.choice([6, 13, 17], size=numControls))
+
+    return scene
+
+
+def createSkeletonFixture(numJoints, maxChildren=3, seed=0):
+    """
+    Returns a headless scene populated with a random skeleton, such as a mocap import.
+
+    :type numJoints: int
+    :type maxChildren: int
+    :type seed: int
+    :rtype: HeadlessScene
+    """
+
+    # Assign random parents from a sliding window to bound the branching factor
+    #
+    generator = np.random.default_rng(seed)
+
+    indices = np.arange(numJoints)
+    parents = np.full(numJoints, -1, dtype=int)
+    parents[1:] = np.maximum(0, indices[1:] - generator.integers(1, maxChildren + 1, size=numJoints - 1))
+
+    scene = HeadlessScene(capacity=numJoints)
+    joints = scene.createNodes('joint', names=[f'joint{i + 1}' for i in range(numJoints)], parents=parents)
+
+    matrices = np.tile(np.eye(4), (numJoints, 1, 1))
+    matrices[1:, 3, :3] = generator.normal(scale=5.0, size=(numJoints - 1, 3))
+    scene.setMatrices(joints, matrices)
+
+    return scene
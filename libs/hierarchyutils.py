@@ -0,0 +1,299 @@
+import numpy as np
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class HierarchyIndex(object):
+    """
+    Base class used to query a hierarchy through parent-index arrays.
+    Euler-tour intervals provide O(1) ancestor tests while binary lifting provides O(log n) lowest-common-ancestor lookups.
+    """
+
+    # region Dunderscores
+    def __init__(self, parents):
+        """
+        Private method called after a new instance has been created.
+        Roots are denoted by a parent index of -1.
+
+        :type parents: Union[np.ndarray, List[int]]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(HierarchyIndex, self).__init__()
+
+        # Declare private variables
+        #
+        self._parents = np.asarray(parents, dtype=int).reshape(-1)
+        self._depths = np.zeros(self.size, dtype=int)
+        self._entries = np.zeros(self.size, dtype=int)
+        self._exits = np.zeros(self.size, dtype=int)
+        self._order = np.zeros(self.size, dtype=int)
+        self._ancestors = np.zeros((1, self.size), dtype=int)
+
+        # Build lookup tables
+        #
+        self.build()
+
+    def __len__(self):
+        """
+        Private method that evaluates the size of this index.
+
+        :rtype: int
+        """
+
+        return self.size
+    # endregion
+
+    # region Properties
+    @property
+    def size(self):
+        """
+        Getter method that returns the number of items in this index.
+
+        :rtype: int
+        """
+
+        return len(self._parents)
+
+    @property
+    def parents(self):
+        """
+        Getter method that returns the parent indices.
+
+        :rtype: np.ndarray
+        """
+
+        return self._parents
+
+    @property
+    def depths(self):
+        """
+        Getter method that returns the depth of each item.
+
+        :rtype: np.ndarray
+        """
+
+        return self._depths
+
+    @property
+    def order(self):
+        """
+        Getter method that returns the items in depth-first order.
+
+        :rtype: np.ndarray
+        """
+
+        return self._order
+    # endregion
+
+    # region Methods
+    def build(self):
+        """
+        Rebuilds the depth, Euler-tour and ancestor tables from the parent indices.
+
+        :rtype: None
+        """
+
+        # Group children by parent
+        #
+        size = self.size
+        sortedIndices = np.argsort(self._parents, kind='stable')
+        sortedParents = self._parents[sortedIndices]
+
+        starts = np.searchsorted(sortedParents, np.arange(-1, size), side='left')
+        stops = np.searchsorted(sortedParents, np.arange(-1, size), side='right')
+
+        # Walk hierarchy depth-first
+        # Children are pushed in reverse in order to preserve their original order!
+        #
+        counter = 0
+        order = []
+        stack = [(int(index), 0, False) for index in reversed(sortedIndices[starts[0]:stops[0]])]
+
+        while len(stack) > 0:
+
+            index, depth, isExiting = stack.pop()
+
+            if isExiting:
+
+                self._exits[index] = counter
+                counter += 1
+                continue
+
+            self._depths[index] = depth
+            self._entries[index] = counter
+            counter += 1
+
+            order.append(index)
+            stack.append((index, depth, True))
+            stack.extend([(int(child), depth + 1, False) for child in reversed(sortedIndices[starts[index + 1]:stops[index + 1]])])
+
+        if len(order) != size:
+
+            raise TypeError(f'build() expects an acyclic hierarchy ({size - len(order)} unreachable items)!')
+
+        self._order = np.array(order, dtype=int)
+
+        # Build binary lifting table
+        # Roots point to themselves so lifting saturates at the top of each hierarchy
+        #
+        numLevels = max(1, int(self._depths.max(initial=0)).bit_length())
+        ancestors = np.empty((numLevels, size), dtype=int)
+        ancestors[0] = np.where(self._parents >= 0, self._parents, np.arange(size))
+
+        for level in range(1, numLevels):
+
+            ancestors[level] = ancestors[level - 1][ancestors[level - 1]]
+
+        self._ancestors = ancestors
+
+    def isAncestor(self, ancestor, descendant, inclusive=False):
+        """
+        Evaluates if the first item is an ancestor of the second item.
+
+        :type ancestor: int
+        :type descendant: int
+        :type inclusive: bool
+        :rtype: bool
+        """
+
+        if ancestor == descendant:
+
+            return inclusive
+
+        return bool(self._entries[ancestor] < self._entries[descendant] and self._exits[descendant] < self._exits[ancestor])
+
+    def areAncestors(self, ancestors, descendants):
+        """
+        Evaluates if the supplied items are proper ancestors of their paired descendants.
+
+        :type ancestors: np.ndarray
+        :type descendants: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        ancestors, descendants = np.asarray(ancestors, dtype=int), np.asarray(descendants, dtype=int)
+
+        return (self._entries[ancestors] < self._entries[descendants]) & (self._exits[descendants] < self._exits[ancestors])
+
+    def liftAncestor(self, index, distance):
+        """
+        Returns the ancestor the specified number of levels above the supplied item.
+
+        :type index: int
+        :type distance: int
+        :rtype: int
+        """
+
+        level = 0
+
+        while distance > 0 and level < len(self._ancestors):
+
+            if distance & 1:
+
+                index = int(self._ancestors[level, index])
+
+            distance >>= 1
+            level += 1
+
+        return index
+
+    def lowestCommonAncestor(self, first, second):
+        """
+        Returns the lowest common ancestor between the supplied items.
+        If the items belong to different hierarchies then -1 is returned.
+
+        :type first: int
+        :type second: int
+        :rtype: int
+        """
+
+        # Check for trivial cases
+        #
+        if self.isAncestor(first, second, inclusive=True):
+
+            return first
+
+        elif self.isAncestor(second, first, inclusive=True):
+
+            return second
+
+        # Lift first item until its parent is an ancestor of the second item
+        #
+        for level in range(len(self._ancestors) - 1, -1, -1):
+
+            ancestor = int(self._ancestors[level, first])
+
+            if not self.isAncestor(ancestor, second, inclusive=True):
+
+                first = ancestor
+
+        parent = int(self._parents[first])
+
+        return parent if (parent >= 0 and self.isAncestor(parent, second, inclusive=True)) else -1
+
+    def ancestors(self, index):
+        """
+        Returns the ancestors of the supplied item, starting with the parent.
+
+        :type index: int
+        :rtype: List[int]
+        """
+
+        ancestors = []
+        parent = int(self._parents[index])
+
+        while parent >= 0:
+
+            ancestors.append(parent)
+            parent = int(self._parents[parent])
+
+        return ancestors
+
+    def inbetweens(self, start, end, includeStart=False, includeEnd=False):
+        """
+        Returns the items between the supplied start and end items, ordered from start to end.
+        If the start item is not an ancestor of the end item then an empty list is returned.
+
+        :type start: int
+        :type end: int
+        :type includeStart: bool
+        :type includeEnd: bool
+        :rtype: List[int]
+        """
+
+        # Check if start is an ancestor of end
+        #
+        if not self.isAncestor(start, end):
+
+            return []
+
+        # Collect parents from end to start
+        #
+        distance = int(self._depths[end] - self._depths[start])
+        path = np.empty(distance + 1, dtype=int)
+
+        index = end
+
+        for i in range(distance, -1, -1):
+
+            path[i] = index
+            index = int(self._parents[index])
+
+        indices = path.tolist()
+
+        if not includeStart:
+
+            del indices[0]
+
+        if not includeEnd:
+
+            del indices[-1]
+
+        return indices
+    # endregion
@@ -1,9 +1,25 @@
 import math
+import numpy as np
 
-from maya.api import OpenMaya as om
-from mpy import mpyscene, mpynode
 from enum import IntEnum
-from dcc.maya.libs import transformutils
+from itertools import chain
+from collections import defaultdict
+
+try:
+
+    from maya.api import OpenMaya as om
+    from mpy import mpyscene, mpynode
+    from dcc.maya.libs import transformutils
+    from dcc.maya.decorators import undo
+
+except ImportError:
+
+    # Without Maya only the scalar kinematics can be evaluated, against the stand-in types
+    #
+    from .standins import OpenMaya as om, transformutils, undo
+    mpyscene, mpynode = None, None
+
+from . import solverutils, bakeutils, hierarchyutils, templateutils, profileutils
 
 import logging
 logging.basicConfig()
@@ -25,69 +41,427 @@ class IkSolver(IntEnum):
 
 
 
-def getIkSolver(solver):
+IK_SOLVER_TYPES = {
+    IkSolver.SINGLE_CHAIN: 'ikSCsolver',
+    IkSolver.ROTATION_PLANE: 'ikRPsolver',
+    IkSolver.SPLINE: 'ikSplineSolver',
+    IkSolver.SPRING: 'ikSpringSolver'
+}
+
+
+__ik_solvers__ = {}  # Cache of MObjectHandles keyed by IkSolver
+
+
+SPRING_ATTRIBUTES = templateutils.AttributeTemplate(
+    {
+        'longName': 'springRestPose',
+        'shortName': 'srp',
+        'attributeType': 'long',
+        'default': 1,
+        'cachedInternally': True,
+        'hidden': True
+    },
+    {
+        'longName': 'springRestPoleVector',
+        'shortName': 'srpv',
+        'attributeType': 'double3',
+        'cachedInternally': True,
+        'hidden': True,
+        'children': [
+            {
+                'longName': 'springRestPoleVectorX',
+                'shortName': 'srpvx',
+                'attributeType': 'float',
+                'cachedInternally': True,
+                'hidden': True
+            },
+            {
+                'longName': 'springRestPoleVectorY',
+                'shortName': 'srpvy',
+                'attributeType': 'float',
+                'cachedInternally': True,
+                'hidden': True
+            },
+            {
+                'longName': 'springRestPoleVectorZ',
+                'shortName': 'srpvz',
+                'attributeType': 'float',
+                'cachedInternally': True,
+                'hidden': True
+            }
+        ]
+    },
+    {
+        'longName': 'springAngleBias',
+        'shortName': 'sab',
+        'attributeType': 'compound',
+        'cachedInternally': True,
+        'multi': True,
+        'children': [
+            {
+                'longName': 'springAngleBias_Position',
+                'shortName': 'sbp',
+                'attributeType': 'float',
+                'cachedInternally': True
+            },
+            {
+                'longName': 'springAngleBias_FloatValue',
+                'shortName': 'sbfv',
+                'attributeType': 'float',
+                'default': 1.0,
+                'cachedInternally': True
+            },
+            {
+                'longName': 'springAngleBias_Interp',
+                'shortName': 'sbi',
+                'attributeType': 'enum',
+                'min': 0,
+                'max': 3,
+                'default': 3,
+                'fields': 'None:Linear:Smooth:Spline',
+                'cachedInternally': True
+            }
+        ]
+    }
+)  # Compiled on first use
+
+
+def onJointHierarchyChanged(*args, **kwargs):
     """
-    Returns the IK solver associated with the given enum.
+    Callback method for any joint hierarchy changes.
 
-    :type solver: IkSolver
-    :rtype: pynode.PyNode
+    :rtype: None
     """
 
-    # Query enum type
-    #
-    scene = mpyscene.MPyScene()
+    JointIndex.invalidate()
 
-    if solver == IkSolver.SINGLE_CHAIN:
 
-        # Check if solver already exists
-        #
-        if scene.doesNodeExist('ikSCsolver'):
+class JointIndex(hierarchyutils.HierarchyIndex):
+    """
+    Overload of `HierarchyIndex` that indexes every joint in the scene from a single dag walk.
+    The shared instance is invalidated whenever joints are added, removed or re-parented.
+    """
 
-            return scene.getNodeByName('ikSCsolver')
+    # region Dunderscores
+    __instance__ = None
+    __callbacks__ = om.MCallbackIdArray()
 
-        else:
+    def __init__(self, handles, parents):
+        """
+        Private method called after a new instance has been created.
 
-            return scene.createNode('ikSCsolver', name='ikSCsolver')
+        :type handles: List[om.MObjectHandle]
+        :type parents: List[int]
+        :rtype: None
+        """
 
-    elif solver == IkSolver.ROTATION_PLANE:
+        # Call parent method
+        #
+        super(JointIndex, self).__init__(parents)
 
-        # Check if solver already exists
+        # Declare private variables
         #
-        if scene.doesNodeExist('ikRPsolver'):
+        self._handles = handles
+        self._indices = {handle.hashCode(): i for (i, handle) in enumerate(handles)}
+    # endregion
 
-            return scene.getNodeByName('ikRPsolver')
+    # region Methods
+    @classmethod
+    def create(cls):
+        """
+        Returns a new index derived from the joints in the scene.
 
-        else:
+        :rtype: JointIndex
+        """
 
-            return scene.createNode('ikRPsolver', name='ikRPsolver')
+        # Walk dag depth-first
+        # This guarantees that parent joints are always indexed before their children!
+        #
+        handles = []
+        parents = []
+        indices = {}
 
-    elif solver == IkSolver.SPLINE:
+        iterDag = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kJoint)
 
-        # Check if solver already exists
-        #
-        if scene.doesNodeExist('ikSplineSolver'):
+        while not iterDag.isDone():
 
-            return scene.getNodeByName('ikSplineSolver')
+            # Check if joint has already been indexed
+            # This can happen with instanced hierarchies
+            #
+            dagPath = iterDag.getPath()
+            handle = om.MObjectHandle(dagPath.node())
+            hashCode = handle.hashCode()
 
-        else:
+            if hashCode in indices:
 
-            return scene.createNode('ikSplineSolver', name='ikSplineSolver')
+                iterDag.next()
+                continue
 
-    elif solver == IkSolver.SPRING:
+            # Find nearest joint ancestor
+            #
+            parent = -1
 
-        # Check if solver already exists
+            while dagPath.length() > 1:
+
+                dagPath.pop()
+
+                if dagPath.node().hasFn(om.MFn.kJoint):
+
+                    parent = indices.get(om.MObjectHandle(dagPath.node()).hashCode(), -1)
+                    break
+
+            indices[hashCode] = len(handles)
+            handles.append(handle)
+            parents.append(parent)
+
+            iterDag.next()
+
+        return cls(handles, parents)
+
+    @classmethod
+    def getInstance(cls):
+        """
+        Returns the shared index, rebuilding it if it was invalidated.
+        The index is only shared while its callbacks are registered, otherwise a new index is returned every time.
+
+        :rtype: JointIndex
+        """
+
+        # Check if callbacks exist
         #
-        if scene.doesNodeExist('ikSpringSolver'):
+        if not cls.hasCallbacks():
 
-            return scene.getNodeByName('ikSpringSolver')
+            return cls.create()
 
-        else:
+        # Check if index requires rebuilding
+        #
+        if cls.__instance__ is None:
+
+            cls.__instance__ = cls.create()
+
+        return cls.__instance__
+
+    @classmethod
+    def hasCallbacks(cls):
+        """
+        Evaluates if the callbacks that keep the shared index current are registered.
+
+        :rtype: bool
+        """
+
+        return len(cls.__callbacks__) > 0
+
+    @classmethod
+    def addCallbacks(cls):
+        """
+        Registers the callbacks that keep the shared index current.
+
+        :rtype: None
+        """
+
+        if cls.hasCallbacks():
 
-            return scene.createNode('ikSpringSolver', name='ikSpringSolver')
+            return
+
+        cls.__callbacks__.append(om.MDagMessage.addParentAddedCallback(onJointHierarchyChanged))
+        cls.__callbacks__.append(om.MDagMessage.addParentRemovedCallback(onJointHierarchyChanged))
+        cls.__callbacks__.append(om.MDGMessage.addNodeAddedCallback(onJointHierarchyChanged, 'joint'))
+        cls.__callbacks__.append(om.MDGMessage.addNodeRemovedCallback(onJointHierarchyChanged, 'joint'))
+
+    @classmethod
+    def removeCallbacks(cls):
+        """
+        Removes the callbacks that keep the shared index current and invalidates the index.
+
+        :rtype: None
+        """
+
+        if cls.hasCallbacks():
+
+            om.MMessage.removeCallbacks(cls.__callbacks__)
+            cls.__callbacks__.clear()
+
+        cls.invalidate()
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Invalidates the shared index.
+
+        :rtype: None
+        """
+
+        cls.__instance__ = None
+
+    def indexOf(self, node):
+        """
+        Returns the index of the supplied joint.
+        If the joint is not indexed then -1 is returned.
+
+        :type node: Union[om.MObject, mpynode.MPyNode]
+        :rtype: int
+        """
+
+        node = node if isinstance(node, om.MObject) else node.object()
+        return self._indices.get(om.MObjectHandle(node).hashCode(), -1)
+
+    def node(self, index):
+        """
+        Returns the joint at the specified index.
+
+        :type index: int
+        :rtype: mpynode.MPyNode
+        """
+
+        return mpynode.MPyNode(self._handles[index].object())
+
+    def isAncestorOf(self, startJoint, endJoint):
+        """
+        Evaluates if the start joint is an ancestor of the end joint.
+
+        :type startJoint: mpynode.MPyNode
+        :type endJoint: mpynode.MPyNode
+        :rtype: bool
+        """
+
+        start, end = self.indexOf(startJoint), self.indexOf(endJoint)
+
+        return start >= 0 and end >= 0 and self.isAncestor(start, end)
+
+    def chainLength(self, startJoint, endJoint):
+        """
+        Returns the number of joints from the start joint to the end joint, inclusive.
+        If the start joint is not an ancestor of the end joint then 0 is returned.
+
+        :type startJoint: mpynode.MPyNode
+        :type endJoint: mpynode.MPyNode
+        :rtype: int
+        """
+
+        if not self.isAncestorOf(startJoint, endJoint):
+
+            return 0
+
+        start, end = self.indexOf(startJoint), self.indexOf(endJoint)
+        return int(self.depths[end] - self.depths[start]) + 1
+
+    def iterInbetweenJoints(self, startJoint, endJoint, includeStart=False, includeEnd=False):
+        """
+        Returns a generator that yields inbetween joints.
+
+        :type startJoint: mpynode.MPyNode
+        :type endJoint: mpynode.MPyNode
+        :type includeStart: bool
+        :type includeEnd: bool
+        :rtype: Iterator[mpynode.MPyNode]
+        """
+
+        start, end = self.indexOf(startJoint), self.indexOf(endJoint)
+
+        if start < 0 or end < 0:
+
+            return
+
+        for index in self.inbetweens(start, end, includeStart=includeStart, includeEnd=includeEnd):
+
+            yield self.node(index)
+    # endregion
+
+
+def clearIkSolvers():
+    """
+    Clears the IK solver cache.
+    This should be called whenever the scene changes!
+
+    :rtype: None
+    """
+
+    __ik_solvers__.clear()
+
+
+def findIkSolver(solver):
+    """
+    Returns the existing IK solver associated with the given enum.
+    Solvers are found by type so renamed or namespaced solvers are still located.
+
+    :type solver: IkSolver
+    :rtype: Union[om.MObject, None]
+    """
+
+    typeName = IK_SOLVER_TYPES.get(solver, None)
+
+    if typeName is None:
+
+        return None
+
+    iterNodes = om.MItDependencyNodes(om.MFn.kIkSolver)
+
+    while not iterNodes.isDone():
+
+        node = iterNodes.thisNode()
+
+        if om.MFnDependencyNode(node).typeName == typeName:
+
+            return node
+
+        iterNodes.next()
 
     return None
 
 
+def getIkSolver(solver, modifier=None):
+    """
+    Returns the IK solver associated with the given enum.
+    Solvers are cached by handle in order to skip any redundant scene lookups.
+    If a modifier is supplied then any missing solver is queued onto it instead of being created immediately.
+
+    :type solver: IkSolver
+    :type modifier: Union[om.MDGModifier, None]
+    :rtype: mpynode.MPyNode
+    """
+
+    # Check if solver is supported
+    #
+    typeName = IK_SOLVER_TYPES.get(solver, None)
+
+    if typeName is None:
+
+        return None
+
+    # Check if cached solver is still valid
+    #
+    handle = __ik_solvers__.get(solver, None)
+
+    if handle is not None and handle.isValid() and handle.isAlive():
+
+        return mpynode.MPyNode(handle.object())
+
+    # Check if solver already exists
+    #
+    node = findIkSolver(solver)
+
+    if node is not None:
+
+        __ik_solvers__[solver] = om.MObjectHandle(node)
+        return mpynode.MPyNode(node)
+
+    elif modifier is not None:
+
+        node = om.MDGModifier.createNode(modifier, typeName)
+        modifier.renameNode(node, typeName)
+
+        __ik_solvers__[solver] = om.MObjectHandle(node)
+        return mpynode.MPyNode(node)
+
+    else:
+
+        scene = mpyscene.MPyScene()
+        node = scene.createNode(typeName, name=typeName)
+
+        __ik_solvers__[solver] = om.MObjectHandle(node.object())
+        return node
+
+
 def applyEffector(joint):
     """
     Assigns an effector to the supplied joint.
@@ -193,17 +567,24 @@ def applyRotationPlaneSolver(startJoint, endJoint):
     return ikHandle, effector
 
 
-def iterInbetweenJoints(startJoint, endJoint, includeStart=False, includeEnd=False):
+def iterInbetweenJoints(startJoint, endJoint, includeStart=False, includeEnd=False, jointIndex=None):
     """
     Returns a generator that yields inbetween joints.
+    An optional joint index can be supplied to skip walking the ancestors of the end joint.
 
     :type startJoint: mpynode.MPyNode
     :type endJoint: mpynode.MPyNode
     :type includeStart: bool
     :type includeEnd: bool
+    :type jointIndex: Union[JointIndex, None]
     :rtype: Iterator[mpynode.MPyNode]
     """
 
+    if jointIndex is not None:
+
+        yield from jointIndex.iterInbetweenJoints(startJoint, endJoint, includeStart=includeStart, includeEnd=includeEnd)
+        return
+
     ancestors = endJoint.ancestors(apiType=om.MFn.kJoint)
 
     try:
@@ -226,6 +607,130 @@ def iterInbetweenJoints(startJoint, endJoint, includeStart=False, includeEnd=Fal
         return iter([])
 
 
+def getChainLength(startJoint, endJoint, jointIndex=None):
+    """
+    Returns the number of joints from the start joint to the end joint, inclusive.
+    If the start joint is not an ancestor of the end joint then 0 is returned.
+
+    :type startJoint: mpynode.MPyNode
+    :type endJoint: mpynode.MPyNode
+    :type jointIndex: Union[JointIndex, None]
+    :rtype: int
+    """
+
+    if jointIndex is not None:
+
+        return jointIndex.chainLength(startJoint, endJoint)
+
+    ancestors = endJoint.ancestors(apiType=om.MFn.kJoint)
+
+    if startJoint in ancestors:
+
+        return ancestors.index(startJoint) + 2
+
+    else:
+
+        return 0
+
+
+@profileutils.profile
+def addSpringAttributes(*ikHandles, modifier=None):
+    """
+    Adds the spring rest attributes to the supplied IK handles.
+    The attributes are added to every handle through a single modifier.
+
+    :type ikHandles: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
+    :type modifier: Union[om.MDGModifier, None]
+    :rtype: None
+    """
+
+    SPRING_ATTRIBUTES.apply(*ikHandles, modifier=modifier)
+
+
+def updateSpringAttributes(ikHandle, startJoint, endJoint, modifier=None):
+    """
+    Updates the spring rest attributes on the supplied IK handle.
+    If a modifier is supplied then the changes are queued onto it and the caller is responsible for executing it.
+
+    :type ikHandle: mpynode.MPyNode
+    :type startJoint: mpynode.MPyNode
+    :type endJoint: mpynode.MPyNode
+    :type modifier: Union[om.MDGModifier, None]
+    :rtype: None
+    """
+
+    # Calculate pole vector
+    #
+    forwardVector = (endJoint.translation(space=om.MSpace.kWorld) - startJoint.translation(space=om.MSpace.kWorld)).normal()
+    rightVector = transformutils.breakMatrix(startJoint.worldMatrix(), normalize=True)[2]
+    poleVector = (forwardVector ^ rightVector).normal()
+
+    # Queue plug changes
+    #
+    dgModifier = om.MDGModifier() if modifier is None else modifier
+    fnIkHandle = om.MFnDagNode(ikHandle.object())
+
+    dgModifier.newPlugValueBool(fnIkHandle.findPlug('rootOnCurve', False), True)
+
+    for (i, axis) in enumerate('XYZ'):
+
+        dgModifier.newPlugValueDouble(fnIkHandle.findPlug(f'poleVector{axis}', False), poleVector[i])
+        dgModifier.newPlugValueFloat(fnIkHandle.findPlug(f'springRestPoleVector{axis}', False), poleVector[i])
+
+    plug = fnIkHandle.findPlug('springAngleBias', False)
+
+    for (i, (position, value, interp)) in enumerate([(0.0, 0.5, 3), (1.0, 0.5, 3)]):
+
+        element = plug.elementByLogicalIndex(i)
+        dgModifier.newPlugValueFloat(element.child(0), position)
+        dgModifier.newPlugValueFloat(element.child(1), value)
+        dgModifier.newPlugValueInt(element.child(2), interp)
+        dgModifier.commandToExecute(f'setAttr -lock true "{fnIkHandle.fullPathName()}.springAngleBias[{i}].springAngleBias_Position";')
+
+    # Check if modifier requires executing
+    #
+    if modifier is None:
+
+        dgModifier.doIt()
+        undo.commit(dgModifier.undoIt, dgModifier.doIt)
+
+
+@profileutils.profile
+def updatePreferredAngles(startJoint, endJoint, jointIndex=None, modifier=None):
+    """
+    Updates the preferred angles on the supplied joint chain.
+    The start joint prefers its full rotation while the inbetween joints only prefer their Z rotation.
+    If a modifier is supplied then the changes are queued onto it and the caller is responsible for executing it.
+
+    :type startJoint: mpynode.MPyNode
+    :type endJoint: mpynode.MPyNode
+    :type jointIndex: Union[JointIndex, None]
+    :type modifier: Union[om.MDGModifier, None]
+    :rtype: None
+    """
+
+    # Queue preferred angles
+    #
+    dgModifier = om.MDGModifier() if modifier is None else modifier
+    joints = list(iterInbetweenJoints(startJoint, endJoint, jointIndex=jointIndex))
+
+    for (joint, axes) in chain([(startJoint, 'XYZ')], [(joint, 'Z') for joint in joints]):
+
+        fnJoint = om.MFnDependencyNode(joint.object())
+
+        for axis in axes:
+
+            angle = fnJoint.findPlug(f'rotate{axis}', False).asMAngle()
+            dgModifier.newPlugValueMAngle(fnJoint.findPlug(f'preferredAngle{axis}', False), angle)
+
+    # Check if modifier requires executing
+    #
+    if modifier is None:
+
+        dgModifier.doIt()
+        undo.commit(dgModifier.undoIt, dgModifier.doIt)
+
+
 def applySpringSolver(startJoint, endJoint):
     """
     Assigns a spring solver to the supplied joints.
@@ -246,99 +751,15 @@ def applySpringSolver(startJoint, endJoint):
 
     # Add spring rest attributes
     #
-    ikHandle.addAttr(
-        longName='springRestPose',
-        shortName='srp',
-        attributeType='long',
-        default=1,
-        cachedInternally=True,
-        hidden=True
-    )
-
-    ikHandle.addAttr(
-        longName='springRestPoleVector',
-        shortName='srpv',
-        attributeType='double3',
-        cachedInternally=True,
-        hidden=True,
-        children=[
-            {
-                'longName': 'springRestPoleVectorX',
-                'shortName': 'srpvx',
-                'attributeType': 'float',
-                'cachedInternally': True,
-                'hidden': True
-            },
-            {
-                'longName': 'springRestPoleVectorY',
-                'shortName': 'srpvy',
-                'attributeType': 'float',
-                'cachedInternally': True,
-                'hidden': True
-            },
-            {
-                'longName': 'springRestPoleVectorZ',
-                'shortName': 'srpvz',
-                'attributeType': 'float',
-                'cachedInternally': True,
-                'hidden': True
-            }
-        ]
-    )
-
-    ikHandle.addAttr(
-        longName='springAngleBias',
-        shortName='sab',
-        attributeType='compound',
-        cachedInternally=True,
-        multi=True,
-        children=[
-            {
-                'longName': 'springAngleBias_Position',
-                'shortName': 'sbp',
-                'attributeType': 'float',
-                'cachedInternally': True
-            },
-            {
-                'longName': 'springAngleBias_FloatValue',
-                'shortName': 'sbfv',
-                'attributeType': 'float',
-                'default': 1.0,
-                'cachedInternally': True
-            },
-            {
-                'longName': 'springAngleBias_Interp',
-                'shortName': 'sbi',
-                'attributeType': 'enum',
-                'min': 0,
-                'max': 3,
-                'default': 3,
-                'fields': 'None:Linear:Smooth:Spline',
-                'cachedInternally': True
-            }
-        ]
-    )
+    addSpringAttributes(ikHandle)
 
     # Update IK handle properties
     #
-    forwardVector = (endJoint.translation(space=om.MSpace.kWorld) - startJoint.translation(space=om.MSpace.kWorld)).normal()
-    rightVector = transformutils.breakMatrix(startJoint.worldMatrix(), normalize=True)[2]
-    poleVector = (forwardVector ^ rightVector).normal()
-
-    ikHandle.setAttr('poleVector', poleVector)
-    ikHandle.setAttr('rootOnCurve', True)
-    ikHandle.setAttr('springRestPoleVector', poleVector)
-    ikHandle.setAttr('springAngleBias', [(0, 0.5, 3), (1, 0.5, 3)])
-    ikHandle.lockAttr('springAngleBias[0].springAngleBias_Position', 'springAngleBias[1].springAngleBias_Position')
+    updateSpringAttributes(ikHandle, startJoint, endJoint)
 
     # Update preferred rotations
     #
-    joints = list(iterInbetweenJoints(startJoint, endJoint))
-    startJoint.preferEulerRotation()
-
-    for joint in joints:
-
-        joint.preferEulerRotation(skipPreferredAngleX=True, skipPreferredAngleY=True)
+    updatePreferredAngles(startJoint, endJoint)
 
     # Connect joint chain and effector to IK handle
     #
@@ -387,11 +808,135 @@ def applySplineSolver(startJoint, endJoint, curve):
     return ikHandle, effector
 
 
+@profileutils.profile
+def applySolvers(chains, jointIndex=None):
+    """
+    Assigns IK solvers to multiple joint chains at once.
+    Every solver, IK handle and effector, along with their connections, attributes and preferred angles, is created through a single dag modifier.
+    Spring values can only be queued once their attributes exist, so they are written by a second modifier that is committed alongside the first as one undo entry.
+    Spline solvers are not supported since they require a curve!
+
+    :type chains: List[Tuple[mpynode.MPyNode, mpynode.MPyNode, IkSolver]]
+    :type jointIndex: Union[JointIndex, None]
+    :rtype: List[Tuple[mpynode.MPyNode, mpynode.MPyNode]]
+    """
+
+    # Resolve solvers before any handles are created
+    #
+    dagModifier = om.MDagModifier()
+    solvers = {}
+
+    for (startJoint, endJoint, solver) in chains:
+
+        if solver not in (IkSolver.SINGLE_CHAIN, IkSolver.ROTATION_PLANE, IkSolver.SPRING):
+
+            raise TypeError(f'applySolvers() expects a single-chain, rotation-plane or spring solver ({solver} given)!')
+
+        if solver not in solvers:
+
+            solvers[solver] = getIkSolver(solver, modifier=dagModifier).object()
+
+    # Iterate through chains
+    #
+    nodes = []
+
+    for (startJoint, endJoint, solver) in chains:
+
+        # Create IK nodes
+        #
+        ikHandle = dagModifier.createNode('ikHandle')
+        effector = dagModifier.createNode('ikEffector', endJoint.parent().object())
+
+        fnIkHandle = om.MFnDependencyNode(ikHandle)
+        fnEffector = om.MFnDependencyNode(effector)
+        fnStartJoint = om.MFnDependencyNode(startJoint.object())
+        fnEndJoint = om.MFnDependencyNode(endJoint.object())
+        fnSolver = om.MFnDependencyNode(solvers[solver])
+
+        # Update IK-handle transform
+        #
+        if solver == IkSolver.SINGLE_CHAIN:
+
+            rotationMatrix = startJoint.worldMatrix()
+            dagModifier.newPlugValueInt(fnIkHandle.findPlug('stickiness', False), 1)
+
+        else:
+
+            rotationMatrix = endJoint.worldMatrix()
+
+        translation = endJoint.translation(space=om.MSpace.kWorld)
+        eulerRotation = om.MTransformationMatrix(rotationMatrix).rotation()
+
+        for (i, axis) in enumerate('XYZ'):
+
+            dagModifier.newPlugValueDouble(fnIkHandle.findPlug(f'translate{axis}', False), translation[i])
+            dagModifier.newPlugValueDouble(fnIkHandle.findPlug(f'rotate{axis}', False), eulerRotation[i])
+
+        # Connect effector attributes
+        #
+        dagModifier.connect(fnEndJoint.findPlug('translate', False), fnEffector.findPlug('translate', False))
+        dagModifier.connect(fnEndJoint.findPlug('offsetParentMatrix', False), fnEffector.findPlug('offsetParentMatrix', False))
+
+        # Connect IK attributes
+        #
+        dagModifier.connect(fnStartJoint.findPlug('message', False), fnIkHandle.findPlug('startJoint', False))
+        dagModifier.connect(fnEffector.findPlug('handlePath', False).elementByLogicalIndex(0), fnIkHandle.findPlug('endEffector', False))
+        dagModifier.connect(fnSolver.findPlug('message', False), fnIkHandle.findPlug('ikSolver', False))
+
+        # Update preferred angles
+        #
+        if solver != IkSolver.SINGLE_CHAIN:
+
+            updatePreferredAngles(startJoint, endJoint, jointIndex=jointIndex, modifier=dagModifier)
+
+        nodes.append((ikHandle, effector))
+
+    # Add spring rest attributes
+    #
+    springHandles = [ikHandle for ((_, _, solver), (ikHandle, _)) in zip(chains, nodes) if solver == IkSolver.SPRING]
+
+    if len(springHandles) > 0:
+
+        addSpringAttributes(*springHandles, modifier=dagModifier)
+
+    dagModifier.doIt()
+
+    # Update spring rest values
+    #
+    handles = [(mpynode.MPyNode(ikHandle), mpynode.MPyNode(effector)) for (ikHandle, effector) in nodes]
+    dgModifier = om.MDGModifier()
+
+    for ((startJoint, endJoint, solver), (ikHandle, effector)) in zip(chains, handles):
+
+        if solver == IkSolver.SPRING:
+
+            updateSpringAttributes(ikHandle, startJoint, endJoint, modifier=dgModifier)
+
+    dgModifier.doIt()
+
+    # Commit both modifiers as a single undo entry
+    #
+    def doIt():
+
+        dagModifier.doIt()
+        dgModifier.doIt()
+
+    def undoIt():
+
+        dgModifier.undoIt()
+        dagModifier.undoIt()
+
+    undo.commit(undoIt, doIt)
+
+    return handles
+
+
 def solveIk2BoneChain(startPoint, startLength, endPoint, endLength, poleVector, twist=0.0):
     """
     Solves for a 2-bone chain using the supplied variables.
     This method assumes that X is forward and -Y is up.
     Be sure to reorient these transforms in case your joint chain does not follow this convention.
+    See `solverutils.solveIk2BoneChains` for a batched equivalent that operates on arrays.
 
     :type startPoint: om.MPoint
     :type startLength: float
@@ -439,6 +984,7 @@ def solveSoftIk(startPoint, endPoint, chainLength, softDistance):
     """
     Solves for the soft end effector on any given IK system.
     This method returns the softened end point along with the soft scale for stretching.
+    See `solverutils.solveSoftIks` for a batched equivalent that operates on arrays.
 
     :type startPoint: om.MPoint
     :type endPoint: om.MPoint
@@ -483,6 +1029,7 @@ def calculatePoleVector(nodes):
     """
     Calculates a pole vector from a chain of nodes.
     At least 3 nodes are required to derive a pole vector!
+    See `calculatePoleVectors` for a batched alternative that handles straight chains.
 
     :type nodes: list[om.MObject]
     :rtype: om.MVector
@@ -502,17 +1049,84 @@ def calculatePoleVector(nodes):
     midPoint = transformutils.getTranslation(nodes[1], space=om.MSpace.kWorld)
     endPoint = transformutils.getTranslation(nodes[2], space=om.MSpace.kWorld)
 
-    # Calculate pole vector
-    #
+    return solvePoleVector(startPoint, midPoint, endPoint)
+
+
+def solvePoleVector(startPoint, midPoint, endPoint):
+    """
+    Solves for the pole vector of the supplied chain points.
+    See `solverutils.calculatePoleVectors` for a batched equivalent that operates on arrays.
+
+    :type startPoint: om.MPoint
+    :type midPoint: om.MPoint
+    :type endPoint: om.MPoint
+    :rtype: om.MVector
+    """
+
     forwardVector = om.MVector(endPoint - startPoint).normal()
     crossProduct = om.MVector(midPoint - startPoint).normal() ^ om.MVector(endPoint - startPoint).normal()
 
     return forwardVector ^ crossProduct
 
 
+@profileutils.profile
+def calculatePoleVectors(chains, distance=None, upAxis=1):
+    """
+    Calculates the pole vectors, and their positions, for multiple chains of nodes.
+    World positions are read in a single pass and then solved in batches of equal chain length.
+    Straight chains fall back on the specified up axis from the start node.
+    If no distance is supplied then the chain length is used instead.
+
+    :type chains: List[List[om.MObject]]
+    :type distance: Union[float, None]
+    :type upAxis: int
+    :rtype: Tuple[List[om.MVector], List[om.MPoint]]
+    """
+
+    # Inspect number of nodes
+    #
+    numNodes = [len(nodes) for nodes in chains]
+
+    if any([count < 3 for count in numNodes]):
+
+        raise TypeError(f'calculatePoleVectors() expects at least 3 nodes per chain ({min(numNodes)} given)!')
+
+    # Read world matrices in a single pass
+    #
+    matrices = np.array([tuple(bakeutils.getDagPath(node).inclusiveMatrix()) for node in chain.from_iterable(chains)], dtype=float).reshape(-1, 4, 4)
+    points = matrices[:, 3, :3]
+    startIndices = np.cumsum([0] + numNodes[:-1], dtype=int)
+
+    # Group chains by length
+    #
+    groups = defaultdict(list)
+
+    for (i, count) in enumerate(numNodes):
+
+        groups[count].append(i)
+
+    # Solve pole vectors in batches
+    #
+    numChains = len(chains)
+    poleVectors = np.zeros((numChains, 3))
+    polePositions = np.zeros((numChains, 3))
+
+    for (count, indices) in groups.items():
+
+        indices = np.array(indices, dtype=int)
+        chainPoints = points[startIndices[indices, None] + np.arange(count)]
+        fallbackVectors = matrices[startIndices[indices], upAxis, :3]
+
+        poleVectors[indices] = solverutils.calculateChainPoleVectors(chainPoints, fallbackVectors=fallbackVectors)
+        polePositions[indices] = solverutils.calculatePolePositions(chainPoints, poleVectors=poleVectors[indices], distance=distance)
+
+    return [om.MVector(*vector.tolist()) for vector in poleVectors], [om.MPoint(*position.tolist()) for position in polePositions]
+
+
 def fit2BoneIKto3BoneIK(points):
         """
         Returns the position for the 3-bone IK hack.
+        See `solverutils.solveFabrikChain` for solving chains of any length.
 
         :type points: List[Union[Tuple[float, float, float], om.MVector, om.MPoint]]
         :rtype: om.MPoint
@@ -527,13 +1141,14 @@ def fit2BoneIKto3BoneIK(points):
         return [
             points[0],
             points[0] + (initialVector * length),
-            points[3],
+            points[-1],
         ]
 
 
 def inverseToForward(fkNodes, startEffector, endEffector, poleVector=None):
     """
     Matches the inverse system to the forward system.
+    See `bakeutils.bakeInverseToForward` for matching across a frame range.
 
     :type fkNodes: list[om.MObject]
     :type startEffector: om.MObject
@@ -551,6 +1166,7 @@ def inverseToForward(fkNodes, startEffector, endEffector, poleVector=None):
 def forwardToInverse(fkNodes, ikNodes):
     """
     Matches the forward system to the inverse system.
+    See `bakeutils.bakeForwardToInverse` for matching across a frame range.
 
     :type fkNodes: list[om.MObject]
     :type ikNodes: list[om.MObject]
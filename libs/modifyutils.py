@@ -1,7 +1,20 @@
-from maya.api import OpenMaya as om
-from mpy import mpyscene, mpynode
-from dcc.maya.decorators import undo
-from . import ColorMode
+from functools import partial
+from collections import OrderedDict
+
+try:
+
+    from maya.api import OpenMaya as om
+    from mpy import mpyscene, mpynode
+    from dcc.maya.decorators import undo
+
+except ImportError:
+
+    # Without Maya only the bulk operations can be evaluated, against an active `HeadlessScene`
+    #
+    from .standins import OpenMaya as om, undo
+    mpyscene, mpynode = None, None
+
+from . import ColorMode, nameutils, colorutils, profileutils, sceneutils
 
 import logging
 logging.basicConfig()
@@ -9,6 +22,7 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+@profileutils.profile
 @undo.Undo(name='Rename Node')
 def renameNode(node, name):
     """
@@ -19,9 +33,9 @@ def renameNode(node, name):
     :rtype: bool
     """
 
-    scene = mpyscene.MPyScene()
+    nameIndex = nameutils.NameIndex.getInstance()
 
-    if scene.isNameAvailable(name):
+    if nameIndex.isNameAvailable(name):
 
         node.setName(name)
         return True
@@ -31,26 +45,439 @@ def renameNode(node, name):
         return False
 
 
+def absoluteNamespace(namespace):
+    """
+    Returns the absolute form of the supplied namespace.
+    The root namespace is returned as a single colon.
+
+    :type namespace: str
+    :rtype: str
+    """
+
+    return ':' + namespace.strip(':')
+
+
+def splitNamespace(namespace):
+    """
+    Splits the supplied absolute namespace into its parent namespace and leaf name.
+
+    :type namespace: str
+    :rtype: Tuple[str, str]
+    """
+
+    parent, sep, name = namespace.rpartition(':')
+    return absoluteNamespace(parent), name
+
+
+def isWholeNamespace(namespace, hashCodes):
+    """
+    Evaluates if the supplied hash codes cover every dependency node inside the specified namespace.
+    A namespace operation moves every node, including unselected shading and utility nodes, so anything less would not match renaming each node!
+    Namespaces with child namespaces are never considered whole since a namespace operation would also move their children.
+
+    :type namespace: str
+    :type hashCodes: Set[int]
+    :rtype: bool
+    """
+
+    if namespace == ':' or len(om.MNamespace.getNamespaces(parentNamespace=namespace, recurse=False)) > 0:
+
+        return False
+
+    objects = om.MNamespace.getNamespaceObjects(parentNamespace=namespace, recurse=False)
+
+    return len(objects) > 0 and all(om.MObjectHandle(obj).hashCode() in hashCodes for obj in objects)
+
+
+def iterShapes(obj):
+    """
+    Returns a generator that yields the shapes, including intermediate objects, below the supplied transform.
+
+    :type obj: om.MObject
+    :rtype: Iterator[om.MObject]
+    """
+
+    if not obj.hasFn(om.MFn.kTransform):
+
+        return
+
+    fnDagNode = om.MFnDagNode(obj)
+
+    for i in range(fnDagNode.childCount()):
+
+        child = fnDagNode.child(i)
+
+        if child.hasFn(om.MFn.kShape):
+
+            yield child
+
+
+def renameNamespace(namespace, newNamespace):
+    """
+    Renames the supplied namespace in a single operation.
+    The new namespace's parent must already exist!
+
+    :type namespace: str
+    :type newNamespace: str
+    :rtype: None
+    """
+
+    parent, name = splitNamespace(newNamespace)
+    om.MNamespace.renameNamespace(namespace, name, parent=parent)
+
+
+def moveNamespace(namespace, newNamespace):
+    """
+    Moves the contents of the supplied namespace into another namespace in a single operation.
+    The emptied namespace is removed afterwards.
+    Returns a function that restores the original names.
+
+    :type namespace: str
+    :type newNamespace: str
+    :rtype: Callable
+    """
+
+    # Record original names for undo
+    #
+    fnNode = om.MFnDependencyNode()
+    names = []
+
+    for obj in om.MNamespace.getNamespaceObjects(parentNamespace=namespace, recurse=False):
+
+        fnNode.setObject(obj)
+        names.append((om.MObjectHandle(obj), fnNode.absoluteName()))
+
+    # Move namespace contents
+    #
+    om.MNamespace.moveNamespace(namespace, newNamespace, force=True)
+    om.MNamespace.removeNamespace(namespace)
+
+    def restoreNames():
+
+        om.MNamespace.addNamespace(namespace)
+
+        dgModifier = om.MDGModifier()
+
+        for (handle, name) in names:
+
+            if handle.isAlive():
+
+                dgModifier.renameNode(handle.object(), name)
+
+        dgModifier.doIt()
+
+    return restoreNames
+
+
+@profileutils.profile
 @undo.Undo(name='Renamespace Node')
 def renamespaceNodes(*nodes, namespace=''):
     """
     Updates the namespace for the supplied nodes.
+    Shapes follow their transforms, the same as they would through the namespace editor.
+    Only when the nodes make up every node in a namespace is the namespace itself renamed or moved in a single operation.
+    Any remaining nodes are renamed through a single modifier.
 
     :type nodes: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
     :type namespace: str
     :rtype: None
     """
 
+    # Group nodes by namespace
+    #
+    namespace = absoluteNamespace(namespace)
+    fnNode = om.MFnDependencyNode()
+    groups = {}
+
+    for node in nodes:
+
+        for obj in (node.object(), *iterShapes(node.object())):
+
+            fnNode.setObject(obj)
+            currentNamespace = absoluteNamespace(fnNode.absoluteName().rpartition(':')[0])
+
+            if currentNamespace != namespace:
+
+                groups.setdefault(currentNamespace, {})[om.MObjectHandle(obj).hashCode()] = obj
+
+    # Check if any namespaces can be moved as a whole
+    #
+    remaining = []
+
+    for (currentNamespace, objects) in groups.items():
+
+        if not isWholeNamespace(currentNamespace, set(objects.keys())):
+
+            remaining.extend(objects.values())
+            continue
+
+        try:
+
+            if not om.MNamespace.namespaceExists(namespace):
+
+                renameNamespace(currentNamespace, namespace)
+                undo.commit(partial(renameNamespace, namespace, currentNamespace), partial(renameNamespace, currentNamespace, namespace))
+
+            else:
+
+                restoreNames = moveNamespace(currentNamespace, namespace)
+                undo.commit(restoreNames, partial(moveNamespace, currentNamespace, namespace))
+
+            log.info(f'Moved {len(objects)} node(s) from {currentNamespace} to {namespace} namespace.')
+
+        except RuntimeError as exception:
+
+            # Referenced or locked namespaces cannot be edited directly
+            #
+            log.debug(exception)
+            remaining.extend(objects.values())
+
+    # Rename remaining nodes in bulk
+    #
+    if len(remaining) == 0:
+
+        return
+
+    if not om.MNamespace.namespaceExists(namespace):
+
+        om.MNamespace.addNamespace(namespace)
+
+    prefix = '' if namespace == ':' else namespace
+    dgModifier = om.MDGModifier()
+
+    for obj in remaining:
+
+        fnNode.setObject(obj)
+        dgModifier.renameNode(obj, f'{prefix}:{om.MNamespace.stripNamespaceFromName(fnNode.name())}')
+
+    dgModifier.doIt()
+    undo.commit(dgModifier.undoIt, dgModifier.doIt)
+
+
+COLOR_ATTRIBUTES = {
+    'useObjectColor', 'objectColor', 'objectColorRGB', 'objectColorR', 'objectColorG', 'objectColorB',
+    'wireColorRGB', 'wireColorR', 'wireColorG', 'wireColorB',
+    'drawOverride', 'overrideEnabled', 'overrideRGBColors', 'overrideColor', 'overrideColorRGB', 'overrideColorR', 'overrideColorG', 'overrideColorB'
+}
+
+
+__wireframe_colors__ = {}  # Cache of (MObjectHandle, color) pairs keyed by node hash code and ColorMode
+__color_callbacks__ = OrderedDict()  # Least recently used (callback ID, node hash codes) pairs keyed by the hash code of the watched shape or transform
+__dag_callbacks__ = om.MCallbackIdArray()
+__max_color_callbacks__ = 512
+
+
+def onColorAttributeChanged(message, plug, otherPlug, clientData):
+    """
+    Callback method for any attribute changes on a watched shape or transform.
+    Only changes, or connections, to the color plugs invalidate the cache.
+    Display layers drive the transform's draw overrides so joining, or leaving, a layer is caught as a connection change.
+
+    :type message: int
+    :type plug: om.MPlug
+    :type otherPlug: om.MPlug
+    :type clientData: int
+    :rtype: None
+    """
+
+    isChanged = message & (om.MNodeMessage.kAttributeSet | om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken)
+
+    if isChanged and plug.partialName(useLongNames=True) in COLOR_ATTRIBUTES:
+
+        invalidateWatchedColors(clientData)
+
+
+def onChildChanged(child, parent, *args, **kwargs):
+    """
+    Callback method for any dag child changes.
+    Adding or removing shapes can change which shape a node derives its color from.
+
+    :type child: om.MDagPath
+    :type parent: om.MDagPath
+    :rtype: None
+    """
+
+    if len(__wireframe_colors__) > 0 and parent.isValid():
+
+        invalidateWireframeColor(om.MObjectHandle(parent.node()).hashCode())
+
+
+def hasColorCallbacks():
+    """
+    Evaluates if the callbacks that keep the wireframe color cache current are registered.
+    Colors are only cached while these callbacks are registered.
+
+    :rtype: bool
+    """
+
+    return len(__dag_callbacks__) > 0
+
+
+def addColorCallbacks():
+    """
+    Registers the callbacks that keep the wireframe color cache current.
+
+    :rtype: None
+    """
+
+    if hasColorCallbacks():
+
+        return
+
+    __dag_callbacks__.append(om.MDagMessage.addChildAddedCallback(onChildChanged))
+    __dag_callbacks__.append(om.MDagMessage.addChildRemovedCallback(onChildChanged))
+
+
+def removeColorCallbacks():
+    """
+    Removes every wireframe color callback and clears the cache.
+
+    :rtype: None
+    """
+
+    if hasColorCallbacks():
+
+        om.MMessage.removeCallbacks(__dag_callbacks__)
+        __dag_callbacks__.clear()
+
+    clearWireframeColors()
+
+
+def invalidateWireframeColor(hashCode):
+    """
+    Removes any cached colors for the specified node hash code.
+
+    :type hashCode: int
+    :rtype: None
+    """
+
+    for colorMode in ColorMode:
+
+        __wireframe_colors__.pop((hashCode, colorMode), None)
+
+
+def invalidateWatchedColors(watchedHashCode):
+    """
+    Removes any cached colors derived from the specified shape, or transform, hash code.
+
+    :type watchedHashCode: int
+    :rtype: None
+    """
+
+    callbackId, hashCodes = __color_callbacks__.get(watchedHashCode, (None, ()))
+
+    for hashCode in hashCodes:
+
+        invalidateWireframeColor(hashCode)
+
+
+def releaseWatchedColors(watchedHashCode):
+    """
+    Removes the callback for the specified shape, or transform, hash code along with any colors derived from it.
+
+    :type watchedHashCode: int
+    :rtype: None
+    """
+
+    invalidateWatchedColors(watchedHashCode)
+
+    callbackId, hashCodes = __color_callbacks__.pop(watchedHashCode, (None, ()))
+
+    if callbackId is not None:
+
+        om.MMessage.removeCallback(callbackId)
+
+
+def clearWireframeColors():
+    """
+    Clears the wireframe color cache along with its shape callbacks.
+    This should be called whenever the scene changes!
+
+    :rtype: None
+    """
+
+    for (callbackId, hashCodes) in __color_callbacks__.values():
+
+        om.MMessage.removeCallback(callbackId)
+
+    __color_callbacks__.clear()
+    __wireframe_colors__.clear()
+
+
+def isColorDriven(*nodes):
+    """
+    Evaluates if any color plugs on the supplied nodes are driven by a connection.
+    Display layers, for instance, drive the draw overrides through a connection which does not signal an attribute change on the node.
+
+    :type nodes: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
+    :rtype: bool
+    """
+
     for node in nodes:
 
-        node.setNamespace(namespace)
+        fnNode = om.MFnDependencyNode(node.object())
+
+        for name in ('drawOverride', 'objectColor', 'wireColorRGB', 'useObjectColor'):
+
+            if not fnNode.hasAttribute(name):
+
+                continue
+
+            plug = fnNode.findPlug(name, False)
+
+            if plug.isDestination:
+
+                return True
+
+            elif plug.isCompound and any(plug.child(i).isDestination for i in range(plug.numChildren())):
+
+                return True
+
+            else:
+
+                continue
+
+    return False
+
+
+def watchColor(node, hashCode):
+    """
+    Registers an attribute callback on the supplied shape, or transform, that invalidates the specified cached color.
+    Watched nodes are evicted least recently used first once the callback limit is exceeded.
+
+    :type node: mpynode.MPyNode
+    :type hashCode: int
+    :rtype: None
+    """
+
+    watchedHashCode = om.MObjectHandle(node.object()).hashCode()
+    callbackId, hashCodes = __color_callbacks__.get(watchedHashCode, (None, None))
 
+    if callbackId is None:
 
+        callbackId, hashCodes = om.MNodeMessage.addAttributeChangedCallback(node.object(), onColorAttributeChanged, watchedHashCode), set()
+        __color_callbacks__[watchedHashCode] = (callbackId, hashCodes)
+
+        while len(__color_callbacks__) > __max_color_callbacks__:
+
+            releaseWatchedColors(next(iter(__color_callbacks__)))
+
+    else:
+
+        __color_callbacks__.move_to_end(watchedHashCode)
+
+    hashCodes.add(hashCode)
+
+
+@profileutils.profile
 def findWireframeColor(node, colorMode=ColorMode.NONE):
     """
     Returns the wireframe color from the supplied node.
+    Colors are cached by node and color mode, while the color callbacks are registered, until any color plugs on either the transform or its derived shape change.
+    Dormant colors inherit the transform's draw overrides, and its display layer, so both nodes are watched.
+    Colors driven by connections, such as display layers, are never cached since layer edits do not notify either node.
 
-    :type node:
+    :type node: mpynode.MPyNode
     :type colorMode: ColorMode
     :rtype: Tuple[float, float, float]
     """
@@ -61,6 +488,17 @@ def findWireframeColor(node, colorMode=ColorMode.NONE):
 
         return (0.0, 0.0, 0.0)
 
+    # Check if color has been cached
+    #
+    handle = om.MObjectHandle(node.object())
+    hashCode = handle.hashCode()
+
+    cachedHandle, cachedColor = __wireframe_colors__.get((hashCode, colorMode), (None, None))
+
+    if cachedHandle is not None and cachedHandle.isAlive() and cachedHandle == handle:
+
+        return cachedColor
+
     # Evaluate shapes under transform
     #
     shapes = node.shapes()
@@ -76,18 +514,47 @@ def findWireframeColor(node, colorMode=ColorMode.NONE):
     #
     if colorMode == ColorMode.WIRE_COLOR_RGB:
 
-        return shape.wireColorRGB
+        color = shape.wireColorRGB
 
     elif colorMode == ColorMode.OVERRIDE_COLOR_RGB:
 
-        return shape.overrideColorRGB if shape.overrideEnabled else shape.wireColorRGB
+        color = shape.overrideColorRGB if shape.overrideEnabled else shape.wireColorRGB
+
+    elif colorMode == ColorMode.OBJECT_COLOR_INDEX and shape.useObjectColor == 1:
+
+        color = colorutils.getObjectColor(shape.getAttr('objectColor'))
+
+    elif colorMode == ColorMode.OVERRIDE_COLOR_INDEX and shape.overrideEnabled and not shape.getAttr('overrideRGBColors') and shape.getAttr('overrideColor') > 0:
+
+        color = colorutils.getIndexColor(shape.getAttr('overrideColor'))
 
     else:
 
         dormantColor = shape.dormantColor()
-        return dormantColor.r, dormantColor.g, dormantColor.b
+        color = dormantColor.r, dormantColor.g, dormantColor.b
+
+    # Check if color can be cached
+    #
+    color = tuple(color)
 
+    if not hasColorCallbacks() or isColorDriven(node, shape):
 
+        return color
+
+    # Register callbacks on both the transform and shape
+    #
+    watchColor(node, hashCode)
+
+    if shape is not node:
+
+        watchColor(shape, hashCode)
+
+    __wireframe_colors__[(hashCode, colorMode)] = (handle, color)
+
+    return color
+
+
+@profileutils.profile
 @undo.Undo(name='Recolor Node')
 def recolorNodes(*nodes, color=(0.0, 0.0, 0.0), colorMode=ColorMode.NONE):
     """
@@ -99,6 +566,11 @@ def recolorNodes(*nodes, color=(0.0, 0.0, 0.0), colorMode=ColorMode.NONE):
     :rtype: None
     """
 
+    # Evaluate nearest palette index
+    #
+    colorIndex = int(colorutils.findNearestIndices([color])[0])
+    objectColor = int(colorutils.findNearestObjectColors([color])[0])
+
     # Iterate through nodes
     #
     for node in nodes:
@@ -139,6 +611,207 @@ def recolorNodes(*nodes, color=(0.0, 0.0, 0.0), colorMode=ColorMode.NONE):
                 shape.overrideRGBColors = True
                 shape.overrideColorRGB = color
 
+            elif colorMode == ColorMode.OBJECT_COLOR_INDEX:
+
+                shape.useObjectColor = 1
+                shape.setAttr('objectColor', objectColor)
+
+            elif colorMode == ColorMode.OVERRIDE_COLOR_INDEX:
+
+                shape.overrideEnabled = True
+                shape.overrideRGBColors = False
+                shape.setAttr('overrideColor', colorIndex)
+
+            else:
+
+                continue
+
+
+def recolorHeadlessShapes(scene, groups):
+    """
+    Recolors the grouped shapes inside a headless scene.
+    This is the headless equivalent of the modifier used by `batchRecolorNodes`, with each group written in a single vectorized call.
+    Returns the number of recolored shapes along with the number of wire-colours hidden by drawing overrides.
+
+    :type scene: headlessutils.HeadlessScene
+    :type groups: Dict[Tuple[ColorMode, Union[int, Tuple[float, float, float]]], List[int]]
+    :rtype: Tuple[int, int]
+    """
+
+    numShapes = 0
+    numWarnings = 0
+
+    for ((mode, color), shapes) in groups.items():
+
+        numGroupShapes = len(shapes)
+
+        if mode == ColorMode.WIRE_COLOR_RGB:
+
+            scene.setPlugValues(shapes, 'useObjectColor', [2] * numGroupShapes)
+            scene.setPlugValues(shapes, 'wireColorRGB', [color] * numGroupShapes)
+
+            numWarnings += sum(1 for shape in shapes if scene.getPlugValue(shape, 'overrideEnabled'))
+
+        elif mode == ColorMode.OVERRIDE_COLOR_RGB:
+
+            scene.setPlugValues(shapes, 'overrideEnabled', [True] * numGroupShapes)
+            scene.setPlugValues(shapes, 'overrideRGBColors', [True] * numGroupShapes)
+            scene.setPlugValues(shapes, 'overrideColorRGB', [color] * numGroupShapes)
+
+        elif mode == ColorMode.OBJECT_COLOR_INDEX:
+
+            scene.setPlugValues(shapes, 'useObjectColor', [1] * numGroupShapes)
+            scene.setPlugValues(shapes, 'objectColor', [color] * numGroupShapes)
+
+        elif mode == ColorMode.OVERRIDE_COLOR_INDEX:
+
+            scene.setPlugValues(shapes, 'overrideEnabled', [True] * numGroupShapes)
+            scene.setPlugValues(shapes, 'overrideRGBColors', [False] * numGroupShapes)
+            scene.setPlugValues(shapes, 'overrideColor', [color] * numGroupShapes)
+
+        else:
+
+            continue
+
+        numShapes += numGroupShapes
+
+    return numShapes, numWarnings
+
+
+@profileutils.profile
+@undo.Undo(name='Recolor Nodes')
+def batchRecolorNodes(nodes, colors, colorMode=ColorMode.NONE):
+    """
+    Recolors the supplied nodes to their paired colors.
+    Unlike `recolorNodes`, shapes are grouped by target color and every plug write is queued on a single modifier.
+    Index modes snap every color to its nearest palette entry in a single vectorized lookup.
+    A single color can be supplied in place of a sequence to recolor every node the same.
+
+    :type nodes: List[mpynode.MPyNode]
+    :type colors: Union[Tuple[float, float, float], List[Tuple[float, float, float]]]
+    :type colorMode: ColorMode
+    :rtype: Dict[str, int]
+    """
+
+    # Check if a single color was supplied
+    #
+    numNodes = len(nodes)
+
+    if len(colors) == 3 and all(isinstance(value, (int, float)) for value in colors):
+
+        colors = [colors] * numNodes
+
+    # Snap colors to palette for index modes
+    # The entire gradient is evaluated at once!
+    #
+    if colorMode == ColorMode.OBJECT_COLOR_INDEX:
+
+        colors = colorutils.findNearestObjectColors(colors).tolist()
+
+    elif colorMode == ColorMode.OVERRIDE_COLOR_INDEX:
+
+        colors = colorutils.findNearestIndices(colors).tolist()
+
+    else:
+
+        pass
+
+    # Group shapes by color
+    #
+    groups = {}
+    numSkipped = 0
+
+    for (node, color) in zip(nodes, colors):
+
+        # Check if this is a transform node
+        #
+        if not node.hasFn(om.MFn.kTransform):
+
+            numSkipped += 1
+            continue
+
+        # Evaluate shapes
+        #
+        shapes = node.shapes()
+
+        if len(shapes) == 0 and node.hasFn(om.MFn.kJoint):
+
+            shapes = [node]
+
+        key = (colorMode, color if isinstance(color, int) else tuple(round(float(value), 6) for value in color))
+        groups.setdefault(key, []).extend([shape.object() for shape in shapes])
+
+    # Check if scene is headless
+    #
+    scene = sceneutils.getScene()
+
+    if sceneutils.isHeadless(scene):
+
+        numShapes, numWarnings = recolorHeadlessShapes(scene, groups)
+
+        if numWarnings > 0:
+
+            log.warning(f'Cannot set wire-colour on {numWarnings} shape(s) while drawing overrides are enabled!')
+
+        return {'nodes': numNodes - numSkipped, 'shapes': numShapes, 'colors': len(groups), 'skipped': numSkipped}
+
+    # Queue plug writes
+    #
+    dgModifier = om.MDGModifier()
+    numShapes = 0
+    numWarnings = 0
+
+    for ((mode, color), shapes) in groups.items():
+
+        for shape in shapes:
+
+            fnShape = om.MFnDependencyNode(shape)
+
+            if mode == ColorMode.WIRE_COLOR_RGB:
+
+                dgModifier.newPlugValueInt(fnShape.findPlug('useObjectColor', False), 2)
+
+                for (i, channel) in enumerate('RGB'):
+
+                    dgModifier.newPlugValueFloat(fnShape.findPlug(f'wireColor{channel}', False), color[i])
+
+                if fnShape.findPlug('overrideEnabled', False).asBool():
+
+                    numWarnings += 1
+
+            elif mode == ColorMode.OVERRIDE_COLOR_RGB:
+
+                dgModifier.newPlugValueBool(fnShape.findPlug('overrideEnabled', False), True)
+                dgModifier.newPlugValueBool(fnShape.findPlug('overrideRGBColors', False), True)
+
+                for (i, channel) in enumerate('RGB'):
+
+                    dgModifier.newPlugValueFloat(fnShape.findPlug(f'overrideColor{channel}', False), color[i])
+
+            elif mode == ColorMode.OBJECT_COLOR_INDEX:
+
+                dgModifier.newPlugValueInt(fnShape.findPlug('useObjectColor', False), 1)
+                dgModifier.newPlugValueInt(fnShape.findPlug('objectColor', False), color)
+
+            elif mode == ColorMode.OVERRIDE_COLOR_INDEX:
+
+                dgModifier.newPlugValueBool(fnShape.findPlug('overrideEnabled', False), True)
+                dgModifier.newPlugValueBool(fnShape.findPlug('overrideRGBColors', False), False)
+                dgModifier.newPlugValueInt(fnShape.findPlug('overrideColor', False), color)
+
             else:
 
                 continue
+
+            numShapes += 1
+
+    # Execute modifier
+    #
+    dgModifier.doIt()
+    undo.commit(dgModifier.undoIt, dgModifier.doIt)
+
+    if numWarnings > 0:
+
+        log.warning(f'Cannot set wire-colour on {numWarnings} shape(s) while drawing overrides are enabled!')
+
+    return {'nodes': numNodes - numSkipped, 'shapes': numShapes, 'colors': len(groups), 'skipped': numSkipped}
@@ -0,0 +1,431 @@
+import re
+
+from collections import Counter
+
+try:
+
+    from maya.api import OpenMaya as om
+
+except ImportError:
+
+    # Without Maya names can only be indexed from an active `HeadlessScene`
+    #
+    from .standins import OpenMaya as om
+
+from . import sceneutils, profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__suffix__ = re.compile(r'^(.*?)(\d*)$')
+
+
+def splitSuffix(name):
+    """
+    Splits the supplied name into its base name and numeric suffix.
+    Names without a suffix return a suffix of zero.
+
+    :type name: str
+    :rtype: Tuple[str, int]
+    """
+
+    baseName, suffix = __suffix__.match(name).groups()
+    return baseName, int(suffix) if suffix else 0
+
+
+def onNodeAdded(node, *args, **kwargs):
+    """
+    Callback method for any nodes added to the scene.
+
+    :type node: om.MObject
+    :rtype: None
+    """
+
+    if NameIndex.__instance__ is not None:
+
+        NameIndex.__instance__.addName(om.MFnDependencyNode(node).name())
+
+
+def onNodeRemoved(node, *args, **kwargs):
+    """
+    Callback method for any nodes removed from the scene.
+
+    :type node: om.MObject
+    :rtype: None
+    """
+
+    if NameIndex.__instance__ is not None:
+
+        NameIndex.__instance__.removeName(om.MFnDependencyNode(node).name())
+
+
+def onNameChanged(node, previousName, *args, **kwargs):
+    """
+    Callback method for any node name changes.
+
+    :type node: om.MObject
+    :type previousName: str
+    :rtype: None
+    """
+
+    if NameIndex.__instance__ is not None:
+
+        NameIndex.__instance__.removeName(previousName)
+        NameIndex.__instance__.addName(om.MFnDependencyNode(node).name())
+
+
+def onSceneChanged(*args, **kwargs):
+    """
+    Callback method for any scene changes.
+    Opening, or creating, a scene replaces every node so the shared index is rebuilt on its next use.
+
+    :rtype: None
+    """
+
+    NameIndex.invalidate()
+
+
+class NameReservation(object):
+    """
+    Base class used to scope name reservations.
+    Any names reserved inside this scope that were never fulfilled by a node are released on exit.
+    This prevents names from leaking when a modifier fails or is never executed!
+    """
+
+    # region Dunderscores
+    def __init__(self, nameIndex):
+        """
+        Private method called after a new instance has been created.
+
+        :type nameIndex: NameIndex
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NameReservation, self).__init__()
+
+        # Declare private variables
+        #
+        self._nameIndex = nameIndex
+        self._names = set()
+
+    def __enter__(self):
+        """
+        Private method that opens this reservation scope.
+
+        :rtype: NameReservation
+        """
+
+        self._nameIndex._scopes.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that closes this reservation scope and releases any unfulfilled names.
+
+        :type exc_type: Union[Type[Exception], None]
+        :type exc_val: Union[Exception, None]
+        :type exc_tb: Union[traceback, None]
+        :rtype: None
+        """
+
+        self._nameIndex._scopes.remove(self)
+
+        for name in self._names:
+
+            self._nameIndex.releaseName(name)
+
+        self._names.clear()
+    # endregion
+
+    # region Methods
+    def add(self, name):
+        """
+        Adds the supplied name to this reservation scope.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._names.add(name)
+    # endregion
+
+
+class NameIndex(object):
+    """
+    Base class used to generate unique node names without querying the scene.
+    Every name in the scene is indexed once and kept current through node-added, node-removed and name-changed callbacks.
+    These callbacks are registered on first use so scripts and batch callers share the same index as the window.
+    """
+
+    # region Dunderscores
+    __instance__ = None
+    __callbacks__ = om.MCallbackIdArray()
+
+    def __init__(self, names=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type names: Union[List[str], None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NameIndex, self).__init__()
+
+        # Declare private variables
+        #
+        self._counts = Counter()
+        self._suffixes = {}
+        self._reserved = set()
+        self._scopes = []
+
+        # Index supplied names
+        #
+        if names is not None:
+
+            for name in names:
+
+                self.addName(name)
+
+    def __contains__(self, name):
+        """
+        Private method that evaluates if the supplied name is in use.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        return not self.isNameAvailable(name)
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of unique names in use.
+
+        :rtype: int
+        """
+
+        return len(self._counts)
+    # endregion
+
+    # region Methods
+    @classmethod
+    @profileutils.profile
+    def create(cls):
+        """
+        Returns a new index derived from the nodes in the scene.
+        If a headless scene is active then its nodes are indexed instead.
+
+        :rtype: NameIndex
+        """
+
+        scene = sceneutils.getScene()
+
+        if sceneutils.isHeadless(scene):
+
+            return cls([node.name() for node in scene.iterNodes()])
+
+        names = []
+        iterNodes = om.MItDependencyNodes()
+        fnNode = om.MFnDependencyNode()
+
+        while not iterNodes.isDone():
+
+            fnNode.setObject(iterNodes.thisNode())
+            names.append(fnNode.name())
+
+            iterNodes.next()
+
+        return cls(names)
+
+    @classmethod
+    def getInstance(cls):
+        """
+        Returns the shared index, building it if it was invalidated.
+        The callbacks that keep the index current are registered on first use.
+        Headless scenes emit no callbacks so a new index is returned every time.
+
+        :rtype: NameIndex
+        """
+
+        # Check if scene is headless
+        #
+        if sceneutils.isHeadless():
+
+            return cls.create()
+
+        # Check if callbacks exist
+        #
+        if not cls.hasCallbacks():
+
+            cls.addCallbacks()
+
+        # Check if index requires building
+        #
+        if cls.__instance__ is None:
+
+            cls.__instance__ = cls.create()
+
+        return cls.__instance__
+
+    @classmethod
+    def hasCallbacks(cls):
+        """
+        Evaluates if the callbacks that keep the shared index current are registered.
+
+        :rtype: bool
+        """
+
+        return len(cls.__callbacks__) > 0
+
+    @classmethod
+    def addCallbacks(cls):
+        """
+        Registers the callbacks that keep the shared index current.
+
+        :rtype: None
+        """
+
+        if cls.hasCallbacks():
+
+            return
+
+        cls.__callbacks__.append(om.MDGMessage.addNodeAddedCallback(onNodeAdded, 'dependNode'))
+        cls.__callbacks__.append(om.MDGMessage.addNodeRemovedCallback(onNodeRemoved, 'dependNode'))
+        cls.__callbacks__.append(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, onNameChanged))
+        cls.__callbacks__.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, onSceneChanged))
+        cls.__callbacks__.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, onSceneChanged))
+
+    @classmethod
+    def removeCallbacks(cls):
+        """
+        Removes the callbacks that keep the shared index current and invalidates the index.
+
+        :rtype: None
+        """
+
+        if cls.hasCallbacks():
+
+            om.MMessage.removeCallbacks(cls.__callbacks__)
+            cls.__callbacks__.clear()
+
+        cls.invalidate()
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Invalidates the shared index.
+
+        :rtype: None
+        """
+
+        cls.__instance__ = None
+
+    def addName(self, name):
+        """
+        Adds the supplied name to this index.
+        Any pending reservation for the name is fulfilled.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._counts[name] += 1
+        self._reserved.discard(name)
+
+        baseName, suffix = splitSuffix(name)
+        self._suffixes[baseName] = max(self._suffixes.get(baseName, 0), suffix)
+
+    def removeName(self, name):
+        """
+        Removes the supplied name from this index.
+        The highest suffix per base name is never lowered so generated names remain unique.
+
+        :type name: str
+        :rtype: None
+        """
+
+        count = self._counts.get(name, 0)
+
+        if count > 1:
+
+            self._counts[name] = count - 1
+
+        elif count == 1:
+
+            del self._counts[name]
+
+        else:
+
+            pass
+
+    def reserve(self):
+        """
+        Returns a new reservation scope.
+        Any names reserved inside the scope are released on exit unless a node has claimed them.
+
+        :rtype: NameReservation
+        """
+
+        return NameReservation(self)
+
+    def releaseName(self, name):
+        """
+        Releases a pending reservation for the supplied name.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self._reserved.discard(name)
+
+    def isNameAvailable(self, name):
+        """
+        Evaluates if the supplied name is not in use or reserved.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        return name not in self._counts and name not in self._reserved
+
+    @profileutils.profile
+    def makeNameUnique(self, name, reserve=True):
+        """
+        Returns a unique name derived from the supplied name.
+        By default, the returned name is reserved until a node with that name is added.
+        This allows names to be generated for modifiers that have yet to be executed!
+        Reserve names inside a `reserve` scope so they are released if the modifier is never executed.
+
+        :type name: str
+        :type reserve: bool
+        :rtype: str
+        """
+
+        # Check if name is available
+        #
+        if not self.isNameAvailable(name):
+
+            baseName, suffix = splitSuffix(name)
+            suffix = max(self._suffixes.get(baseName, 0), suffix) + 1
+
+            name = f'{baseName}{suffix}'
+            self._suffixes[baseName] = suffix
+
+        # Check if name should be reserved
+        #
+        if reserve:
+
+            self._reserved.add(name)
+
+            if len(self._scopes) > 0:
+
+                self._scopes[-1].add(name)
+
+        return name
+    # endregion
@@ -0,0 +1,299 @@
+import re
+import json
+import inspect
+import numpy as np
+
+from time import perf_counter
+from functools import wraps
+from collections import deque
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__enabled__ = False
+__records__ = {}
+
+
+class ProfileRecord(object):
+    """
+    Base class used to accumulate timings for an instrumented function.
+    Only the most recent durations are kept in order to bound memory when profiling long sessions.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_name', '_calls', '_total', '_nodes', '_durations')
+
+    def __init__(self, name, maxSamples=1000):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :type maxSamples: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(ProfileRecord, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = name
+        self._calls = 0
+        self._total = 0.0
+        self._nodes = 0
+        self._durations = deque(maxlen=maxSamples)
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of the instrumented function.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @property
+    def calls(self):
+        """
+        Getter method that returns the number of recorded calls.
+
+        :rtype: int
+        """
+
+        return self._calls
+
+    @property
+    def total(self):
+        """
+        Getter method that returns the total recorded duration in seconds.
+
+        :rtype: float
+        """
+
+        return self._total
+
+    @property
+    def nodes(self):
+        """
+        Getter method that returns the total number of nodes passed to the instrumented function.
+
+        :rtype: int
+        """
+
+        return self._nodes
+    # endregion
+
+    # region Methods
+    def add(self, duration, nodes=0):
+        """
+        Records a call with the supplied duration.
+
+        :type duration: float
+        :type nodes: int
+        :rtype: None
+        """
+
+        self._calls += 1
+        self._total += duration
+        self._nodes += nodes
+        self._durations.append(duration)
+
+    def percentile(self, percent):
+        """
+        Returns the specified percentile from the recent durations.
+
+        :type percent: float
+        :rtype: float
+        """
+
+        return float(np.percentile(self._durations, percent)) if len(self._durations) > 0 else 0.0
+
+    def asDict(self):
+        """
+        Returns a summary of this record as a dictionary.
+
+        :rtype: Dict[str, Any]
+        """
+
+        return {
+            'name': self._name,
+            'calls': self._calls,
+            'total': self._total,
+            'mean': (self._total / self._calls) if self._calls > 0 else 0.0,
+            'p50': self.percentile(50.0),
+            'p90': self.percentile(90.0),
+            'p99': self.percentile(99.0),
+            'nodes': self._nodes
+        }
+    # endregion
+
+
+def isEnabled():
+    """
+    Evaluates if profiling is enabled.
+
+    :rtype: bool
+    """
+
+    return __enabled__
+
+
+def setEnabled(enabled):
+    """
+    Updates the profiling state.
+
+    :type enabled: bool
+    :rtype: None
+    """
+
+    global __enabled__
+    __enabled__ = bool(enabled)
+
+
+def countNodes(args):
+    """
+    Returns the number of nodes found in the supplied arguments.
+    Lists of nodes are counted by their length.
+
+    :type args: Tuple[Any]
+    :rtype: int
+    """
+
+    count = 0
+
+    for arg in args:
+
+        if hasattr(arg, 'hasFn'):
+
+            count += 1
+
+        elif isinstance(arg, (list, tuple)):
+
+            count += sum(1 for item in arg if hasattr(item, 'hasFn'))
+
+        else:
+
+            continue
+
+    return count
+
+
+def profile(func=None, name=None):
+    """
+    Returns a decorator that records the duration of every call to the supplied function.
+    Profiling is disabled by default, in which case the wrapper only checks a flag before calling through.
+
+    :type func: Union[Callable, None]
+    :type name: Union[str, None]
+    :rtype: Callable
+    """
+
+    # Check if decorator has arguments
+    #
+    if func is None:
+
+        return lambda func: profile(func, name=name)
+
+    # Check if function is already instrumented
+    #
+    if hasattr(func, '__profiled__'):
+
+        return func
+
+    name = name if name else f'{func.__module__}.{func.__qualname__}'
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+
+        if not __enabled__:
+
+            return func(*args, **kwargs)
+
+        startTime = perf_counter()
+
+        try:
+
+            return func(*args, **kwargs)
+
+        finally:
+
+            duration = perf_counter() - startTime
+
+            record = __records__.get(name, None)
+
+            if record is None:
+
+                record = ProfileRecord(name)
+                __records__[name] = record
+
+            record.add(duration, nodes=countNodes(args))
+
+    wrapper.__profiled__ = func
+
+    return wrapper
+
+
+def instrumentClass(cls, pattern):
+    """
+    Instruments the methods, defined on the supplied class, that match the specified pattern.
+    Only methods defined on the class itself are instrumented so inherited methods are not wrapped twice.
+
+    :type cls: type
+    :type pattern: str
+    :rtype: int
+    """
+
+    regex = re.compile(pattern)
+    count = 0
+
+    for (name, func) in list(cls.__dict__.items()):
+
+        if not inspect.isfunction(func) or not regex.match(name):
+
+            continue
+
+        setattr(cls, name, profile(func))
+        count += 1
+
+    return count
+
+
+def records():
+    """
+    Returns a summary of every record, sorted by total duration.
+
+    :rtype: List[Dict[str, Any]]
+    """
+
+    return sorted([record.asDict() for record in __records__.values()], key=lambda record: record['total'], reverse=True)
+
+
+def clearRecords():
+    """
+    Removes all records.
+
+    :rtype: None
+    """
+
+    __records__.clear()
+
+
+def exportRecords(filePath):
+    """
+    Exports a summary of every record to the specified JSON file.
+
+    :type filePath: str
+    :rtype: None
+    """
+
+    with open(filePath, 'w') as jsonFile:
+
+        log.info(f'Exporting profiling records to: {filePath}')
+        json.dump(records(), jsonFile, indent=4)
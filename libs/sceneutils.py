@@ -0,0 +1,54 @@
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+__scene__ = None
+
+
+def getScene():
+    """
+    Returns the scene that the bulk operations should act on.
+    If a headless scene is active then it is returned in place of the Maya scene.
+
+    :rtype: Union[mpyscene.MPyScene, headlessutils.HeadlessScene]
+    """
+
+    if __scene__ is not None:
+
+        return __scene__
+
+    try:
+
+        from mpy import mpyscene
+        return mpyscene.MPyScene()
+
+    except ImportError:
+
+        raise RuntimeError('getScene() expects an active headless scene when Maya is unavailable!')
+
+
+def setScene(scene):
+    """
+    Updates the active headless scene.
+    Supplying none restores the Maya scene.
+
+    :type scene: Union[headlessutils.HeadlessScene, None]
+    :rtype: None
+    """
+
+    global __scene__
+    __scene__ = scene
+
+
+def isHeadless(scene=None):
+    """
+    Evaluates if the supplied scene, or the active scene, is headless.
+
+    :type scene: Union[mpyscene.MPyScene, headlessutils.HeadlessScene, None]
+    :rtype: bool
+    """
+
+    scene = __scene__ if scene is None else scene
+    return getattr(scene, 'isHeadless', False)
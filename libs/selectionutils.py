@@ -0,0 +1,249 @@
+from maya.api import OpenMaya as om
+from mpy import mpynode
+from collections import OrderedDict
+from collections.abc import Sequence
+from . import profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class SelectionView(Sequence):
+    """
+    Overload of `Sequence` that lazily wraps the nodes inside a selection list.
+    Nodes are only wrapped when accessed and the most recent wrappers are cached.
+    Filtering by `om.MFn.kDependencyNode` is free, since every selected item has a dependency node, so length queries stay O(1).
+    """
+
+    # region Dunderscores
+    __max_cache_size__ = 256
+
+    def __init__(self, selection=None, apiType=om.MFn.kDependencyNode):
+        """
+        Private method called after a new instance has been created.
+
+        :type selection: Union[om.MSelectionList, None]
+        :type apiType: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SelectionView, self).__init__()
+
+        # Declare private variables
+        #
+        self._selection = om.MGlobal.getActiveSelectionList(orderedSelectionIfAvailable=True) if selection is None else selection
+        self._apiType = apiType
+        self._indices = None
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of selected nodes.
+
+        :rtype: int
+        """
+
+        if self.isUnfiltered():
+
+            return self._selection.length()
+
+        else:
+
+            return len(self.indices())
+
+    def __getitem__(self, index):
+        """
+        Private method that returns the node, or nodes, at the specified index.
+
+        :type index: Union[int, slice]
+        :rtype: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
+        """
+
+        # Check if this is a slice
+        #
+        if isinstance(index, slice):
+
+            return [self.getNode(i) for i in range(*index.indices(len(self)))]
+
+        # Resolve negative indices
+        #
+        size = len(self)
+
+        if index < 0:
+
+            index += size
+
+        if not (0 <= index < size):
+
+            raise IndexError('__getitem__() index is out of range!')
+
+        return self.getNode(index)
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the selected nodes.
+
+        :rtype: Iterator[mpynode.MPyNode]
+        """
+
+        for i in range(len(self)):
+
+            yield self.getNode(i)
+
+    def __bool__(self):
+        """
+        Private method that evaluates if the selection is not empty.
+
+        :rtype: bool
+        """
+
+        return len(self) > 0
+    # endregion
+
+    # region Properties
+    @property
+    def selection(self):
+        """
+        Getter method that returns the internal selection list.
+
+        :rtype: om.MSelectionList
+        """
+
+        return self._selection
+
+    @property
+    def apiType(self):
+        """
+        Getter method that returns the type filter.
+
+        :rtype: int
+        """
+
+        return self._apiType
+    # endregion
+
+    # region Methods
+    def isUnfiltered(self):
+        """
+        Evaluates if every item in the selection list passes the type filter.
+
+        :rtype: bool
+        """
+
+        return self._apiType == om.MFn.kDependencyNode or self._apiType == om.MFn.kBase
+
+    @profileutils.profile
+    def indices(self):
+        """
+        Returns the selection list indices that pass the type filter.
+        The indices are evaluated once without wrapping any nodes.
+
+        :rtype: List[int]
+        """
+
+        if self._indices is None:
+
+            self._indices = [i for i in range(self._selection.length()) if self._selection.getDependNode(i).hasFn(self._apiType)]
+
+        return self._indices
+
+    def getObject(self, index):
+        """
+        Returns the dependency node at the specified index.
+
+        :type index: int
+        :rtype: om.MObject
+        """
+
+        return self._selection.getDependNode(index if self.isUnfiltered() else self.indices()[index])
+
+    def getNode(self, index):
+        """
+        Returns the wrapped node at the specified index.
+
+        :type index: int
+        :rtype: mpynode.MPyNode
+        """
+
+        # Check if node is already cached
+        #
+        node = self._cache.get(index, None)
+
+        if node is not None:
+
+            self._cache.move_to_end(index)
+            return node
+
+        # Wrap node and trim cache
+        #
+        node = mpynode.MPyNode(self.getObject(index))
+        self._cache[index] = node
+
+        if len(self._cache) > self.__max_cache_size__:
+
+            self._cache.popitem(last=False)
+
+        return node
+
+    @profileutils.profile
+    def first(self, apiType=None):
+        """
+        Returns the first selected node that passes the optional type filter.
+        Only the matching node is wrapped and its wrapper is cached.
+
+        :type apiType: Union[int, None]
+        :rtype: Union[mpynode.MPyNode, None]
+        """
+
+        # Check if an additional filter was supplied
+        #
+        if apiType is None:
+
+            return self.getNode(0) if len(self) > 0 else None
+
+        # Iterate through selection
+        #
+        for i in range(len(self)):
+
+            obj = self.getObject(i)
+
+            if obj.hasFn(apiType):
+
+                return self.getNode(i)
+
+        return None
+
+    def last(self):
+        """
+        Returns the last selected node.
+
+        :rtype: Union[mpynode.MPyNode, None]
+        """
+
+        size = len(self)
+        return self.getNode(size - 1) if size > 0 else None
+
+    def filter(self, apiType):
+        """
+        Returns a new view that only contains nodes compatible with the specified type.
+
+        :type apiType: int
+        :rtype: SelectionView
+        """
+
+        return self.__class__(self._selection, apiType=apiType)
+
+    @profileutils.profile
+    def nodes(self):
+        """
+        Returns every selected node as a list.
+
+        :rtype: List[mpynode.MPyNode]
+        """
+
+        return list(self)
+    # endregion
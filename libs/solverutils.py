@@ -0,0 +1,849 @@
+import math
+import numpy as np
+
+from . import PivotMode
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+ROTATE_ORDERS = ((0, 1, 2), (1, 2, 0), (2, 0, 1), (0, 2, 1), (1, 0, 2), (2, 1, 0))  # Indexed by Maya's rotate-order enum
+
+
+def asPointArray(points):
+    """
+    Returns the supplied points as an (N, 3) float array.
+
+    :type points: Union[np.ndarray, List[Tuple[float, float, float]]]
+    :rtype: np.ndarray
+    """
+
+    return np.asarray(points, dtype=float).reshape(-1, 3)
+
+
+def asScalarArray(values, size):
+    """
+    Returns the supplied values broadcast to an (N,) float array.
+
+    :type values: Union[float, np.ndarray, List[float]]
+    :type size: int
+    :rtype: np.ndarray
+    """
+
+    return np.array(np.broadcast_to(np.asarray(values, dtype=float), (size,)))
+
+
+def normalizeVectors(vectors):
+    """
+    Returns the supplied vectors normalized along the last axis.
+    Zero-length vectors are returned unchanged, mirroring `om.MVector.normal`.
+
+    :type vectors: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    safeLengths = np.where(lengths > 0.0, lengths, 1.0)
+
+    return vectors / safeLengths
+
+
+def createIdentityMatrices(size):
+    """
+    Returns an (N, 4, 4) array of identity matrices.
+
+    :type size: int
+    :rtype: np.ndarray
+    """
+
+    return np.tile(np.eye(4), (size, 1, 1))
+
+
+def createTranslateMatrices(translations):
+    """
+    Returns an (N, 4, 4) array of translation matrices.
+    Matrices are row-major in order to match Maya's convention.
+
+    :type translations: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    translations = asPointArray(translations)
+
+    matrices = createIdentityMatrices(len(translations))
+    matrices[:, 3, :3] = translations
+
+    return matrices
+
+
+def createRotationXMatrices(radians):
+    """
+    Returns an (N, 4, 4) array of rotation matrices around the X axis.
+
+    :type radians: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    radians = np.asarray(radians, dtype=float).reshape(-1)
+    cosines, sines = np.cos(radians), np.sin(radians)
+
+    matrices = createIdentityMatrices(len(radians))
+    matrices[:, 1, 1] = cosines
+    matrices[:, 1, 2] = sines
+    matrices[:, 2, 1] = -sines
+    matrices[:, 2, 2] = cosines
+
+    return matrices
+
+
+def createRotationZMatrices(radians):
+    """
+    Returns an (N, 4, 4) array of rotation matrices around the Z axis.
+
+    :type radians: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    radians = np.asarray(radians, dtype=float).reshape(-1)
+    cosines, sines = np.cos(radians), np.sin(radians)
+
+    matrices = createIdentityMatrices(len(radians))
+    matrices[:, 0, 0] = cosines
+    matrices[:, 0, 1] = sines
+    matrices[:, 1, 0] = -sines
+    matrices[:, 1, 1] = cosines
+
+    return matrices
+
+
+def createAimMatrices(forwardVectors, upVectors, origins=None, upAxisSign=1):
+    """
+    Returns an (N, 4, 4) array of aim matrices with X forward and Y up.
+    This mirrors `transformutils.createAimMatrix(0, forwardVector, 1, upVector, origin=origin, upAxisSign=upAxisSign)`.
+
+    :type forwardVectors: np.ndarray
+    :type upVectors: np.ndarray
+    :type origins: Union[np.ndarray, None]
+    :type upAxisSign: int
+    :rtype: np.ndarray
+    """
+
+    # Orthogonalize axis vectors
+    #
+    forwardVectors = normalizeVectors(asPointArray(forwardVectors))
+    upVectors = normalizeVectors(asPointArray(upVectors)) * upAxisSign
+
+    rightVectors = normalizeVectors(np.cross(forwardVectors, upVectors))
+    upVectors = normalizeVectors(np.cross(rightVectors, forwardVectors))
+
+    # Compose matrices
+    #
+    size = len(forwardVectors)
+    matrices = createIdentityMatrices(size)
+    matrices[:, 0, :3] = forwardVectors
+    matrices[:, 1, :3] = upVectors
+    matrices[:, 2, :3] = rightVectors
+
+    if origins is not None:
+
+        matrices[:, 3, :3] = asPointArray(origins)
+
+    return matrices
+
+
+def solveIk2BoneChains(startPoints, startLengths, endPoints, endLengths, poleVectors, twists=0.0):
+    """
+    Solves for multiple 2-bone chains at once using the supplied arrays.
+    This is the batched equivalent of `kinematicutils.solveIk2BoneChain` and shares its conventions: X is forward and -Y is up.
+    Points and pole vectors are expected as (N, 3) arrays while lengths and twists can either be scalars or (N,) arrays.
+    Unreachable configurations, where the aim length is shorter than the difference between both bones, are clamped rather than raising!
+
+    :type startPoints: np.ndarray
+    :type startLengths: Union[float, np.ndarray]
+    :type endPoints: np.ndarray
+    :type endLengths: Union[float, np.ndarray]
+    :type poleVectors: np.ndarray
+    :type twists: Union[float, np.ndarray]
+    :rtype: np.ndarray
+    """
+
+    # Normalize inputs
+    #
+    startPoints = asPointArray(startPoints)
+    endPoints = asPointArray(endPoints)
+
+    size = len(startPoints)
+    startLengths = asScalarArray(startLengths, size)
+    endLengths = asScalarArray(endLengths, size)
+    poleVectors = np.broadcast_to(asPointArray(poleVectors), (size, 3))
+    twists = asScalarArray(twists, size)
+
+    # Compose aim matrices
+    #
+    aimVectors = endPoints - startPoints
+    aimMatrices = np.matmul(createRotationXMatrices(twists), createAimMatrices(aimVectors, poleVectors, origins=startPoints, upAxisSign=-1))
+
+    # Calculate angles
+    # Be sure to compensate for hyper-extension!
+    # Straight chains resolve to a zero start angle and a PI end angle which collapses the rotations to identity.
+    #
+    chainLengths = startLengths + endLengths
+    aimLengths = np.linalg.norm(aimVectors, axis=-1)
+    isBent = aimLengths < chainLengths
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+
+        startCosines = ((startLengths ** 2.0) + (aimLengths ** 2.0) - (endLengths ** 2.0)) / (2.0 * startLengths * aimLengths)
+        endCosines = ((endLengths ** 2.0) + (startLengths ** 2.0) - (aimLengths ** 2.0)) / (2.0 * endLengths * startLengths)
+
+    startRadians = np.where(isBent, np.arccos(np.clip(np.nan_to_num(startCosines, nan=1.0), -1.0, 1.0)), 0.0)
+    endRadians = np.where(isBent, np.arccos(np.clip(np.nan_to_num(endCosines, nan=-1.0), -1.0, 1.0)), math.pi)
+
+    # Compose joint matrices
+    #
+    startOffsets = np.zeros((size, 3))
+    startOffsets[:, 0] = startLengths
+
+    endOffsets = np.zeros((size, 3))
+    endOffsets[:, 0] = endLengths
+
+    matrices = np.empty((size, 3, 4, 4))
+    matrices[:, 0] = np.matmul(createRotationZMatrices(-startRadians), aimMatrices)
+    matrices[:, 1] = np.matmul(np.matmul(createRotationZMatrices(math.pi - endRadians), createTranslateMatrices(startOffsets)), matrices[:, 0])
+    matrices[:, 2] = np.matmul(createTranslateMatrices(endOffsets), matrices[:, 1])
+
+    return matrices
+
+
+def calculateSoftLengths(distances, chainLengths, softDistances):
+    """
+    Returns the softened lengths for the supplied aim distances.
+    All arguments are broadcast against each other so any combination of scalars and arrays is supported.
+    A soft distance of zero resolves to the hard limit of the chain rather than dividing by zero.
+
+    :type distances: Union[float, np.ndarray]
+    :type chainLengths: Union[float, np.ndarray]
+    :type softDistances: Union[float, np.ndarray]
+    :rtype: np.ndarray
+    """
+
+    # Calculate soft threshold
+    #
+    distances = np.asarray(distances, dtype=float)
+    softDistances = np.asarray(softDistances, dtype=float)
+    thresholds = np.fabs(chainLengths) - softDistances
+
+    # Calculate soft values
+    #
+    isSoft = softDistances > 0.0
+    safeSoftDistances = np.where(isSoft, softDistances, 1.0)
+
+    with np.errstate(over='ignore'):
+
+        softLengths = (safeSoftDistances * (1.0 - np.exp(-(distances - thresholds) / safeSoftDistances))) + thresholds
+
+    softLengths = np.where(isSoft, softLengths, np.minimum(distances, thresholds))
+
+    return np.where((distances >= 0.0) & (distances < thresholds), distances, softLengths)
+
+
+def solveSoftIks(startPoints, endPoints, chainLengths, softDistances):
+    """
+    Solves for multiple soft end effectors at once.
+    This is the batched equivalent of `kinematicutils.solveSoftIk` and returns the softened end points along with the soft scales for stretching.
+
+    :type startPoints: np.ndarray
+    :type endPoints: np.ndarray
+    :type chainLengths: Union[float, np.ndarray]
+    :type softDistances: Union[float, np.ndarray]
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    # Calculate aim vectors
+    #
+    startPoints = asPointArray(startPoints)
+    endPoints = asPointArray(endPoints)
+
+    size = len(startPoints)
+    chainLengths = asScalarArray(chainLengths, size)
+    softDistances = asScalarArray(softDistances, size)
+
+    aimVectors = endPoints - startPoints
+    distances = np.linalg.norm(aimVectors, axis=-1)
+
+    # Calculate soft values
+    #
+    softLengths = calculateSoftLengths(distances, chainLengths, softDistances)
+    softOffsets = distances - softLengths
+
+    # Calculate soft ratios for scaling
+    #
+    with np.errstate(divide='ignore', invalid='ignore'):
+
+        softScales = np.where(softLengths != 0.0, distances / softLengths, 1.0)
+
+    # Multiply outputs by direction vectors
+    #
+    forwardVectors = normalizeVectors(aimVectors)
+    softEndPoints = endPoints - (forwardVectors * softOffsets[:, None])
+
+    return softEndPoints, softScales
+
+
+def sampleSoftIkCurve(chainLength, softDistances, numSamples=100, maxDistance=None):
+    """
+    Samples the distance-to-output curve for each of the supplied soft distances.
+    The returned distances are shaped (S,) while the outputs are shaped (M, S), one row per soft distance.
+    By default, the curve is sampled up to 1.5 times the chain length.
+
+    :type chainLength: float
+    :type softDistances: Union[float, np.ndarray]
+    :type numSamples: int
+    :type maxDistance: Union[float, None]
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    maxDistance = (math.fabs(chainLength) * 1.5) if maxDistance is None else maxDistance
+
+    distances = np.linspace(0.0, maxDistance, num=numSamples)
+    softDistances = np.asarray(softDistances, dtype=float).reshape(-1, 1)
+
+    return distances, calculateSoftLengths(distances[None, :], chainLength, softDistances)
+
+
+
+def createRotationMatrices(radians, rotateOrder=0):
+    """
+    Returns an (N, 3, 3) array of rotation matrices from the supplied (N, 3) euler angles.
+    The rotate order follows Maya's enum: xyz, yzx, zxy, xzy, yxz and zyx.
+
+    :type radians: np.ndarray
+    :type rotateOrder: int
+    :rtype: np.ndarray
+    """
+
+    # Compose axis matrices
+    #
+    radians = asPointArray(radians)
+    cosines, sines = np.cos(radians), np.sin(radians)
+
+    size = len(radians)
+    axisMatrices = np.tile(np.eye(3), (3, size, 1, 1))
+
+    for axis in range(3):
+
+        j, k = (axis + 1) % 3, (axis + 2) % 3
+
+        axisMatrices[axis, :, j, j] = cosines[:, axis]
+        axisMatrices[axis, :, j, k] = sines[:, axis]
+        axisMatrices[axis, :, k, j] = -sines[:, axis]
+        axisMatrices[axis, :, k, k] = cosines[:, axis]
+
+    # Multiply matrices in rotate order
+    #
+    i, j, k = ROTATE_ORDERS[rotateOrder]
+
+    return np.matmul(np.matmul(axisMatrices[i], axisMatrices[j]), axisMatrices[k])
+
+
+def decomposeRotationMatrices(matrices, rotateOrder=0):
+    """
+    Returns the (N, 3) euler angles from the supplied (N, 3, 3) rotation matrices.
+    The rotate order follows Maya's enum: xyz, yzx, zxy, xzy, yxz and zyx.
+
+    :type matrices: np.ndarray
+    :type rotateOrder: int
+    :rtype: np.ndarray
+    """
+
+    # Transpose matrices into column-major order
+    # This way the rotations read from right to left in rotate order
+    #
+    matrices = np.swapaxes(np.asarray(matrices, dtype=float).reshape(-1, 3, 3), -1, -2)
+
+    i, j, k = ROTATE_ORDERS[rotateOrder]
+    parity = 1.0 if (j - i) % 3 == 1 else -1.0
+
+    # Extract angles
+    #
+    radians = np.empty((len(matrices), 3))
+    radians[:, j] = np.arcsin(np.clip(-parity * matrices[:, k, i], -1.0, 1.0))
+    radians[:, i] = np.arctan2(parity * matrices[:, k, j], matrices[:, k, k])
+    radians[:, k] = np.arctan2(parity * matrices[:, j, i], matrices[:, i, i])
+
+    return radians
+
+
+def calculatePoleVectors(startPoints, midPoints, endPoints):
+    """
+    Returns the (N, 3) pole vectors for the supplied 3-point chains.
+    This is the batched equivalent of `kinematicutils.calculatePoleVector`.
+
+    :type startPoints: np.ndarray
+    :type midPoints: np.ndarray
+    :type endPoints: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    startPoints = asPointArray(startPoints)
+    forwardVectors = normalizeVectors(asPointArray(endPoints) - startPoints)
+    crossProducts = np.cross(normalizeVectors(asPointArray(midPoints) - startPoints), forwardVectors)
+
+    return np.cross(forwardVectors, crossProducts)
+
+
+def fit2BoneIKto3BoneIKs(points):
+    """
+    Returns the (N, 3, 3) points for the 3-bone IK hack on the supplied (N, M, 3) chains.
+    This is the batched equivalent of `kinematicutils.fit2BoneIKto3BoneIK`.
+    Straight chains, where the fitted length is undefined, return NaN for the middle points.
+
+    :type points: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    points = np.asarray(points, dtype=float)
+
+    chainLengths = np.linalg.norm(np.diff(points, axis=1), axis=-1).sum(axis=-1)
+    initialVectors = normalizeVectors(points[:, 1] - points[:, 0])
+    aimVectors = points[:, -1] - points[:, 0]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+
+        lengths = (np.einsum('ij,ij->i', aimVectors, aimVectors) - (chainLengths ** 2.0)) / (2.0 * (np.einsum('ij,ij->i', aimVectors, initialVectors) - chainLengths))
+
+    lengths = np.where(np.isfinite(lengths), lengths, np.nan)
+
+    return np.stack([points[:, 0], points[:, 0] + (initialVectors * lengths[:, None]), points[:, -1]], axis=1)
+
+
+def perpendicularVectors(vectors):
+    """
+    Returns unit vectors perpendicular to the supplied (N, 3) vectors.
+    The world Y axis is used as a reference unless a vector is parallel to it, in which case the world Z axis is used.
+
+    :type vectors: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    vectors = normalizeVectors(asPointArray(vectors))
+    references = np.where(np.abs(vectors[:, 1:2]) < 0.99, np.array([[0.0, 1.0, 0.0]]), np.array([[0.0, 0.0, 1.0]]))
+
+    return normalizeVectors(np.cross(vectors, references))
+
+
+def resolveDirections(directions, fallbackDirections, tolerance=1e-9):
+    """
+    Returns the supplied (N, 3) directions normalized, replacing any degenerate directions with the fallback directions.
+
+    :type directions: np.ndarray
+    :type fallbackDirections: np.ndarray
+    :type tolerance: float
+    :rtype: np.ndarray
+    """
+
+    lengths = np.linalg.norm(directions, axis=-1, keepdims=True)
+    return np.where(lengths > tolerance, directions / np.where(lengths > tolerance, lengths, 1.0), fallbackDirections)
+
+
+def rotatePoints(points, pivots, axes, radians):
+    """
+    Rotates the supplied (M, K, 3) points around the (M, 3) pivots using the (M, 3) axes and (M,) angles.
+    Zero-length axes leave the points unchanged regardless of the angle.
+
+    :type points: np.ndarray
+    :type pivots: np.ndarray
+    :type axes: np.ndarray
+    :type radians: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    # Ignore any rotations without a valid axis
+    #
+    axes = np.asarray(axes, dtype=float)
+    radians = np.where(np.linalg.norm(axes, axis=-1) > 0.0, radians, 0.0)
+
+    # Rodrigues' rotation formula
+    #
+    axes = normalizeVectors(axes)[:, None, :]
+    cosines, sines = np.cos(radians)[:, None, None], np.sin(radians)[:, None, None]
+
+    vectors = points - pivots[:, None, :]
+    dotProducts = np.sum(vectors * axes, axis=-1, keepdims=True)
+
+    rotatedVectors = (vectors * cosines) + (np.cross(axes, vectors) * sines) + (axes * dotProducts * (1.0 - cosines))
+
+    return pivots[:, None, :] + rotatedVectors
+
+
+def calculateChainErrors(points, lengths, targetPoints):
+    """
+    Returns the (M,) errors for the supplied (M, N, 3) chains.
+    The error is the larger of the distance to the target and the largest change in bone length, so collapsed bones are never reported as converged.
+
+    :type points: np.ndarray
+    :type lengths: np.ndarray
+    :type targetPoints: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    targetErrors = np.linalg.norm(points[:, -1] - targetPoints, axis=-1)
+    lengthErrors = np.abs(np.linalg.norm(np.diff(points, axis=1), axis=-1) - lengths).max(axis=-1)
+
+    return np.maximum(targetErrors, lengthErrors)
+
+
+def solveFabrikChains(points, targetPoints, poleVectors=None, tolerance=1e-4, maxIterations=20, ccdIterations=0):
+    """
+    Solves for multiple N-bone chains at once using FABRIK with optional CCD refinement.
+    Points are expected as an (M, N, 3) array with the root first while the targets are shaped (M, 3).
+    If pole vectors are supplied then each chain is bent towards, and constrained to the plane spanned by, its aim and pole vector.
+    Chains that cannot reach their target are straightened towards it.
+    The returned errors include any change in bone length, see `calculateChainErrors`.
+
+    :type points: np.ndarray
+    :type targetPoints: np.ndarray
+    :type poleVectors: Union[np.ndarray, None]
+    :type tolerance: float
+    :type maxIterations: int
+    :type ccdIterations: int
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+
+    # Inspect number of joints
+    #
+    points = np.array(points, dtype=float)
+
+    if points.ndim != 3 or points.shape[1] < 2:
+
+        raise TypeError(f'solveFabrikChains() expects an (M, N, 3) array with at least 2 joints ({points.shape} given)!')
+
+    numChains, numJoints = points.shape[0], points.shape[1]
+    targetPoints = np.broadcast_to(asPointArray(targetPoints), (numChains, 3))
+
+    # Calculate bone lengths
+    #
+    lengths = np.linalg.norm(np.diff(points, axis=1), axis=-1)
+    chainLengths = lengths.sum(axis=-1)
+
+    rootPoints = np.array(points[:, 0])
+    aimVectors = targetPoints - rootPoints
+    isReachable = np.linalg.norm(aimVectors, axis=-1) < chainLengths
+
+    forwardVectors = resolveDirections(aimVectors, normalizeVectors(points[:, -1] - rootPoints))
+    forwardVectors = resolveDirections(forwardVectors, np.array([[1.0, 0.0, 0.0]]))
+
+    # Evaluate bend directions
+    # Pole vectors are made perpendicular to the aim so they can seed a bend
+    #
+    planeNormals = None
+    bendVectors = perpendicularVectors(forwardVectors)
+
+    if poleVectors is not None:
+
+        poleVectors = np.broadcast_to(asPointArray(poleVectors), (numChains, 3))
+        poleVectors = poleVectors - (np.sum(poleVectors * forwardVectors, axis=-1, keepdims=True) * forwardVectors)
+
+        bendVectors = resolveDirections(poleVectors, bendVectors)
+        planeNormals = normalizeVectors(np.cross(forwardVectors, bendVectors))
+
+    # Straighten any unreachable chains
+    #
+    offsets = np.concatenate([np.zeros((numChains, 1)), np.cumsum(lengths, axis=-1)], axis=-1)
+
+    straightPoints = rootPoints[:, None, :] + (forwardVectors[:, None, :] * offsets[:, :, None])
+    points[~isReachable] = straightPoints[~isReachable]
+
+    # Seed a bend on any reachable chains that are straight or bent away from their pole
+    # Without a bend, FABRIK and CCD cannot fold a collinear chain!
+    #
+    if numJoints > 2:
+
+        interiorVectors = points[:, 1:-1] - rootPoints[:, None, :]
+        interiorVectors -= np.sum(interiorVectors * forwardVectors[:, None, :], axis=-1, keepdims=True) * forwardVectors[:, None, :]
+
+        bendDistances = np.sum(interiorVectors * bendVectors[:, None, :], axis=-1).max(axis=-1)
+        isDegenerate = np.linalg.norm(interiorVectors, axis=-1).max(axis=-1) <= (tolerance * chainLengths)
+        requiresBend = isReachable & ((bendDistances <= 0.0) if poleVectors is not None else isDegenerate)
+
+        weights = np.sin(np.pi * (offsets[:, 1:-1] / np.where(chainLengths > 0.0, chainLengths, 1.0)[:, None]))
+        seedPoints = straightPoints[:, 1:-1] + (bendVectors[:, None, :] * (weights * chainLengths[:, None] * 0.25)[:, :, None])
+
+        points[requiresBend, 1:-1] = seedPoints[requiresBend]
+
+    # Iterate until all reachable chains converge
+    #
+    errors = calculateChainErrors(points, lengths, targetPoints)
+    isActive = isReachable & (errors > tolerance)
+
+    for iteration in range(maxIterations):
+
+        # Check if any chains are still active
+        #
+        if not np.any(isActive):
+
+            break
+
+        activePoints = points[isActive]
+        activeLengths = lengths[isActive]
+        activeForwards = forwardVectors[isActive]
+
+        # Project inbetween joints onto constraint planes
+        #
+        if planeNormals is not None:
+
+            activeNormals = planeNormals[isActive][:, None, :]
+            activeOffsets = np.sum((activePoints[:, 1:-1] - activePoints[:, :1]) * activeNormals, axis=-1, keepdims=True)
+
+            activePoints[:, 1:-1] -= activeOffsets * activeNormals
+
+        # Backward pass from target to root
+        # Degenerate directions fall back to the previous bone's direction
+        #
+        activePoints[:, -1] = targetPoints[isActive]
+        directions = -activeForwards
+
+        for i in range(numJoints - 2, -1, -1):
+
+            directions = resolveDirections(activePoints[:, i] - activePoints[:, i + 1], directions)
+            activePoints[:, i] = activePoints[:, i + 1] + (directions * activeLengths[:, i, None])
+
+        # Forward pass from root to target
+        #
+        activePoints[:, 0] = rootPoints[isActive]
+        directions = activeForwards
+
+        for i in range(numJoints - 1):
+
+            directions = resolveDirections(activePoints[:, i + 1] - activePoints[:, i], directions)
+            activePoints[:, i + 1] = activePoints[:, i] + (directions * activeLengths[:, i, None])
+
+        # Update convergence
+        #
+        points[isActive] = activePoints
+        errors = calculateChainErrors(points, lengths, targetPoints)
+        isActive = isReachable & (errors > tolerance)
+
+    # Refine any remaining chains using CCD
+    # Opposing end and target vectors fall back to the bend plane's normal as their rotation axis
+    #
+    for iteration in range(ccdIterations):
+
+        if not np.any(isActive):
+
+            break
+
+        activePoints = points[isActive]
+        activeTargets = targetPoints[isActive]
+        fallbackAxes = planeNormals[isActive] if planeNormals is not None else normalizeVectors(np.cross(forwardVectors[isActive], bendVectors[isActive]))
+
+        for i in range(numJoints - 2, -1, -1):
+
+            pivots = activePoints[:, i]
+            endVectors = normalizeVectors(activePoints[:, -1] - pivots)
+            targetVectors = normalizeVectors(activeTargets - pivots)
+
+            axes = resolveDirections(np.cross(endVectors, targetVectors), fallbackAxes)
+            radians = np.arccos(np.clip(np.sum(endVectors * targetVectors, axis=-1), -1.0, 1.0))
+
+            activePoints[:, i + 1:] = rotatePoints(activePoints[:, i + 1:], pivots, axes, radians)
+
+        points[isActive] = activePoints
+        errors = calculateChainErrors(points, lengths, targetPoints)
+        isActive = isReachable & (errors > tolerance)
+
+    return points, errors
+
+
+def solveFabrikChain(points, targetPoint, poleVector=None, tolerance=1e-4, maxIterations=20, ccdIterations=0):
+    """
+    Solves for an N-bone chain using FABRIK with optional CCD refinement.
+    Points are expected as an (N, 3) array with the root first.
+    This method returns the solved points along with the remaining distance to the target.
+
+    :type points: np.ndarray
+    :type targetPoint: Union[np.ndarray, Tuple[float, float, float]]
+    :type poleVector: Union[np.ndarray, Tuple[float, float, float], None]
+    :type tolerance: float
+    :type maxIterations: int
+    :type ccdIterations: int
+    :rtype: Tuple[np.ndarray, float]
+    """
+
+    points, errors = solveFabrikChains(
+        asPointArray(points)[None, :, :],
+        asPointArray(targetPoint),
+        poleVectors=(None if poleVector is None else asPointArray(poleVector)),
+        tolerance=tolerance,
+        maxIterations=maxIterations,
+        ccdIterations=ccdIterations
+    )
+
+    return points[0], float(errors[0])
+
+
+def fitChainPlanes(points):
+    """
+    Returns the (M, 3) normals of the least-squares planes through the supplied (M, N, 3) chains.
+    Normals are derived from the smallest singular vector of each centered chain.
+
+    :type points: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    points = np.asarray(points, dtype=float)
+    centeredPoints = points - points.mean(axis=1, keepdims=True)
+
+    u, s, vh = np.linalg.svd(centeredPoints, full_matrices=False)
+
+    return vh[:, -1]
+
+
+def calculateChainPoleVectors(points, fallbackVectors=None, tolerance=1e-6):
+    """
+    Returns the normalized (M, 3) pole vectors for the supplied (M, N, 3) chains.
+    Unlike `calculatePoleVectors`, every joint contributes to the chain plane through a least-squares fit.
+    Collinear chains fall back on the supplied vectors, such as the start joint's up axis, or else the world axis least aligned with the chain.
+
+    :type points: np.ndarray
+    :type fallbackVectors: Union[np.ndarray, None]
+    :type tolerance: float
+    :rtype: np.ndarray
+    """
+
+    # Inspect number of joints
+    #
+    points = np.asarray(points, dtype=float)
+
+    if points.ndim != 3 or points.shape[1] < 2:
+
+        raise TypeError(f'calculateChainPoleVectors() expects an (M, N, 3) array with at least 2 joints ({points.shape} given)!')
+
+    numChains = points.shape[0]
+
+    # Calculate inbetween offsets from the aim line
+    #
+    startPoints, endPoints = points[:, 0], points[:, -1]
+    forwardVectors = normalizeVectors(endPoints - startPoints)
+
+    vectors = points[:, 1:-1] - startPoints[:, None, :]
+    offsets = vectors - (np.sum(vectors * forwardVectors[:, None, :], axis=-1, keepdims=True) * forwardVectors[:, None, :])
+
+    chainLengths = np.linalg.norm(np.diff(points, axis=1), axis=-1).sum(axis=-1)
+    maxOffsets = np.linalg.norm(offsets, axis=-1).max(axis=-1, initial=0.0)
+
+    isCollinear = maxOffsets <= (tolerance * np.maximum(chainLengths, 1.0))
+
+    # Derive pole vectors from fitted planes
+    # Be sure to flip any pole vectors that point away from the bend!
+    #
+    planeNormals = fitChainPlanes(points)
+    poleVectors = normalizeVectors(np.cross(planeNormals, forwardVectors))
+
+    bendVectors = offsets.sum(axis=1)
+    signs = np.where(np.sum(poleVectors * bendVectors, axis=-1) < 0.0, -1.0, 1.0)
+    poleVectors *= signs[:, None]
+
+    # Evaluate fallback vectors for collinear chains
+    #
+    if fallbackVectors is None:
+
+        axes = np.argmin(np.fabs(forwardVectors), axis=-1)
+        fallbackVectors = np.eye(3)[axes]
+
+    else:
+
+        fallbackVectors = np.broadcast_to(asPointArray(fallbackVectors), (numChains, 3))
+
+    fallbackVectors = fallbackVectors - (np.sum(fallbackVectors * forwardVectors, axis=-1, keepdims=True) * forwardVectors)
+    poleVectors[isCollinear] = normalizeVectors(fallbackVectors)[isCollinear]
+
+    return poleVectors
+
+
+def calculatePolePositions(points, poleVectors=None, distance=None, fallbackVectors=None):
+    """
+    Returns the (M, 3) pole positions for the supplied (M, N, 3) chains.
+    Positions are offset from the inbetween joints, projected onto the aim line, along each pole vector.
+    If no distance is supplied then the chain length is used instead.
+
+    :type points: np.ndarray
+    :type poleVectors: Union[np.ndarray, None]
+    :type distance: Union[float, np.ndarray, None]
+    :type fallbackVectors: Union[np.ndarray, None]
+    :rtype: np.ndarray
+    """
+
+    # Evaluate pole vectors
+    #
+    points = np.asarray(points, dtype=float)
+    numChains = points.shape[0]
+
+    if poleVectors is None:
+
+        poleVectors = calculateChainPoleVectors(points, fallbackVectors=fallbackVectors)
+
+    # Evaluate pole distances
+    #
+    if distance is None:
+
+        distances = np.linalg.norm(np.diff(points, axis=1), axis=-1).sum(axis=-1)
+
+    else:
+
+        distances = asScalarArray(distance, numChains)
+
+    # Project inbetween centroids onto aim lines
+    #
+    startPoints, endPoints = points[:, 0], points[:, -1]
+    forwardVectors = normalizeVectors(endPoints - startPoints)
+
+    centroids = points[:, 1:-1].mean(axis=1) if points.shape[1] > 2 else (startPoints + endPoints) * 0.5
+    basePoints = startPoints + (np.sum((centroids - startPoints) * forwardVectors, axis=-1, keepdims=True) * forwardVectors)
+
+    return basePoints + (normalizeVectors(asPointArray(poleVectors)) * distances[:, None])
+
+
+def transformPoints(points, matrix):
+    """
+    Returns the supplied points multiplied by the specified (4, 4) row-major matrix.
+    Every point is transformed in a single matrix product.
+
+    :type points: np.ndarray
+    :type matrix: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    matrix = np.asarray(matrix, dtype=float).reshape(4, 4)
+    return (asPointArray(points) @ matrix[:3, :3]) + matrix[3, :3]
+
+
+def calculatePivot(points, pivotMode=PivotMode.BOUNDING_BOX):
+    """
+    Returns the pivot for the supplied points.
+    The bounding-box pivot is the centre of the axis-aligned bounds, the centroid is the mean and the median is evaluated per axis.
+
+    :type points: np.ndarray
+    :type pivotMode: PivotMode
+    :rtype: np.ndarray
+    """
+
+    points = asPointArray(points)
+
+    if len(points) == 0:
+
+        return np.zeros(3)
+
+    if pivotMode == PivotMode.CENTROID:
+
+        return points.mean(axis=0)
+
+    elif pivotMode == PivotMode.MEDIAN:
+
+        return np.median(points, axis=0)
+
+    else:
+
+        return (points.min(axis=0) + points.max(axis=0)) * 0.5
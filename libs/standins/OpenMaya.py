@@ -0,0 +1,623 @@
+import math
+import numpy as np
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class MFn(object):
+    """
+    Stand-in for `om.MFn` that declares the function set constants referenced by rigomatic.
+    The constants shared with `headlessutils.HeadlessFn` use the same values so headless nodes can evaluate them directly.
+    """
+
+    kDependencyNode = 0
+    kDagNode = 1
+    kTransform = 2
+    kJoint = 3
+    kShape = 4
+    kLocator = 5
+    kPluginLocatorNode = 6
+    kCurve = 7
+    kNurbsCurve = 8
+    kMesh = 9
+    kSurface = 10
+    kConstraint = 11
+    kPluginConstraintNode = 12
+    kIkHandle = 13
+    kBase = 100
+    kWorld = 101
+    kAnimCurve = 102
+    kBezierCurve = 103
+    kSkinClusterFilter = 104
+    kFileTexture = 105
+    kMeshVertComponent = 106
+    kMeshEdgeComponent = 107
+    kNumericAttribute = 108
+    kUnitAttribute = 109
+    kEnumAttribute = 110
+    kIkSolver = 111
+    kSCsolver = 112
+    kRPsolver = 113
+    kSplineSolver = 114
+    kPluginIkSolver = 115
+    kHikSolver = 116
+    kMCsolver = 117
+
+
+class MSpace(object):
+    """
+    Stand-in for `om.MSpace` that declares the transform space constants.
+    """
+
+    kInvalid = 0
+    kTransform = 1
+    kPreTransform = 2
+    kObject = 2
+    kPostTransform = 3
+    kWorld = 4
+
+
+class MFnNumericData(object):
+    """
+    Stand-in for `om.MFnNumericData` that declares the numeric type constants.
+    """
+
+    kInvalid = 0
+    kBoolean = 1
+    kByte = 2
+    kChar = 3
+    kShort = 4
+    kInt = 7
+    kLong = 7
+    kFloat = 11
+    kDouble = 14
+
+
+class MCallbackIdArray(list):
+    """
+    Stand-in for `om.MCallbackIdArray`.
+    Headless scenes never emit callbacks so this array is only ever cleared.
+    """
+
+    pass
+
+
+class MVector(object):
+    """
+    Stand-in for `om.MVector` that supports the operators used by the kinematic functions.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_values',)
+
+    def __init__(self, *args):
+        """
+        Private method called after a new instance has been created.
+
+        :type args: Union[float, Tuple[float, float, float]]
+        :rtype: None
+        """
+
+        values = args[0] if len(args) == 1 else (args if len(args) > 0 else (0.0, 0.0, 0.0))
+        self._values = np.array(tuple(values)[:3], dtype=float)
+
+    def __getitem__(self, index):
+        """
+        Private method that returns an indexed component.
+
+        :type index: int
+        :rtype: float
+        """
+
+        return float(self._values[index])
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the components.
+
+        :rtype: Iterator[float]
+        """
+
+        return iter(self._values.tolist())
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of components.
+
+        :rtype: int
+        """
+
+        return 3
+
+    def __neg__(self):
+        """
+        Private method that returns the negated vector.
+
+        :rtype: MVector
+        """
+
+        return MVector(-self._values)
+
+    def __add__(self, other):
+        """
+        Private method that returns the sum of both vectors.
+
+        :type other: Union[MVector, MPoint]
+        :rtype: Union[MVector, MPoint]
+        """
+
+        return type(other)(self._values + other._values) if isinstance(other, MPoint) else MVector(self._values + other._values)
+
+    def __sub__(self, other):
+        """
+        Private method that returns the difference of both vectors.
+
+        :type other: MVector
+        :rtype: MVector
+        """
+
+        return MVector(self._values - other._values)
+
+    def __mul__(self, other):
+        """
+        Private method that returns either the dot product, the transformed vector or the scaled vector.
+
+        :type other: Union[MVector, MMatrix, float]
+        :rtype: Union[MVector, float]
+        """
+
+        if isinstance(other, MVector):
+
+            return float(np.dot(self._values, other._values))
+
+        elif isinstance(other, MMatrix):
+
+            return MVector(np.matmul(self._values, other._values[:3, :3]))
+
+        else:
+
+            return MVector(self._values * other)
+
+    __rmul__ = __mul__
+
+    def __xor__(self, other):
+        """
+        Private method that returns the cross product of both vectors.
+
+        :type other: MVector
+        :rtype: MVector
+        """
+
+        return MVector(np.cross(self._values, other._values))
+    # endregion
+
+    # region Methods
+    def length(self):
+        """
+        Returns the length of this vector.
+
+        :rtype: float
+        """
+
+        return float(np.linalg.norm(self._values))
+
+    def normal(self):
+        """
+        Returns a normalized copy of this vector.
+        Zero-length vectors are returned unchanged.
+
+        :rtype: MVector
+        """
+
+        length = self.length()
+
+        return MVector(self._values / length) if length > 0.0 else MVector(self._values)
+    # endregion
+
+
+class MPoint(object):
+    """
+    Stand-in for `om.MPoint` that supports the operators used by the kinematic functions.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_values',)
+
+    def __init__(self, *args):
+        """
+        Private method called after a new instance has been created.
+
+        :type args: Union[float, Tuple[float, float, float]]
+        :rtype: None
+        """
+
+        values = args[0] if len(args) == 1 else (args if len(args) > 0 else (0.0, 0.0, 0.0))
+        self._values = np.array(tuple(values)[:3], dtype=float)
+
+    def __getitem__(self, index):
+        """
+        Private method that returns an indexed component.
+
+        :type index: int
+        :rtype: float
+        """
+
+        return float(self._values[index])
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the components.
+
+        :rtype: Iterator[float]
+        """
+
+        return iter(self._values.tolist())
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of components.
+
+        :rtype: int
+        """
+
+        return 3
+
+    def __add__(self, other):
+        """
+        Private method that returns the point offset by the supplied vector.
+
+        :type other: MVector
+        :rtype: MPoint
+        """
+
+        return MPoint(self._values + other._values)
+
+    def __sub__(self, other):
+        """
+        Private method that returns either the vector between both points or the point offset by the supplied vector.
+
+        :type other: Union[MPoint, MVector]
+        :rtype: Union[MVector, MPoint]
+        """
+
+        if isinstance(other, MPoint):
+
+            return MVector(self._values - other._values)
+
+        else:
+
+            return MPoint(self._values - other._values)
+
+    def __mul__(self, other):
+        """
+        Private method that returns the point transformed by the supplied matrix.
+
+        :type other: MMatrix
+        :rtype: MPoint
+        """
+
+        return MPoint(np.matmul(np.append(self._values, 1.0), other._values)[:3])
+    # endregion
+
+    # region Methods
+    def distanceTo(self, other):
+        """
+        Returns the distance to the supplied point.
+
+        :type other: MPoint
+        :rtype: float
+        """
+
+        return float(np.linalg.norm(self._values - np.asarray(tuple(other), dtype=float)[:3]))
+    # endregion
+
+
+class MMatrix(object):
+    """
+    Stand-in for `om.MMatrix` that supports the operators used by the kinematic functions.
+    Matrices are row-major and compose from left to right, the same as Maya.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_values',)
+
+    def __init__(self, *args):
+        """
+        Private method called after a new instance has been created.
+
+        :type args: Union[MMatrix, Sequence[float], Sequence[Sequence[float]]]
+        :rtype: None
+        """
+
+        values = args[0] if len(args) > 0 else np.eye(4)
+
+        if isinstance(values, MMatrix):
+
+            values = values._values
+
+        self._values = np.array([tuple(row) if not isinstance(row, (int, float)) else row for row in values], dtype=float).reshape(4, 4)
+
+    def __getitem__(self, index):
+        """
+        Private method that returns an indexed element.
+
+        :type index: int
+        :rtype: float
+        """
+
+        return float(self._values.flat[index])
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the elements.
+
+        :rtype: Iterator[float]
+        """
+
+        return iter(self._values.flatten().tolist())
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of elements.
+
+        :rtype: int
+        """
+
+        return 16
+
+    def __mul__(self, other):
+        """
+        Private method that returns either the product of both matrices or the scaled matrix.
+
+        :type other: Union[MMatrix, float]
+        :rtype: MMatrix
+        """
+
+        if isinstance(other, MMatrix):
+
+            return MMatrix(np.matmul(self._values, other._values))
+
+        else:
+
+            return MMatrix(self._values * other)
+
+    def __eq__(self, other):
+        """
+        Private method that evaluates if both matrices are equivalent.
+
+        :type other: MMatrix
+        :rtype: bool
+        """
+
+        return isinstance(other, MMatrix) and np.allclose(self._values, other._values)
+
+    def __ne__(self, other):
+        """
+        Private method that evaluates if both matrices are not equivalent.
+
+        :type other: MMatrix
+        :rtype: bool
+        """
+
+        return not self.__eq__(other)
+    # endregion
+
+    # region Methods
+    def getElement(self, row, column):
+        """
+        Returns the element at the specified row and column.
+
+        :type row: int
+        :type column: int
+        :rtype: float
+        """
+
+        return float(self._values[row, column])
+
+    def setElement(self, row, column, value):
+        """
+        Updates the element at the specified row and column.
+
+        :type row: int
+        :type column: int
+        :type value: float
+        :rtype: None
+        """
+
+        self._values[row, column] = value
+
+    def transpose(self):
+        """
+        Returns the transpose of this matrix.
+
+        :rtype: MMatrix
+        """
+
+        return MMatrix(self._values.T)
+
+    def inverse(self):
+        """
+        Returns the inverse of this matrix.
+
+        :rtype: MMatrix
+        """
+
+        return MMatrix(np.linalg.inv(self._values))
+    # endregion
+
+
+MMatrix.kIdentity = MMatrix()
+MPoint.kOrigin = MPoint()
+
+
+class MMatrixArray(object):
+    """
+    Stand-in for `om.MMatrixArray`.
+    """
+
+    # region Dunderscores
+    __slots__ = ('_matrices',)
+
+    def __init__(self, size=0):
+        """
+        Private method called after a new instance has been created.
+
+        :type size: int
+        :rtype: None
+        """
+
+        self._matrices = [MMatrix() for i in range(size)]
+
+    def __getitem__(self, index):
+        """
+        Private method that returns an indexed matrix.
+
+        :type index: int
+        :rtype: MMatrix
+        """
+
+        return self._matrices[index]
+
+    def __setitem__(self, index, matrix):
+        """
+        Private method that updates an indexed matrix.
+
+        :type index: int
+        :type matrix: MMatrix
+        :rtype: None
+        """
+
+        self._matrices[index] = MMatrix(matrix)
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the matrices.
+
+        :rtype: Iterator[MMatrix]
+        """
+
+        return iter(self._matrices)
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of matrices.
+
+        :rtype: int
+        """
+
+        return len(self._matrices)
+    # endregion
+
+    # region Methods
+    def append(self, matrix):
+        """
+        Appends the supplied matrix to this array.
+
+        :type matrix: MMatrix
+        :rtype: None
+        """
+
+        self._matrices.append(MMatrix(matrix))
+    # endregion
+
+
+class MEulerRotation(object):
+    """
+    Stand-in for `om.MEulerRotation` that can be converted into a matrix.
+    """
+
+    # region Enums
+    kXYZ = 0
+    kYZX = 1
+    kZXY = 2
+    kXZY = 3
+    kYXZ = 4
+    kZYX = 5
+    # endregion
+
+    # region Dunderscores
+    __slots__ = ('x', 'y', 'z', 'order')
+
+    __axes__ = {
+        kXYZ: (0, 1, 2),
+        kYZX: (1, 2, 0),
+        kZXY: (2, 0, 1),
+        kXZY: (0, 2, 1),
+        kYXZ: (1, 0, 2),
+        kZYX: (2, 1, 0)
+    }
+
+    def __init__(self, x=0.0, y=0.0, z=0.0, order=kXYZ):
+        """
+        Private method called after a new instance has been created.
+
+        :type x: float
+        :type y: float
+        :type z: float
+        :type order: int
+        :rtype: None
+        """
+
+        self.x, self.y, self.z, self.order = float(x), float(y), float(z), order
+
+    def __getitem__(self, index):
+        """
+        Private method that returns an indexed angle, in radians.
+
+        :type index: int
+        :rtype: float
+        """
+
+        return (self.x, self.y, self.z)[index]
+
+    def __iter__(self):
+        """
+        Private method that returns a generator that yields the angles, in radians.
+
+        :rtype: Iterator[float]
+        """
+
+        return iter((self.x, self.y, self.z))
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of angles.
+
+        :rtype: int
+        """
+
+        return 3
+    # endregion
+
+    # region Methods
+    def asMatrix(self):
+        """
+        Returns this rotation as a matrix.
+        Each axis is applied in rotation order, the same as Maya.
+
+        :rtype: MMatrix
+        """
+
+        matrix = np.eye(4)
+
+        for axis in self.__axes__[self.order]:
+
+            radian = self[axis]
+            cosine, sine = math.cos(radian), math.sin(radian)
+
+            first, second = [index for index in range(3) if index != axis]
+            sign = -1.0 if axis == 1 else 1.0
+
+            rotateMatrix = np.eye(4)
+            rotateMatrix[first, first] = cosine
+            rotateMatrix[first, second] = sine * sign
+            rotateMatrix[second, first] = -sine * sign
+            rotateMatrix[second, second] = cosine
+
+            matrix = np.matmul(matrix, rotateMatrix)
+
+        return MMatrix(matrix)
+    # endregion
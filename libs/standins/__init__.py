@@ -0,0 +1,5 @@
+"""
+Stand-ins for the parts of the Maya API, and its dcc helpers, that rigomatic's libs rely on.
+These are only imported when Maya is unavailable so the headless code paths, and the scalar kinematics, can be imported and evaluated.
+See `headlessutils.HeadlessScene` for the in-memory scene these are paired with.
+"""
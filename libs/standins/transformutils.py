@@ -0,0 +1,100 @@
+import numpy as np
+
+from . import OpenMaya as om
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def createTranslateMatrix(value):
+    """
+    Returns a translation matrix from the supplied point or matrix.
+
+    :type value: Union[om.MMatrix, om.MPoint, om.MVector, Tuple[float, float, float]]
+    :rtype: om.MMatrix
+    """
+
+    matrix = np.eye(4)
+    matrix[3, :3] = [value.getElement(3, i) for i in range(3)] if isinstance(value, om.MMatrix) else tuple(value)[:3]
+
+    return om.MMatrix(matrix)
+
+
+def createRotationMatrix(value):
+    """
+    Returns a rotation matrix from the supplied euler angles, in radians, or matrix.
+    Any translation and scale is removed from matrices.
+
+    :type value: Union[om.MMatrix, om.MEulerRotation, Tuple[float, float, float]]
+    :rtype: om.MMatrix
+    """
+
+    if isinstance(value, om.MMatrix):
+
+        axes = np.array([[value.getElement(row, column) for column in range(3)] for row in range(3)])
+        lengths = np.linalg.norm(axes, axis=-1, keepdims=True)
+
+        matrix = np.eye(4)
+        matrix[:3, :3] = axes / np.where(lengths > 0.0, lengths, 1.0)
+
+        return om.MMatrix(matrix)
+
+    elif isinstance(value, om.MEulerRotation):
+
+        return value.asMatrix()
+
+    else:
+
+        return om.MEulerRotation(*value).asMatrix()
+
+
+def createAimMatrix(forwardAxis, forwardVector, upAxis, upVector, origin=om.MPoint.kOrigin, forwardAxisSign=1, upAxisSign=1):
+    """
+    Returns an aim matrix from the supplied axes and vectors.
+    The up vector is orthogonalized against the forward vector.
+
+    :type forwardAxis: int
+    :type forwardVector: om.MVector
+    :type upAxis: int
+    :type upVector: om.MVector
+    :type origin: om.MPoint
+    :type forwardAxisSign: int
+    :type upAxisSign: int
+    :rtype: om.MMatrix
+    """
+
+    # Check if axes are unique
+    #
+    if forwardAxis == upAxis:
+
+        raise TypeError(f'createAimMatrix() expects unique forward and up axes ({forwardAxis} given)!')
+
+    # Orthogonalize axis vectors
+    # Be sure to preserve the handedness of the matrix!
+    #
+    forwardVector = om.MVector(forwardVector).normal() * forwardAxisSign
+    upVector = om.MVector(upVector).normal() * upAxisSign
+
+    rightAxis = 3 - (forwardAxis + upAxis)
+
+    if ((forwardAxis + 1) % 3) == upAxis:
+
+        rightVector = (forwardVector ^ upVector).normal()
+        upVector = (rightVector ^ forwardVector).normal()
+
+    else:
+
+        rightVector = (upVector ^ forwardVector).normal()
+        upVector = (forwardVector ^ rightVector).normal()
+
+    # Compose matrix
+    #
+    matrix = np.eye(4)
+    matrix[forwardAxis, :3] = tuple(forwardVector)
+    matrix[upAxis, :3] = tuple(upVector)
+    matrix[rightAxis, :3] = tuple(rightVector)
+    matrix[3, :3] = tuple(origin)[:3]
+
+    return om.MMatrix(matrix)
@@ -0,0 +1,76 @@
+from functools import wraps
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class Undo(object):
+    """
+    Stand-in for `dcc.maya.decorators.undo.Undo` that can be used as either a decorator or a context manager.
+    Headless scenes have no undo queue so this does nothing.
+    """
+
+    # region Dunderscores
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :key name: str
+        :rtype: None
+        """
+
+        self._name = kwargs.get('name', '')
+
+    def __enter__(self):
+        """
+        Private method that opens an undo chunk.
+
+        :rtype: Undo
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that closes an undo chunk.
+
+        :type exc_type: Union[Type[Exception], None]
+        :type exc_val: Union[Exception, None]
+        :type exc_tb: Union[traceback, None]
+        :rtype: None
+        """
+
+        pass
+
+    def __call__(self, func):
+        """
+        Private method that wraps the supplied function inside an undo chunk.
+
+        :type func: Callable
+        :rtype: Callable
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            with self:
+
+                return func(*args, **kwargs)
+
+        return wrapper
+    # endregion
+
+
+def commit(undoIt, doIt):
+    """
+    Stand-in for `dcc.maya.decorators.undo.commit`.
+    Headless scenes have no undo queue so the supplied functions are discarded.
+
+    :type undoIt: Callable
+    :type doIt: Callable
+    :rtype: None
+    """
+
+    pass
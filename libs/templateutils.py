@@ -0,0 +1,246 @@
+try:
+
+    from maya.api import OpenMaya as om
+    from dcc.maya.decorators import undo
+
+except ImportError:
+
+    # Templates are only applied with Maya, the stand-ins only allow dependent modules to be imported
+    #
+    from .standins import OpenMaya as om, undo
+
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+NUMERIC_TYPES = {
+    'bool': om.MFnNumericData.kBoolean,
+    'byte': om.MFnNumericData.kByte,
+    'short': om.MFnNumericData.kShort,
+    'long': om.MFnNumericData.kInt,
+    'int': om.MFnNumericData.kInt,
+    'float': om.MFnNumericData.kFloat,
+    'double': om.MFnNumericData.kDouble
+}
+
+
+class AttributeTemplate(object):
+    """
+    Base class used to parse attribute definitions once and apply them to any number of nodes.
+    Definitions use the same keywords as `MPyNode.addAttr`, including nested `children` for compound attributes.
+    Only the parsed definitions are cached, since an attribute object can only be added to a single node!
+    """
+
+    # region Dunderscores
+    def __init__(self, *definitions):
+        """
+        Private method called after a new instance has been created.
+
+        :type definitions: Union[Dict[str, Any], List[Dict[str, Any]]]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(AttributeTemplate, self).__init__()
+
+        # Declare private variables
+        #
+        self._definitions = definitions
+        self._parsed = None
+    # endregion
+
+    # region Properties
+    @property
+    def definitions(self):
+        """
+        Getter method that returns the attribute definitions.
+
+        :rtype: Tuple[Dict[str, Any]]
+        """
+
+        return self._definitions
+
+    @property
+    def isCompiled(self):
+        """
+        Getter method that evaluates if the definitions have been parsed.
+
+        :rtype: bool
+        """
+
+        return self._parsed is not None
+    # endregion
+
+    # region Methods
+    @classmethod
+    def parseDefinition(cls, definition):
+        """
+        Returns a copy of the supplied definition with every default resolved.
+
+        :type definition: Dict[str, Any]
+        :rtype: Dict[str, Any]
+        """
+
+        # Evaluate attribute type
+        #
+        longName = definition['longName']
+        attributeType = definition.get('attributeType', 'float')
+        children = tuple(cls.parseDefinition(child) for child in definition.get('children', []))
+
+        parsed = dict(definition)
+        parsed['longName'] = longName
+        parsed['shortName'] = definition.get('shortName', longName)
+        parsed['attributeType'] = attributeType
+        parsed['children'] = children
+
+        if attributeType in NUMERIC_TYPES:
+
+            parsed['numericType'] = NUMERIC_TYPES[attributeType]
+
+        elif attributeType in ('float3', 'double3', 'long3') and len(children) == 3:
+
+            pass
+
+        elif attributeType == 'compound':
+
+            pass
+
+        elif attributeType == 'enum':
+
+            fields = []
+
+            for (i, field) in enumerate(definition.get('fields', '').split(':')):
+
+                fieldName, sep, fieldIndex = field.partition('=')
+                fields.append((fieldName, int(fieldIndex) if sep else i))
+
+            parsed['fields'] = tuple(fields)
+
+        else:
+
+            raise TypeError(f'parseDefinition() expects a supported attribute type ({attributeType} given)!')
+
+        return parsed
+
+    @classmethod
+    def createAttribute(cls, parsed):
+        """
+        Returns a new attribute from the supplied parsed definition.
+
+        :type parsed: Dict[str, Any]
+        :rtype: om.MObject
+        """
+
+        # Evaluate attribute type
+        #
+        longName = parsed['longName']
+        shortName = parsed['shortName']
+        attributeType = parsed['attributeType']
+        children = [cls.createAttribute(child) for child in parsed['children']]
+
+        if attributeType in NUMERIC_TYPES:
+
+            fnAttribute = om.MFnNumericAttribute()
+            attribute = fnAttribute.create(longName, shortName, parsed['numericType'], parsed.get('default', 0))
+
+            if 'min' in parsed:
+
+                fnAttribute.setMin(parsed['min'])
+
+            if 'max' in parsed:
+
+                fnAttribute.setMax(parsed['max'])
+
+        elif attributeType == 'compound':
+
+            fnAttribute = om.MFnCompoundAttribute()
+            attribute = fnAttribute.create(longName, shortName)
+
+            for child in children:
+
+                fnAttribute.addChild(child)
+
+        elif attributeType == 'enum':
+
+            fnAttribute = om.MFnEnumAttribute()
+            attribute = fnAttribute.create(longName, shortName, parsed.get('default', 0))
+
+            for (fieldName, fieldIndex) in parsed['fields']:
+
+                fnAttribute.addField(fieldName, fieldIndex)
+
+        else:
+
+            fnAttribute = om.MFnNumericAttribute()
+            attribute = fnAttribute.create(longName, shortName, *children)
+
+        # Update attribute properties
+        #
+        fnAttribute.cached = parsed.get('cachedInternally', fnAttribute.cached)
+        fnAttribute.hidden = parsed.get('hidden', fnAttribute.hidden)
+        fnAttribute.keyable = parsed.get('keyable', fnAttribute.keyable)
+        fnAttribute.storable = parsed.get('storable', fnAttribute.storable)
+        fnAttribute.array = parsed.get('multi', fnAttribute.array)
+
+        return attribute
+
+    def compile(self):
+        """
+        Parses the attribute definitions.
+        Subsequent calls return the previously parsed definitions.
+
+        :rtype: Tuple[Dict[str, Any]]
+        """
+
+        if self._parsed is None:
+
+            self._parsed = tuple(self.parseDefinition(definition) for definition in self._definitions)
+
+        return self._parsed
+
+    def apply(self, *nodes, modifier=None):
+        """
+        Adds the templated attributes to the supplied nodes through a single modifier.
+        A new set of attribute objects is created for each node, since Maya takes ownership of any attribute added to a node.
+        Any nodes that already have an attribute are skipped.
+        If a modifier is supplied then the attributes are queued onto it and the caller is responsible for executing it.
+
+        :type nodes: Union[mpynode.MPyNode, List[mpynode.MPyNode]]
+        :type modifier: Union[om.MDGModifier, None]
+        :rtype: om.MDGModifier
+        """
+
+        # Iterate through nodes
+        #
+        definitions = self.compile()
+        dgModifier = om.MDGModifier() if modifier is None else modifier
+
+        for node in nodes:
+
+            obj = node if isinstance(node, om.MObject) else node.object()
+            fnDependNode = om.MFnDependencyNode(obj)
+
+            for definition in definitions:
+
+                name = definition['longName']
+
+                if fnDependNode.hasAttribute(name):
+
+                    log.debug(f'Skipping existing attribute: {fnDependNode.name()}.{name}')
+                    continue
+
+                dgModifier.addAttribute(obj, self.createAttribute(definition))
+
+        # Check if modifier requires executing
+        #
+        if modifier is None:
+
+            dgModifier.doIt()
+            undo.commit(dgModifier.undoIt, dgModifier.doIt)
+
+        return dgModifier
+    # endregion
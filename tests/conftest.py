@@ -0,0 +1,15 @@
+import os
+import sys
+import importlib.util
+
+# Register the repository as the `rigomatic` package so the maya-free modules can be imported by their package paths
+#
+rootDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if 'rigomatic' not in sys.modules:
+
+    spec = importlib.util.spec_from_file_location('rigomatic', os.path.join(rootDirectory, '__init__.py'), submodule_search_locations=[rootDirectory])
+    module = importlib.util.module_from_spec(spec)
+
+    sys.modules['rigomatic'] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,160 @@
+import math
+import numpy as np
+
+from rigomatic.libs import solverutils, kinematicutils, benchmarkutils
+
+
+def createInputs(numChains=500, seed=0):
+    """
+    Returns the chains, lengths and target points used by the accuracy checks.
+    Targets are spread from well inside to well outside the reach of each chain.
+
+    :type numChains: int
+    :type seed: int
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    """
+
+    chains = benchmarkutils.createRandomChains(numChains, seed=seed)
+    startPoints, midPoints, endPoints = chains[:, 0], chains[:, 1], chains[:, 2]
+
+    startLengths = np.linalg.norm(midPoints - startPoints, axis=-1)
+    endLengths = np.linalg.norm(endPoints - midPoints, axis=-1)
+    targetPoints = startPoints + ((endPoints - startPoints) * np.linspace(0.25, 1.5, num=numChains)[:, None])
+
+    return chains, startLengths, endLengths, targetPoints
+
+
+def test_ik2bone_matches_law_of_cosines():
+
+    chains, startLengths, endLengths, targetPoints = createInputs()
+    startPoints = chains[:, 0]
+    poleVectors = solverutils.calculatePoleVectors(startPoints, chains[:, 1], chains[:, 2])
+
+    matrices = solverutils.solveIk2BoneChains(startPoints, startLengths, targetPoints, endLengths, poleVectors)
+    references = np.array([benchmarkutils.referenceIk2BoneChain(*args) for args in zip(startPoints, startLengths, targetPoints, endLengths, poleVectors)])
+
+    assert np.allclose(matrices[:, :, 3, :3], references, atol=1e-9)
+
+
+def test_ik2bone_reaches_reachable_targets():
+
+    chains, startLengths, endLengths, targetPoints = createInputs()
+    startPoints = chains[:, 0]
+    poleVectors = solverutils.calculatePoleVectors(startPoints, chains[:, 1], chains[:, 2])
+
+    aimLengths = np.linalg.norm(targetPoints - startPoints, axis=-1)
+    isReachable = (aimLengths < (startLengths + endLengths)) & (aimLengths > np.fabs(startLengths - endLengths))
+
+    matrices = solverutils.solveIk2BoneChains(startPoints, startLengths, targetPoints, endLengths, poleVectors)
+
+    assert isReachable.any()
+    assert np.allclose(matrices[isReachable, 2, 3, :3], targetPoints[isReachable], atol=1e-9)
+
+
+def test_ik2bone_bends_towards_pole():
+
+    matrices = solverutils.solveIk2BoneChains([(0.0, 0.0, 0.0)], 1.0, [(1.5, 0.0, 0.0)], 1.0, [(0.0, 0.0, 1.0)])
+
+    assert matrices[0, 1, 3, 2] > 0.0
+    assert math.isclose(np.linalg.norm(matrices[0, 1, 3, :3]), 1.0)
+
+
+def test_soft_ik_matches_reference():
+
+    chains, startLengths, endLengths, targetPoints = createInputs()
+    startPoints = chains[:, 0]
+    chainLengths = startLengths + endLengths
+
+    softPoints, softScales = solverutils.solveSoftIks(startPoints, targetPoints, chainLengths, 1.0)
+    references = [benchmarkutils.referenceSoftIk(*args, 1.0) for args in zip(startPoints, targetPoints, chainLengths)]
+
+    assert np.allclose(softPoints, [point for (point, scale) in references], atol=1e-9)
+    assert np.allclose(softScales, [scale for (point, scale) in references], atol=1e-9)
+    assert (np.linalg.norm(softPoints - startPoints, axis=-1) <= (chainLengths + 1e-9)).all()
+
+
+def test_pole_vectors_match_reference():
+
+    chains = benchmarkutils.createRandomChains(500)
+
+    vectors = solverutils.calculatePoleVectors(chains[:, 0], chains[:, 1], chains[:, 2])
+    references = np.array([benchmarkutils.referencePoleVector(*points) for points in chains])
+
+    assert np.allclose(vectors, references, atol=1e-9)
+
+
+def test_fit_preserves_chain_length():
+
+    chains = benchmarkutils.createRandomChains(500, numJoints=4)
+    chainLengths = np.linalg.norm(np.diff(chains, axis=1), axis=-1).sum(axis=-1)
+
+    fitted = solverutils.fit2BoneIKto3BoneIKs(chains)
+    references = np.array([benchmarkutils.referenceFit2BoneIKto3BoneIK(points) for points in chains])
+    fittedLengths = np.linalg.norm(np.diff(fitted, axis=1), axis=-1).sum(axis=-1)
+
+    assert np.allclose(fitted, references, atol=1e-9, equal_nan=True)
+    assert np.allclose(fittedLengths, chainLengths, atol=1e-9)
+
+
+def test_degenerate_chains_stay_finite():
+
+    cases = benchmarkutils.createDegenerateChains()
+
+    chains = np.array([points for (points, target) in cases.values()])
+    targetPoints = np.array([target for (points, target) in cases.values()])
+
+    startPoints, midPoints, endPoints = chains[:, 0], chains[:, 1], chains[:, 2]
+    startLengths = np.linalg.norm(midPoints - startPoints, axis=-1)
+    endLengths = np.linalg.norm(endPoints - midPoints, axis=-1)
+
+    matrices = solverutils.solveIk2BoneChains(startPoints, startLengths, targetPoints, endLengths, (0.0, 1.0, 0.0))
+    softPoints, softScales = solverutils.solveSoftIks(startPoints, targetPoints, startLengths + endLengths, (1.0, 0.0, 1.0, 0.0, 1.0))
+
+    assert np.isfinite(matrices).all()
+    assert np.isfinite(softPoints).all() and np.isfinite(softScales).all()
+    assert np.isfinite(solverutils.calculatePoleVectors(startPoints, midPoints, endPoints)).all()
+    assert np.isfinite(solverutils.calculateChainPoleVectors(chains)).all()
+
+
+def test_scalar_kinematics_match_references():
+
+    om = benchmarkutils.om
+
+    chains, startLengths, endLengths, targetPoints = createInputs(numChains=50)
+    poleVectors = solverutils.calculatePoleVectors(chains[:, 0], chains[:, 1], chains[:, 2])
+
+    for (points, startLength, endLength, targetPoint, poleVector) in zip(chains, startLengths, endLengths, targetPoints, poleVectors):
+
+        startPoint, midPoint, endPoint = [om.MPoint(*point) for point in points]
+
+        aimLength = float(np.linalg.norm(targetPoint - points[0]))
+
+        if abs(startLength - endLength) < aimLength < (startLength + endLength):
+
+            matrices = kinematicutils.solveIk2BoneChain(startPoint, startLength, om.MPoint(*targetPoint), endLength, om.MVector(*poleVector))
+            positions = np.array([tuple(matrix)[12:15] for matrix in matrices])
+
+            assert np.allclose(positions, benchmarkutils.referenceIk2BoneChain(points[0], startLength, targetPoint, endLength, poleVector), atol=1e-6)
+
+        softPoint, softScale = kinematicutils.solveSoftIk(startPoint, om.MPoint(*targetPoint), startLength + endLength, 1.0)
+        referencePoint, referenceScale = benchmarkutils.referenceSoftIk(points[0], targetPoint, startLength + endLength, 1.0)
+
+        assert np.allclose(benchmarkutils.asArray(softPoint), referencePoint, atol=1e-6)
+        assert math.isclose(softScale, referenceScale, abs_tol=1e-6)
+
+        poleVector = kinematicutils.solvePoleVector(startPoint, midPoint, endPoint)
+
+        assert np.allclose(benchmarkutils.asArray(poleVector), benchmarkutils.referencePoleVector(*points), atol=1e-6)
+
+        fittedPoints = kinematicutils.fit2BoneIKto3BoneIK([startPoint, midPoint, endPoint])
+
+        assert np.allclose([benchmarkutils.asArray(point) for point in fittedPoints], benchmarkutils.referenceFit2BoneIKto3BoneIK(points), atol=1e-6, equal_nan=True)
+
+
+def test_baseline_matches_scalar_functions():
+
+    baseline = benchmarkutils.loadBaseline()
+    results = benchmarkutils.runSuite(numChains=100, repeat=1)
+
+    assert baseline is not None
+    assert set(baseline['speedups']) == set(results['speedups'])
@@ -0,0 +1,121 @@
+import numpy as np
+
+from rigomatic.libs import headlessutils, sceneutils, createutils, modifyutils, nameutils, ColorMode
+
+
+def createTransformMatrix(translation, scale=1.0):
+    """
+    Returns a matrix with the specified translation and uniform scale.
+
+    :type translation: Tuple[float, float, float]
+    :type scale: float
+    :rtype: np.ndarray
+    """
+
+    matrix = np.eye(4)
+    matrix[:3, :3] *= scale
+    matrix[3, :3] = translation
+
+    return matrix
+
+
+def test_set_parent_preserves_world_matrix():
+
+    scene = headlessutils.HeadlessScene()
+
+    parent = scene.createNode('transform', name='parent')
+    parent.setMatrix(createTransformMatrix((1.0, 2.0, 3.0), scale=2.0))
+
+    child = scene.createNode('transform', name='child')
+    child.setMatrix(createTransformMatrix((5.0, 0.0, 0.0)))
+
+    child.setParent(parent)
+
+    assert child.parent() == parent
+    assert np.allclose(child.worldMatrix(), createTransformMatrix((5.0, 0.0, 0.0)))
+    assert np.allclose(child.matrix(), createTransformMatrix((2.0, -1.0, -1.5), scale=0.5))
+
+
+def test_reparent_nodes_preserves_local_matrices():
+
+    scene = headlessutils.HeadlessScene()
+
+    parent = scene.createNode('transform', name='parent')
+    parent.setMatrix(createTransformMatrix((1.0, 0.0, 0.0)))
+
+    child = scene.createNode('transform', name='child')
+    child.setMatrix(createTransformMatrix((5.0, 0.0, 0.0)))
+
+    scene.reparentNodes([child.index], [parent.index])
+
+    assert np.allclose(child.matrix(), createTransformMatrix((5.0, 0.0, 0.0)))
+    assert np.allclose(child.worldMatrix(), createTransformMatrix((6.0, 0.0, 0.0)))
+
+
+def test_scene_activates_within_context():
+
+    scene = headlessutils.HeadlessScene()
+
+    assert not sceneutils.isHeadless()
+
+    with scene:
+
+        assert sceneutils.getScene() is scene
+        assert sceneutils.isHeadless()
+
+    assert not sceneutils.isHeadless()
+
+
+def test_batch_create_nodes_from_selection():
+
+    with headlessutils.createRigFixture(100) as scene:
+
+        selection = list(scene.iterNodesByTypeName('joint'))[:10]
+        nodes = createutils.batchCreateNodesFromSelection('transform', selection, locator=True, colorRGB=(1.0, 0.0, 0.0))
+
+        assert len(nodes) == len(selection)
+        assert scene.selection() == nodes
+
+        for (node, source) in zip(nodes, selection):
+
+            assert node.name() != source.name()
+            assert np.allclose(node.worldMatrix(), source.worldMatrix())
+            assert node.shapes()[0].wireColorRGB == (1.0, 0.0, 0.0)
+
+
+def test_batch_create_intermediates_preserves_world_matrices():
+
+    with headlessutils.createSkeletonFixture(50) as scene:
+
+        joints = list(scene.iterNodes())[1:20]
+        worldMatrices = [joint.worldMatrix() for joint in joints]
+
+        groups = createutils.createIntermediate(*joints, batch=True)
+
+        assert len(groups) == len(joints)
+
+        for (joint, group, worldMatrix) in zip(joints, groups, worldMatrices):
+
+            assert joint.parent() == group
+            assert np.allclose(joint.worldMatrix(), worldMatrix)
+
+
+def test_batch_recolor_nodes():
+
+    with headlessutils.createRigFixture(100) as scene:
+
+        controls = [node for node in scene.iterNodesByTypeName('transform') if node.name().endswith('_CTRL')]
+        results = modifyutils.batchRecolorNodes(controls, (0.0, 1.0, 0.0), colorMode=ColorMode.OVERRIDE_COLOR_RGB)
+
+        assert results['shapes'] == len(controls)
+        assert all(np.allclose(control.shapes()[0].dormantColor(), (0.0, 1.0, 0.0)) for control in controls)
+
+
+def test_name_index_reads_headless_scene():
+
+    with headlessutils.createSkeletonFixture(10) as scene:
+
+        nameIndex = nameutils.NameIndex.create()
+
+        assert not nameIndex.isNameAvailable('joint1')
+        assert nameIndex.makeNameUnique('joint1', reserve=False) == 'joint11'
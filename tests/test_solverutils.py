@@ -0,0 +1,86 @@
+import numpy as np
+
+from rigomatic.libs import solverutils
+
+
+def createStraightChain(numJoints, length=1.0):
+    """
+    Returns a straight chain, along the positive X axis, with bones of the specified length.
+
+    :type numJoints: int
+    :type length: float
+    :rtype: np.ndarray
+    """
+
+    points = np.zeros((numJoints, 3))
+    points[:, 0] = np.arange(numJoints) * length
+
+    return points
+
+
+def boneLengths(points):
+    """
+    Returns the bone lengths for the supplied chain.
+
+    :type points: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    return np.linalg.norm(np.diff(points, axis=0), axis=-1)
+
+
+def test_fabrik_collinear_target_preserves_bone_lengths():
+
+    points = createStraightChain(5)
+    solved, error = solverutils.solveFabrikChain(points, (3.0, 0.0, 0.0))
+
+    assert error < 1e-4
+    assert np.allclose(solved[-1], (3.0, 0.0, 0.0), atol=1e-4)
+    assert np.allclose(boneLengths(solved), 1.0, atol=1e-4)
+
+
+def test_fabrik_pole_vector_seeds_bend():
+
+    for numJoints in (3, 4, 5):
+
+        points = createStraightChain(numJoints, length=4.0 / (numJoints - 1))
+        solved, error = solverutils.solveFabrikChain(points, (2.0, 2.0, 0.0), poleVector=(0.0, 0.0, 1.0))
+
+        assert error < 1e-4
+        assert np.allclose(boneLengths(solved), boneLengths(points), atol=1e-4)
+        assert np.all(solved[1:-1, 2] > 0.0)  # Interior joints bend towards the pole
+        assert np.allclose(solved[1:-1, 0], solved[1:-1, 1], atol=1e-4)  # Interior joints stay on the pole plane
+
+
+def test_fabrik_reports_collapsed_bones():
+
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+    errors = solverutils.calculateChainErrors(points[None], np.array([[1.0, 1.0]]), np.array([[1.0, 0.0, 0.0]]))
+
+    assert np.isclose(errors[0], 1.0)
+
+
+def test_fabrik_unreachable_chains_are_straightened():
+
+    points = createStraightChain(3)
+    solved, error = solverutils.solveFabrikChain(points, (2.0, 2.0, 0.0), poleVector=(0.0, 0.0, 1.0))
+
+    assert np.isclose(error, np.sqrt(8.0) - 2.0)
+    assert np.allclose(np.cross(solved[-1], (1.0, 1.0, 0.0)), 0.0)
+
+
+def test_ccd_refinement_handles_opposing_vectors():
+
+    points = createStraightChain(4)
+    solved, error = solverutils.solveFabrikChain(points, (-1.0, 0.5, 0.0), maxIterations=0, ccdIterations=50)
+
+    assert np.allclose(boneLengths(solved), 1.0, atol=1e-6)
+    assert error < 1e-2
+
+
+def test_rotate_points_ignores_zero_axes():
+
+    points = np.ones((1, 2, 3))
+    rotated = solverutils.rotatePoints(points, np.zeros((1, 3)), np.zeros((1, 3)), np.array([np.pi]))
+
+    assert np.allclose(rotated, points)
@@ -0,0 +1,295 @@
+from maya.api import OpenMaya as om
+from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class QNamespaceListModel(QtCore.QAbstractListModel):
+    """
+    Overload of `QAbstractListModel` that lists the namespaces in the scene.
+    Namespaces are stored relative to the root namespace, with the root itself as an empty string in the first row.
+    A name-to-row map keeps lookups O(1) and the model is updated incrementally from scene notifications.
+    Only opening, or creating, a scene requires a full `sync` against the scene.
+    """
+
+    # region Dunderscores
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :key parent: QtCore.QObject
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QNamespaceListModel, self).__init__(*args, **kwargs)
+
+        # Declare private variables
+        #
+        self._namespaces = ['']
+        self._rows = {'': 0}
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def normalizeNamespace(namespace):
+        """
+        Returns the supplied namespace relative to the root namespace.
+
+        :type namespace: str
+        :rtype: str
+        """
+
+        return namespace.strip(':')
+
+    @staticmethod
+    def sceneNamespaces():
+        """
+        Returns every namespace in the scene.
+
+        :rtype: List[str]
+        """
+
+        return om.MNamespace.getNamespaces(parentNamespace=':', recurse=True)
+
+    def namespaces(self):
+        """
+        Returns the namespaces in this model.
+
+        :rtype: List[str]
+        """
+
+        return list(self._namespaces)
+
+    def namespace(self, row):
+        """
+        Returns the namespace at the specified row.
+
+        :type row: int
+        :rtype: str
+        """
+
+        return self._namespaces[row]
+
+    def indexOf(self, namespace):
+        """
+        Returns the row of the supplied namespace.
+        If the namespace does not exist then -1 is returned.
+
+        :type namespace: str
+        :rtype: int
+        """
+
+        return self._rows.get(self.normalizeNamespace(namespace), -1)
+
+    def addNamespace(self, namespace):
+        """
+        Appends the supplied namespace, along with any missing parent namespaces, to this model.
+
+        :type namespace: str
+        :rtype: bool
+        """
+
+        # Check if namespace already exists
+        #
+        namespace = self.normalizeNamespace(namespace)
+
+        if namespace in self._rows:
+
+            return False
+
+        # Append any missing parent namespaces first
+        # This keeps the rows consistent with a recursive scan of the scene!
+        #
+        parentNamespace = namespace.rpartition(':')[0]
+
+        if parentNamespace:
+
+            self.addNamespace(parentNamespace)
+
+        # Append namespace
+        #
+        row = len(self._namespaces)
+
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._namespaces.append(namespace)
+        self._rows[namespace] = row
+        self.endInsertRows()
+
+        return True
+
+    def removeNamespace(self, namespace):
+        """
+        Removes the supplied namespace from this model.
+        The root namespace cannot be removed.
+
+        :type namespace: str
+        :rtype: bool
+        """
+
+        # Check if namespace exists
+        #
+        namespace = self.normalizeNamespace(namespace)
+        row = self._rows.get(namespace, -1)
+
+        if row <= 0:
+
+            return False
+
+        # Remove namespace and shift the rows that follow
+        #
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+
+        del self._namespaces[row]
+        del self._rows[namespace]
+
+        for (i, name) in enumerate(self._namespaces[row:], start=row):
+
+            self._rows[name] = i
+
+        self.endRemoveRows()
+
+        return True
+
+    def pruneNamespace(self, namespace):
+        """
+        Removes the supplied namespace, along with any child namespaces, if it no longer exists in the scene.
+
+        :type namespace: str
+        :rtype: bool
+        """
+
+        # Check if namespace still exists
+        #
+        namespace = self.normalizeNamespace(namespace)
+
+        if namespace not in self._rows or om.MNamespace.namespaceExists(f':{namespace}'):
+
+            return False
+
+        # Remove child namespaces before the namespace itself
+        #
+        prefix = f'{namespace}:'
+        children = [name for name in self._namespaces if name.startswith(prefix)]
+
+        for child in reversed(children):
+
+            self.removeNamespace(child)
+
+        return self.removeNamespace(namespace)
+
+    def renameNamespace(self, oldNamespace, newNamespace):
+        """
+        Renames the supplied namespace along with any of its child namespaces.
+
+        :type oldNamespace: str
+        :type newNamespace: str
+        :rtype: None
+        """
+
+        # Evaluate affected rows
+        #
+        oldNamespace = self.normalizeNamespace(oldNamespace)
+        newNamespace = self.normalizeNamespace(newNamespace)
+        oldPrefix = f'{oldNamespace}:'
+
+        rows = [row for (row, name) in enumerate(self._namespaces) if name == oldNamespace or name.startswith(oldPrefix)]
+
+        if len(rows) == 0:
+
+            self.addNamespace(newNamespace)
+            return
+
+        # Update namespaces in place
+        #
+        for row in rows:
+
+            name = self._namespaces[row]
+            newName = newNamespace + name[len(oldNamespace):]
+
+            del self._rows[name]
+            self._namespaces[row] = newName
+            self._rows[newName] = row
+
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+
+    def sync(self):
+        """
+        Synchronizes this model with a full scan of the scene.
+        This should only be required after opening, or creating, a scene since `addNamespace` and `pruneNamespace` handle any other changes.
+        Only namespaces that were added or removed are inserted or removed from the model.
+
+        :rtype: None
+        """
+
+        # Evaluate namespace changes
+        #
+        namespaces = [self.normalizeNamespace(namespace) for namespace in self.sceneNamespaces()]
+        current = set(namespaces)
+
+        removed = [namespace for namespace in self._namespaces[1:] if namespace not in current]
+        added = [namespace for namespace in namespaces if namespace not in self._rows]
+
+        # Check if a reset is cheaper
+        #
+        if len(removed) > 1:
+
+            self.beginResetModel()
+            self._namespaces = [''] + namespaces
+            self._rows = {namespace: row for (row, namespace) in enumerate(self._namespaces)}
+            self.endResetModel()
+
+            return
+
+        # Apply incremental changes
+        #
+        for namespace in removed:
+
+            self.removeNamespace(namespace)
+
+        for namespace in added:
+
+            self.addNamespace(namespace)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of rows under the given parent.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+
+        return 0 if parent.isValid() else len(self._namespaces)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the item referred to by the index.
+
+        :type index: QtCore.QModelIndex
+        :type role: int
+        :rtype: Any
+        """
+
+        # Check if index is valid
+        #
+        row = index.row()
+
+        if not index.isValid() or not (0 <= row < len(self._namespaces)):
+
+            return None
+
+        # Evaluate data role
+        #
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+
+            return self._namespaces[row]
+
+        else:
+
+            return None
+    # endregion
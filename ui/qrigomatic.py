@@ -1,4 +1,7 @@
 import webbrowser
+import numpy as np
+
+from time import perf_counter
 
 from maya import cmds as mc
 from maya.api import OpenMaya as om
@@ -8,8 +11,9 @@ from dcc.ui import qsingletonwindow, qdivider, qsignalblocker
 from dcc.maya.libs import transformutils, pluginutils
 from . import InvalidateReason
 from .tabs import qmodifytab, qrenametab, qshapestab, qattributestab, qspreadsheettab, qconstraintstab, qpublishtab
-from .widgets import qcolorbutton
-from ..libs import createutils, modifyutils, ColorMode
+from .widgets import qcolorbutton, qprofilerwidget
+from .models import qnamespacelistmodel
+from ..libs import createutils, modifyutils, kinematicutils, nameutils, batchutils, profileutils, selectionutils, solverutils, ColorMode, PivotMode
 
 import logging
 logging.basicConfig()
@@ -36,13 +40,120 @@ def onSelectionChanged(*args, **kwargs):
     #
     if QtCompat.isValid(instance):
 
-        instance.selectionChanged(*args, **kwargs)
+        batchutils.defer(instance.requestSelectionChanged)
 
     else:
 
         log.warning('Unable to process selection changed callback!')
 
 
+def onNamespaceRenamed(*args, **kwargs):
+    """
+    Callback method for any namespace name changes.
+
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QRigomatic.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.namespaceRenamed(*args, **kwargs)
+
+    else:
+
+        log.warning('Unable to process namespace renamed callback!')
+
+
+def onNodeAdded(*args, **kwargs):
+    """
+    Callback method for any nodes added to the scene.
+    References and imports add their namespaces through this callback.
+
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QRigomatic.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.nodeAdded(*args, **kwargs)
+
+    else:
+
+        log.warning('Unable to process node added callback!')
+
+
+def onNodeRemoved(*args, **kwargs):
+    """
+    Callback method for any nodes removed from the scene.
+    References and deletions remove their namespaces through this callback.
+
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QRigomatic.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.nodeRemoved(*args, **kwargs)
+
+    else:
+
+        log.warning('Unable to process node removed callback!')
+
+
+def onNodeNameChanged(*args, **kwargs):
+    """
+    Callback method for any node name changes.
+    Nodes moved between namespaces notify both namespaces through this callback.
+
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QRigomatic.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.nodeNameChanged(*args, **kwargs)
+
+    else:
+
+        log.warning('Unable to process node name changed callback!')
+
+
 def onSceneChanged(*args, **kwargs):
     """
     Callback method for any scene IO changes.
@@ -62,7 +173,7 @@ def onSceneChanged(*args, **kwargs):
     #
     if QtCompat.isValid(instance):
 
-        instance.sceneChanged(*args, **kwargs)
+        batchutils.defer(instance.sceneChanged)
 
     else:
 
@@ -85,6 +196,8 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         'PointOnCurveConstraint'
     )
 
+    __max_selection_latency__ = 0.1  # Seconds before a pending selection change is forced through
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -101,11 +214,34 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         # Declare private variables
         #
         self._scene = mpyscene.MPyScene.getInstance(asWeakReference=True)
-        self._selection = []
+        self._selection = selectionutils.SelectionView(om.MSelectionList())
         self._selectionCount = 0
         self._selectedNode = None
         self._currentColor = (0.0, 0.0, 0.0)
         self._callbackIds = om.MCallbackIdArray()
+        self._profilerWidget = None
+        self._selectionRequestTime = 0.0
+        self._droppedSelectionEvents = 0
+
+        # Initialize selection timer
+        # A zero interval coalesces any burst of selection changes into a single refresh once the event loop is idle!
+        #
+        self._selectionTimer = QtCore.QTimer(parent=self)
+        self._selectionTimer.setObjectName('selectionTimer')
+        self._selectionTimer.setSingleShot(True)
+        self._selectionTimer.setInterval(0)
+        self._selectionTimer.timeout.connect(self.selectionChanged)
+
+        # Initialize namespace timer
+        # Removed nodes still occupy their namespace when notified so pruning is deferred until the event loop is idle!
+        #
+        self._prunedNamespaces = set()
+
+        self._namespaceTimer = QtCore.QTimer(parent=self)
+        self._namespaceTimer.setObjectName('namespaceTimer')
+        self._namespaceTimer.setSingleShot(True)
+        self._namespaceTimer.setInterval(0)
+        self._namespaceTimer.timeout.connect(self.pruneNamespaces)
 
     def __setup_ui__(self, *args, **kwargs):
         """
@@ -157,11 +293,50 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         self.overrideColorAction.setWhatsThis('OVERRIDE_COLOR_RGB')
         self.overrideColorAction.setCheckable(True)
 
+        self.objectColorIndexAction = QtWidgets.QAction('Object Color Index', parent=self.settingsMenu)
+        self.objectColorIndexAction.setObjectName('objectColorIndexAction')
+        self.objectColorIndexAction.setWhatsThis('OBJECT_COLOR_INDEX')
+        self.objectColorIndexAction.setCheckable(True)
+
+        self.overrideColorIndexAction = QtWidgets.QAction('Override Color Index', parent=self.settingsMenu)
+        self.overrideColorIndexAction.setObjectName('overrideColorIndexAction')
+        self.overrideColorIndexAction.setWhatsThis('OVERRIDE_COLOR_INDEX')
+        self.overrideColorIndexAction.setCheckable(True)
+
         self.colorModeActionGroup = QtWidgets.QActionGroup(self.settingsMenu)
         self.colorModeActionGroup.setObjectName('colorModeActionGroup')
         self.colorModeActionGroup.setExclusive(True)
         self.colorModeActionGroup.addAction(self.wireColorAction)
         self.colorModeActionGroup.addAction(self.overrideColorAction)
+        self.colorModeActionGroup.addAction(self.objectColorIndexAction)
+        self.colorModeActionGroup.addAction(self.overrideColorIndexAction)
+
+        self.pivotModeSection = QtWidgets.QAction('Pivot Mode:', parent=self.settingsMenu)
+        self.pivotModeSection.setObjectName('pivotModeSection')
+        self.pivotModeSection.setSeparator(True)
+
+        self.boundingBoxPivotAction = QtWidgets.QAction('Bounding Box', parent=self.settingsMenu)
+        self.boundingBoxPivotAction.setObjectName('boundingBoxPivotAction')
+        self.boundingBoxPivotAction.setWhatsThis('BOUNDING_BOX')
+        self.boundingBoxPivotAction.setCheckable(True)
+        self.boundingBoxPivotAction.setChecked(True)
+
+        self.centroidPivotAction = QtWidgets.QAction('Centroid', parent=self.settingsMenu)
+        self.centroidPivotAction.setObjectName('centroidPivotAction')
+        self.centroidPivotAction.setWhatsThis('CENTROID')
+        self.centroidPivotAction.setCheckable(True)
+
+        self.medianPivotAction = QtWidgets.QAction('Median', parent=self.settingsMenu)
+        self.medianPivotAction.setObjectName('medianPivotAction')
+        self.medianPivotAction.setWhatsThis('MEDIAN')
+        self.medianPivotAction.setCheckable(True)
+
+        self.pivotModeActionGroup = QtWidgets.QActionGroup(self.settingsMenu)
+        self.pivotModeActionGroup.setObjectName('pivotModeActionGroup')
+        self.pivotModeActionGroup.setExclusive(True)
+        self.pivotModeActionGroup.addAction(self.boundingBoxPivotAction)
+        self.pivotModeActionGroup.addAction(self.centroidPivotAction)
+        self.pivotModeActionGroup.addAction(self.medianPivotAction)
 
         self.settingsMenu.addActions(
             [
@@ -169,7 +344,13 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
                 self.changeNameConfigurationAction,
                 self.colorModeSection,
                 self.wireColorAction,
-                self.overrideColorAction
+                self.overrideColorAction,
+                self.objectColorIndexAction,
+                self.overrideColorIndexAction,
+                self.pivotModeSection,
+                self.boundingBoxPivotAction,
+                self.centroidPivotAction,
+                self.medianPivotAction
             ]
         )
 
@@ -182,7 +363,11 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         self.usingRigomaticAction.setObjectName('usingRigomaticAction')
         self.usingRigomaticAction.triggered.connect(self.on_usingRigomaticAction_triggered)
 
-        self.helpMenu.addActions([self.usingRigomaticAction])
+        self.profilerAction = QtWidgets.QAction('Profiler', parent=self.helpMenu)
+        self.profilerAction.setObjectName('profilerAction')
+        self.profilerAction.triggered.connect(self.on_profilerAction_triggered)
+
+        self.helpMenu.addActions([self.usingRigomaticAction, self.profilerAction])
 
         # Initialize central widget
         #
@@ -219,6 +404,11 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         self.namespaceComboBox.setFocusPolicy(QtCore.Qt.NoFocus)
         self.namespaceComboBox.currentIndexChanged.connect(self.on_namespaceComboBox_currentIndexChanged)
 
+        self.namespaceModel = qnamespacelistmodel.QNamespaceListModel(parent=self.namespaceComboBox)
+        self.namespaceModel.setObjectName('namespaceModel')
+
+        self.namespaceComboBox.setModel(self.namespaceModel)
+
         self.namespaceLabel = QtWidgets.QLabel(':')
         self.namespaceLabel.setObjectName('namespaceLabel')
         self.namespaceLabel.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed))
@@ -395,8 +585,9 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
     def selection(self):
         """
         Getter method that returns the current selection.
+        Nodes are only wrapped when accessed.
 
-        :rtype: List[mpynode.MPyNode]
+        :rtype: selectionutils.SelectionView
         """
 
         return self._selection
@@ -420,6 +611,16 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         """
 
         return self._selectedNode
+
+    @property
+    def droppedSelectionEvents(self):
+        """
+        Getter method that returns the number of selection changes that were coalesced into a later refresh.
+
+        :rtype: int
+        """
+
+        return self._droppedSelectionEvents
     # endregion
 
     # region Callbacks
@@ -431,8 +632,157 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
+        kinematicutils.clearIkSolvers()
+        kinematicutils.JointIndex.invalidate()
+        nameutils.NameIndex.invalidate()
+        modifyutils.clearWireframeColors()
+
+        self.invalidateNamespaces()
         self.invalidateSelection()
-        self.currentTab().invalidate(reason=self.InvalidateReason.SCENE_CHANGED)
+
+        # A new scene also replaces the active selection
+        #
+        for tab in self.iterTabs():
+
+            tab.markDirty(self.InvalidateReason.SELECTION_CHANGED)
+
+        self.invalidateTabs(reason=self.InvalidateReason.SCENE_CHANGED)
+
+    def namespaceRenamed(self, oldNamespace, newNamespace, *args, **kwargs):
+        """
+        Updates the namespace model after a namespace has been renamed.
+
+        :type oldNamespace: str
+        :type newNamespace: str
+        :key clientData: Any
+        :rtype: None
+        """
+
+        self.namespaceModel.renameNamespace(oldNamespace, newNamespace)
+        self.invalidateName()
+
+    def nodeAdded(self, node, *args, **kwargs):
+        """
+        Adds the namespace of the supplied node to the namespace model.
+
+        :type node: om.MObject
+        :key clientData: Any
+        :rtype: None
+        """
+
+        self.addNamespace(om.MFnDependencyNode(node).namespace)
+
+    def nodeRemoved(self, node, *args, **kwargs):
+        """
+        Schedules the namespace of the supplied node to be pruned from the namespace model.
+
+        :type node: om.MObject
+        :key clientData: Any
+        :rtype: None
+        """
+
+        self.requestPruneNamespace(om.MFnDependencyNode(node).namespace)
+
+    def nodeNameChanged(self, node, previousName, *args, **kwargs):
+        """
+        Updates the namespace model after a node has been renamed.
+        Only renames that change namespaces affect the model.
+
+        :type node: om.MObject
+        :type previousName: str
+        :key clientData: Any
+        :rtype: None
+        """
+
+        namespace = om.MFnDependencyNode(node).namespace
+        previousNamespace = previousName.rpartition(':')[0]
+
+        if self.namespaceModel.normalizeNamespace(namespace) != self.namespaceModel.normalizeNamespace(previousNamespace):
+
+            self.addNamespace(namespace)
+            self.requestPruneNamespace(previousNamespace)
+
+    def addNamespace(self, namespace):
+        """
+        Adds the supplied namespace to the namespace model if it is missing.
+
+        :type namespace: str
+        :rtype: None
+        """
+
+        if self.namespaceModel.indexOf(namespace) != -1:
+
+            return
+
+        with qsignalblocker.QSignalBlocker(self.namespaceComboBox):
+
+            self.namespaceModel.addNamespace(namespace)
+
+    def requestPruneNamespace(self, namespace):
+        """
+        Schedules the supplied namespace to be pruned from the namespace model.
+        Any requests made before the pending prune fires are merged.
+
+        :type namespace: str
+        :rtype: None
+        """
+
+        if self.namespaceModel.indexOf(namespace) <= 0:
+
+            return
+
+        self._prunedNamespaces.add(namespace)
+
+        if not self._namespaceTimer.isActive():
+
+            self._namespaceTimer.start()
+
+    def pruneNamespaces(self):
+        """
+        Removes any scheduled namespaces, from the namespace model, that no longer exist in the scene.
+
+        :rtype: None
+        """
+
+        self._namespaceTimer.stop()
+
+        namespaces = list(self._prunedNamespaces)
+        self._prunedNamespaces.clear()
+
+        with qsignalblocker.QSignalBlocker(self.namespaceComboBox):
+
+            pruned = [self.namespaceModel.pruneNamespace(namespace) for namespace in namespaces]
+
+        if any(pruned):
+
+            self.invalidateName()
+
+    def requestSelectionChanged(self, *args, **kwargs):
+        """
+        Schedules a selection change notification.
+        Any requests made before the pending notification fires are dropped, unless the maximum latency has elapsed.
+
+        :key clientData: Any
+        :rtype: None
+        """
+
+        # Check if a notification is already pending
+        #
+        if not self._selectionTimer.isActive():
+
+            self._selectionRequestTime = perf_counter()
+            self._selectionTimer.start()
+
+            return
+
+        # Check if the pending notification is overdue
+        #
+        self._droppedSelectionEvents += 1
+        elapsed = perf_counter() - self._selectionRequestTime
+
+        if elapsed >= self.__max_selection_latency__:
+
+            self.selectionChanged()
 
     def selectionChanged(self, *args, **kwargs):
         """
@@ -442,8 +792,10 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
+        self._selectionTimer.stop()
+
         self.invalidateSelection()
-        self.currentTab().invalidate(reason=self.InvalidateReason.SELECTION_CHANGED)
+        self.invalidateTabs(reason=self.InvalidateReason.SELECTION_CHANGED)
     # endregion
 
     # region Methods
@@ -473,6 +825,28 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             callbackId = om.MEventMessage.addEventCallback('SelectionChanged', onSelectionChanged)
             self._callbackIds.append(callbackId)
 
+            callbackId = om.MSceneMessage.addNamespaceRenamedCallback(onNamespaceRenamed)
+            self._callbackIds.append(callbackId)
+
+            callbackId = om.MDGMessage.addNodeAddedCallback(onNodeAdded, 'dependNode')
+            self._callbackIds.append(callbackId)
+
+            callbackId = om.MDGMessage.addNodeRemovedCallback(onNodeRemoved, 'dependNode')
+            self._callbackIds.append(callbackId)
+
+            callbackId = om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, onNodeNameChanged)
+            self._callbackIds.append(callbackId)
+
+            # Any namespace changes made while the callbacks were absent were missed!
+            #
+            self.invalidateNamespaces()
+
+        # Add cache callbacks
+        #
+        kinematicutils.JointIndex.addCallbacks()
+        nameutils.NameIndex.addCallbacks()
+        modifyutils.addColorCallbacks()
+
         # Update internal selection tracker
         #
         self.selectionChanged()
@@ -497,6 +871,16 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             om.MMessage.removeCallbacks(self._callbackIds)
             self._callbackIds.clear()
 
+        # Remove cache callbacks
+        #
+        kinematicutils.JointIndex.removeCallbacks()
+        nameutils.NameIndex.removeCallbacks()
+        modifyutils.removeColorCallbacks()
+
+        # Cancel any pending selection changes
+        #
+        self._selectionTimer.stop()
+
     def loadSettings(self, settings):
         """
         Loads the user settings.
@@ -516,6 +900,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         self._currentColor = (color.redF(), color.greenF(), color.blue())
 
         self.setColorMode(settings.value('editor/colorMode', defaultValue=2, type=int))
+        self.setPivotMode(settings.value('editor/pivotMode', defaultValue=0, type=int))
         self.tabControl.setCurrentIndex(settings.value('editor/currentTabIndex', defaultValue=0, type=int))
 
         # Load tab settings
@@ -539,6 +924,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         # Save user preferences
         #
         settings.setValue('editor/colorMode', int(self.colorMode()))
+        settings.setValue('editor/pivotMode', int(self.pivotMode()))
         settings.setValue('editor/currentColor', QtGui.QColor.fromRgbF(*self._currentColor))
         settings.setValue('editor/currentTabIndex', self.currentTabIndex())
 
@@ -611,6 +997,37 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
                 continue
 
+    def pivotMode(self):
+        """
+        Returns the current selection pivot mode.
+
+        :rtype: PivotMode
+        """
+
+        return PivotMode[self.pivotModeActionGroup.checkedAction().whatsThis()]
+
+    def setPivotMode(self, pivotMode):
+        """
+        Updates the current selection pivot mode.
+
+        :type pivotMode: Union[PivotMode, int]
+        :rtype: None
+        """
+
+        pivotMode = PivotMode(pivotMode)
+        pivotModeName = pivotMode.name
+
+        for action in self.pivotModeActionGroup.actions():
+
+            if action.whatsThis() == pivotModeName:
+
+                action.setChecked(True)
+                break
+
+            else:
+
+                continue
+
     def wireColor(self):
         """
         Returns the current wire color.
@@ -620,10 +1037,12 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
         return self.wireColorButton.color(asRGB=True, normalize=True)
 
-    def selectionPivot(self):
+    def selectionPivot(self, pivotMode=None):
         """
         Returns the pivot of the active selection.
+        Component positions are gathered per shape as arrays so large selections are evaluated in bulk.
 
+        :type pivotMode: Union[PivotMode, None]
         :rtype: om.MMatrix
         """
 
@@ -636,9 +1055,9 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             return om.MMatrix.kIdentity
 
-        # Calculate active pivot
+        # Collect world positions
         #
-        boundingBox = om.MBoundingBox()
+        positions = []
 
         for (node, component) in componentSelection:
 
@@ -648,46 +1067,59 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             if not hasComponent:
 
-                # Expand bounding-box using world position
+                # Use world position
                 #
                 worldMatrix = node.worldMatrix()
-                position = transformutils.breakMatrix(worldMatrix)[3]
+                positions.append(np.array(worldMatrix, dtype=float).reshape(1, 4, 4)[:, 3, :3])
 
-                boundingBox.expand(position)
                 continue
 
             # Evaluate shape type
             #
             if node.hasFn(om.MFn.kMesh):
 
+                # Fetch every point in a single call and gather the selected vertices
+                #
                 vertexComponent = node(component).convert(om.MFn.kMeshVertComponent)
-                elements = vertexComponent.elements()
+                elements = np.array(vertexComponent.elements(), dtype=int)
+                points = np.array(om.MFnMesh(node.object()).getPoints(om.MSpace.kObject), dtype=float)
 
-                parentMatrix = node.parentMatrix()
+            elif node.hasFn(om.MFn.kNurbsSurface):
 
-                for element in elements:
+                # Surface CVs are indexed by (u, v) pairs so flatten them into point indices
+                # Be aware that CV positions are ordered with V varying fastest!
+                #
+                fnSurface = om.MFnNurbsSurface(node.object())
+                indices = np.array(om.MFnDoubleIndexedComponent(component).getElements(), dtype=int).reshape(-1, 2)
 
-                    position = om.MPoint(node.getPoint(element)) * parentMatrix
-                    boundingBox.expand(position)
+                elements = (indices[:, 0] * fnSurface.numCVsInV) + indices[:, 1]
+                points = np.array(fnSurface.cvPositions(om.MSpace.kObject), dtype=float)
 
             else:
 
-                elements = om.MFnSingleIndexedComponent(component).getElements()
-                controlPoints = node.controlPoints()
+                elements = np.array(om.MFnSingleIndexedComponent(component).getElements(), dtype=int)
+                points = np.array(node.controlPoints(), dtype=float)
 
-                parentMatrix = node.parentMatrix()
+            # Transform selected points into world space
+            #
+            if len(elements) == 0 or len(points) == 0:
 
-                for element in elements:
+                continue
 
-                    position = om.MPoint(controlPoints[element]) * parentMatrix
-                    boundingBox.expand(position)
+            parentMatrix = np.array(node.parentMatrix(), dtype=float)
+            positions.append(solverutils.transformPoints(points[elements, :3], parentMatrix))
+
+        # Calculate active pivot
+        #
+        pivotMode = self.pivotMode() if pivotMode is None else PivotMode(pivotMode)
+        pivot = solverutils.calculatePivot(np.concatenate(positions) if len(positions) > 0 else np.zeros((0, 3)), pivotMode=pivotMode)
 
         # Compose transform matrix
         #
         firstNode = componentSelection[0][0]
         worldMatrix = firstNode.worldMatrix()
 
-        translateMatrix = transformutils.createTranslateMatrix(boundingBox.center)
+        translateMatrix = transformutils.createTranslateMatrix(om.MPoint(*pivot.tolist()))
         rotateMatrix = transformutils.createRotationMatrix(worldMatrix)
         scaleMatrix = transformutils.createScaleMatrix(worldMatrix)
         matrix = scaleMatrix * rotateMatrix * translateMatrix
@@ -744,6 +1176,29 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
         return list(self.iterTabs())
 
+    @profileutils.profile
+    def invalidateTabs(self, reason=None):
+        """
+        Invalidates the current tab and marks the hidden tabs as dirty.
+        Hidden tabs process their merged reasons once they are shown.
+
+        :type reason: Union[InvalidateReason, None]
+        :rtype: None
+        """
+
+        currentTab = self.currentTab()
+
+        for tab in self.iterTabs():
+
+            if tab is currentTab:
+
+                tab.invalidate(reason=reason)
+
+            else:
+
+                tab.markDirty(reason)
+
+    @profileutils.profile
     def invalidateName(self):
         """
         Refreshes the current namespace item and name line-edit.
@@ -760,7 +1215,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         if self.selectedNode is not None:
 
             name = self.selectedNode.name() if (self.selectionCount == 1) else ''
-            namespaceIndex = self.namespaceComboBox.findText(self.selectedNode.namespace())
+            namespaceIndex = self.namespaceModel.indexOf(self.selectedNode.namespace())
 
         # Update name widgets
         #
@@ -770,21 +1225,19 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             self.nameLineEdit.setText(name)
             self.nameLineEdit.setPlaceholderText(placeholderText)
 
+    @profileutils.profile
     def invalidateNamespaces(self):
         """
-        Refreshes the namespace combo-box items.
+        Synchronizes the namespace combo-box items with the scene.
 
         :rtype: None
         """
 
-        namespaces = om.MNamespace.getNamespaces(parentNamespace=':', recurse=True)
-        namespaces.insert(0, '')
-
         with qsignalblocker.QSignalBlocker(self.namespaceComboBox):
 
-            self.namespaceComboBox.clear()
-            self.namespaceComboBox.addItems(namespaces)
+            self.namespaceModel.sync()
 
+    @profileutils.profile
     def invalidateColor(self):
         """
         Refreshes the wire-color button.
@@ -794,15 +1247,12 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
         # Evaluate current selection
         #
-        selection = [node for node in self.selection if node.hasFn(om.MFn.kTransform)]
-        selectionCount = len(selection)
+        node = self.selection.first(apiType=om.MFn.kTransform)
 
-        if selectionCount > 0:
+        if node is not None:
 
             # Evaluate immediate shape
             #
-            node = selection[0]
-
             colorMode = self.colorMode()
             colorRGB = modifyutils.findWireframeColor(node, colorMode=colorMode)
             color = QtGui.QColor.fromRgbF(*colorRGB)
@@ -821,6 +1271,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
                 self.wireColorButton.setColor(color)
 
+    @profileutils.profile
     def invalidateSelection(self):
         """
         Refreshes the selection related widgets.
@@ -830,9 +1281,9 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
         # Update internal selection trackers
         #
-        self._selection = self.scene.selection(apiType=om.MFn.kDependencyNode)
+        self._selection = selectionutils.SelectionView(apiType=om.MFn.kDependencyNode)
         self._selectionCount = len(self._selection)
-        self._selectedNode = self._selection[0] if (self._selectionCount > 0) else None
+        self._selectedNode = self._selection.first() if (self._selectionCount > 0) else None
 
         # Refresh selection widgets
         #
@@ -850,14 +1301,11 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
-        sender = self.sender()
-        numNamespaces = sender.count()
+        numNamespaces = self.namespaceModel.rowCount()
 
         if (self.selectionCount > 0) and (0 <= index < numNamespaces):
 
-            namespaces = [sender.itemText(i) for i in range(numNamespaces)]
-            namespace = namespaces[index]
-
+            namespace = self.namespaceModel.namespace(index)
             modifyutils.renamespaceNodes(*self.selection, namespace=namespace)
 
     @QtCore.Slot(str)
@@ -884,6 +1332,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             self.invalidateName()
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_wireColorButton_clicked(self):
         """
         Slot method for the `wireColorButton` widget's `clicked` signal.
@@ -916,13 +1365,14 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             colorRGB = (color.redF(), color.greenF(), color.blueF())
             colorMode = self.colorMode()
 
-            modifyutils.recolorNodes(*self.selection, color=colorRGB, colorMode=colorMode)
+            modifyutils.batchRecolorNodes(self.selection, colorRGB, colorMode=colorMode)
 
         else:
 
             self._currentColor = (color.redF(), color.greenF(), color.blueF())
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_transformPushButton_clicked(self):
         """
         Slot method for the `transformPushButton` widget's `clicked` signal.
@@ -946,7 +1396,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             # Create nodes from active selection
             #
-            createutils.createNodesFromSelection('transform', self.selection)
+            createutils.createNodesFromSelection('transform', self.selection, batch=True)
 
         else:
 
@@ -955,6 +1405,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             createutils.createNode('transform', name=self.currentName())
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_jointPushButton_clicked(self):
         """
         Slot method for the `jointPushButton` widget's `clicked` signal.
@@ -978,7 +1429,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             # Create nodes from active selection
             #
-            createutils.createNodesFromSelection('joint', self.selection)
+            createutils.createNodesFromSelection('joint', self.selection, batch=True)
 
         else:
 
@@ -987,6 +1438,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             createutils.createNode('joint', name=self.currentName())
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_ikHandlePushButton_clicked(self):
         """
         Slot method for the `ikHandlePushButton` widget's `clicked` signal.
@@ -1001,11 +1453,17 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             createutils.addIKSolver(joints[0], joints[1])
 
+        elif numJoints > 2 and (numJoints % 2) == 0:
+
+            pairs = list(zip(joints[0::2], joints[1::2]))
+            createutils.addIKSolvers(pairs, jointIndex=kinematicutils.JointIndex.getInstance())
+
         else:
 
-            log.warning(f'Adding IK requires a start and end joint ({numJoints} selected)!')
+            log.warning(f'Adding IK requires pairs of start and end joints ({numJoints} selected)!')
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_locatorPushButton_clicked(self):
         """
         Slot method for the `locatorPushButton` widget's `clicked` signal.
@@ -1029,7 +1487,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             # Create nodes from active selection
             #
-            createutils.createNodesFromSelection('transform', self.selection, locator=True, colorRGB=self.wireColor())
+            createutils.createNodesFromSelection('transform', self.selection, locator=True, colorRGB=self.wireColor(), batch=True)
 
         else:
 
@@ -1038,6 +1496,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             createutils.createNode('transform', name=self.currentName(), locator=True, colorRGB=self.wireColor())
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_helperPushButton_clicked(self):
         """
         Slot method for the `helperPushButton` widget's `clicked` signal.
@@ -1061,7 +1520,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
             # Create nodes from active selection
             #
-            createutils.createNodesFromSelection('transform', self.selection, helper=True, colorRGB=self.wireColor())
+            createutils.createNodesFromSelection('transform', self.selection, helper=True, colorRGB=self.wireColor(), batch=True)
 
         else:
 
@@ -1070,6 +1529,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
             createutils.createNode('transform', name=self.currentName(), helper=True, colorRGB=self.wireColor())
 
     @QtCore.Slot()
+    @profileutils.profile
     def on_intermediatePushButton_clicked(self):
         """
         Slot method for the `intermediatePushButton` widget's `clicked` signal.
@@ -1079,7 +1539,7 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
 
         if self.selectionCount > 0:
 
-            createutils.createIntermediate(*self.selection)
+            createutils.createIntermediate(*self.selection, batch=True)
 
         else:
 
@@ -1100,9 +1560,11 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         if 0 <= index < numTabs:
 
             tab = tabs[index]
-            log.debug(f'Invalidating {tab.objectName()} tab!')
 
-            tab.invalidate(reason=self.InvalidateReason.TAB_CHANGED)
+            if tab.isDirty():
+
+                log.debug(f'Invalidating {tab.objectName()} tab!')
+                tab.invalidate(reason=self.InvalidateReason.TAB_CHANGED)
 
     @QtCore.Slot()
     def on_usingRigomaticAction_triggered(self):
@@ -1113,4 +1575,20 @@ class QRigomatic(qsingletonwindow.QSingletonWindow):
         """
 
         webbrowser.open('https://github.com/bhsingleton/rigomatic')
+
+    @QtCore.Slot()
+    def on_profilerAction_triggered(self):
+        """
+        Slot method for the profilerAction's `triggered` signal.
+
+        :rtype: None
+        """
+
+        if self._profilerWidget is None:
+
+            self._profilerWidget = qprofilerwidget.QProfilerWidget(parent=self)
+
+        self._profilerWidget.show()
+        self._profilerWidget.raise_()
     # endregion
+
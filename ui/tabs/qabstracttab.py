@@ -2,6 +2,7 @@ from abc import abstractmethod
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
 from dcc.ui.abstract import qabcmeta
 from .. import InvalidateReason
+from ...libs import profileutils
 
 import logging
 logging.basicConfig()
@@ -19,6 +20,24 @@ class QAbstractTab(QtWidgets.QWidget, metaclass=qabcmeta.QABCMeta):
     # endregion
 
     # region Dunderscores
+    __invalidators__ = {}  # Maps invalidate methods to the reasons they depend on
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Private method called after a subclass has been created.
+        Any invalidate methods and clicked slots are instrumented for profiling.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QAbstractTab, cls).__init_subclass__(**kwargs)
+
+        # Instrument hot paths
+        #
+        profileutils.instrumentClass(cls, r'^(invalidate\w*|on_\w+_clicked)$')
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -35,6 +54,10 @@ class QAbstractTab(QtWidgets.QWidget, metaclass=qabcmeta.QABCMeta):
 
         super(QAbstractTab, self).__init__(parent=parent, f=f)
 
+        # Declare private variables
+        #
+        self._dirtyReasons = {InvalidateReason.SCENE_CHANGED, InvalidateReason.SELECTION_CHANGED}
+
     def __post_init__(self, *args, **kwargs):
         """
         Private method called after an instance has initialized.
@@ -73,7 +96,7 @@ class QAbstractTab(QtWidgets.QWidget, metaclass=qabcmeta.QABCMeta):
         """
         Getter method that returns the current selection.
 
-        :rtype: List[mpynode.MPyNode]
+        :rtype: selectionutils.SelectionView
         """
 
         return self.window().selection
@@ -147,13 +170,68 @@ class QAbstractTab(QtWidgets.QWidget, metaclass=qabcmeta.QABCMeta):
 
         return self.window().colorMode()
 
+    def isDirty(self):
+        """
+        Evaluates if this tab has any pending invalidation reasons.
+
+        :rtype: bool
+        """
+
+        return len(self._dirtyReasons) > 0
+
+    def dirtyReasons(self):
+        """
+        Returns the pending invalidation reasons.
+
+        :rtype: Set[InvalidateReason]
+        """
+
+        return set(self._dirtyReasons)
+
+    def markDirty(self, reason):
+        """
+        Records an invalidation reason to be processed the next time this tab is invalidated.
+
+        :type reason: InvalidateReason
+        :rtype: None
+        """
+
+        if reason in (InvalidateReason.NONE, InvalidateReason.TAB_CHANGED):
+
+            return
+
+        self._dirtyReasons.add(reason)
+
+    @profileutils.profile
     def invalidate(self, reason=None):
         """
         Refreshes the user interface.
+        The supplied reason is merged with any pending reasons and only the invalidate methods that depend on them are called.
+        If no reason is supplied then every invalidate method is called.
 
         :type reason: Union[InvalidateReason, None]
         :rtype: None
         """
 
-        pass
+        # Merge pending reasons
+        #
+        if reason is None:
+
+            reasons = set(InvalidateReason)
+
+        else:
+
+            self.markDirty(reason)
+            reasons = self._dirtyReasons
+
+        self._dirtyReasons = set()
+
+        # Call dependent invalidate methods
+        #
+        for (name, dependencies) in self.__invalidators__.items():
+
+            if any(dependency in reasons for dependency in dependencies):
+
+                log.debug(f'Invalidating {self.objectName()}.{name}()')
+                getattr(self, name)()
     # endregion
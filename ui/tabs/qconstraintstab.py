@@ -18,6 +18,10 @@ class QConstraintsTab(qabstracttab.QAbstractTab):
     """
 
     # region Dunderscores
+    __invalidators__ = {
+        'invalidateEditor': (qabstracttab.InvalidateReason.SELECTION_CHANGED,)
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -704,24 +708,6 @@ class QConstraintsTab(qabstracttab.QAbstractTab):
         self.weightSpinBox.blockSignals(True)
         self.weightSpinBox.setValue(weight)
         self.weightSpinBox.blockSignals(False)
-
-    def invalidate(self, reason=None):
-        """
-        Refreshes the user interface.
-
-        :type reason: Union[InvalidateReason, None]
-        :rtype: None
-        """
-
-        # Call parent method
-        #
-        super(QConstraintsTab, self).invalidate()
-
-        # Evaluate invalidation reason
-        #
-        if reason == self.InvalidateReason.SELECTION_CHANGED:
-
-            self.invalidateEditor()
     # endregion
 
     # region Slots
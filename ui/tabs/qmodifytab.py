@@ -1,8 +1,8 @@
 from maya.api import OpenMaya as om
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
 from dcc.ui import qxyzwidget, qdivider
-from dcc.maya.decorators import undo
 from . import qabstracttab
+from ...libs import batchutils
 
 import logging
 logging.basicConfig()
@@ -395,7 +395,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
 
         self.preserveShapesCheckBox.setChecked(preserveShapes)
 
-    @undo.Undo(name='Align Nodes')
+    @batchutils.Batch(name='Align Nodes')
     def alignNodes(self, copyFrom, copyTo, **kwargs):
         """
         Aligns the second node to the first node.
@@ -447,7 +447,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
                     log.warning(f'No support for {shape.apiTypeStr} shapes!')
                     continue
 
-    @undo.Undo(name='Freeze Parent-Offsets')
+    @batchutils.Batch(name='Freeze Parent-Offsets')
     def freezePivots(self, *nodes, includeTranslate=True, includeRotate=True, includeScale=False):
         """
         Freezes the pivots on the supplied nodes.
@@ -473,7 +473,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
             #
             node.freezePivots(includeTranslate=includeTranslate, includeRotate=includeRotate, includeScale=includeScale)
 
-    @undo.Undo(name='Melt Pivots')
+    @batchutils.Batch(name='Melt Pivots')
     def meltPivots(self, *nodes):
         """
         Melts the pivots on the supplied nodes.
@@ -496,7 +496,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
             #
             node.unfreezePivots()
 
-    @undo.Undo(name='Freeze Parent Offsets')
+    @batchutils.Batch(name='Freeze Parent Offsets')
     def freezeParentOffsets(self, *nodes, includeTranslate=True, includeRotate=True, includeScale=False):
         """
         Freezes the parent offsets on the supplied nodes.
@@ -522,7 +522,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
             #
             node.freezeTransform(includeTranslate=includeTranslate, includeRotate=includeRotate, includeScale=includeScale)
 
-    @undo.Undo(name='Melt Parent Offsets')
+    @batchutils.Batch(name='Melt Parent Offsets')
     def meltParentOffsets(self, *nodes):
         """
         Melts the parent offsets on the supplied nodes.
@@ -545,7 +545,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
 
                 continue
 
-    @undo.Undo(name='Reset Pivots')
+    @batchutils.Batch(name='Reset Pivots')
     def resetPivots(self, *nodes):
         """
         Resets the pivots on the supplied nodes.
@@ -568,7 +568,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
 
                 continue
 
-    @undo.Undo(name='Reset Pre-Rotations')
+    @batchutils.Batch(name='Reset Pre-Rotations')
     def resetPreRotations(self, *nodes):
         """
         Resets any pre-rotations on the supplied nodes.
@@ -594,7 +594,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
             node.resetPreEulerRotation()
             node.setMatrix(matrix, skipTranslate=True, skipScale=True)
 
-    @undo.Undo(name='Zero Transforms')
+    @batchutils.Batch(name='Zero Transforms')
     def zeroTransforms(self, *nodes):
         """
         Resets the transform matrix on the supplied nodes.
@@ -617,7 +617,7 @@ class QModifyTab(qabstracttab.QAbstractTab):
             #
             node.resetMatrix()
 
-    @undo.Undo(name='Sanitize Transforms')
+    @batchutils.Batch(name='Sanitize Transforms')
     def sanitizeTransforms(self, *nodes):
         """
         Cleans the transform matrix on the supplied nodes.
@@ -4,11 +4,11 @@ from maya import cmds as mc
 from maya.api import OpenMaya as om
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
 from dcc.python import stringutils
-from dcc.maya.decorators import undo
 from dcc.generators.consecutivepairs import consecutivePairs
 from copy import copy
 from enum import IntEnum
 from . import qabstracttab
+from ...libs import batchutils
 
 import logging
 logging.basicConfig()
@@ -33,6 +33,10 @@ class QRenameTab(qabstracttab.QAbstractTab):
     """
 
     # region Dunderscores
+    __invalidators__ = {
+        'invalidatePreview': (qabstracttab.InvalidateReason.SCENE_CHANGED, qabstracttab.InvalidateReason.SELECTION_CHANGED)  # The type option lists nodes from the entire scene
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -590,7 +594,7 @@ class QRenameTab(qabstracttab.QAbstractTab):
 
             self.typeComboBox.setCurrentIndex(index)
 
-    @undo.Undo(name='Rename Nodes')
+    @batchutils.Batch(name='Rename Nodes')
     def renameNodes(self, nodes, names):
         """
         Renames the supplied nodes with the specified names.
@@ -720,22 +724,6 @@ class QRenameTab(qabstracttab.QAbstractTab):
 
             index = self.previewTableModel.index(i, 1)
             self.previewTableModel.setData(index, after, role=QtCore.Qt.DisplayRole)
-
-    def invalidate(self, reason=None):
-        """
-        Refreshes the user interface.
-
-        :type reason: Union[InvalidateReason, None]
-        :rtype: None
-        """
-
-        # Call parent method
-        #
-        super(QRenameTab, self).invalidate()
-
-        # Invalidate user interface
-        #
-        self.invalidatePreview()
     # endregion
 
     # region Slots
@@ -13,7 +13,7 @@ from enum import IntEnum
 from random import randint
 from . import qabstracttab
 from ..widgets import qcolorbutton, qgradient
-from ...libs import createutils, modifyutils, ColorMode
+from ...libs import createutils, modifyutils, batchutils, ColorMode
 
 import logging
 logging.basicConfig()
@@ -56,6 +56,11 @@ class QShapesTab(qabstracttab.QAbstractTab):
     # endregion
 
     # region Dunderscores
+    __invalidators__ = {
+        'invalidateDimensions': (qabstracttab.InvalidateReason.SELECTION_CHANGED,),
+        'invalidateGradient': (qabstracttab.InvalidateReason.SELECTION_CHANGED,)
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -813,7 +818,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
 
             QtWidgets.QColorDialog.setCustomColor(i, color)
 
-    @undo.Undo(name='Create Custom Shapes')
+    @batchutils.Batch(name='Create Custom Shapes')
     def createCustomShapes(self, filename, name='', colorRGB=None, selection=None):
         """
         Creates the specified custom shape.
@@ -870,7 +875,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
 
             return node
 
-    @undo.Undo(name='Add Custom Shapes')
+    @batchutils.Batch(name='Add Custom Shapes')
     def addCustomShapes(self, filename, nodes, colorRGB=None):
         """
         Adds the specified custom shape to the supplied nodes.
@@ -1016,7 +1021,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
 
         return node, helper
 
-    @undo.Undo(name='Rename Shapes')
+    @batchutils.Batch(name='Rename Shapes')
     def renameShapes(self, *nodes):
         """
         Renames all the shapes on the supplied nodes.
@@ -1039,7 +1044,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
             #
             node.renameShapes()
 
-    @undo.Undo(name='Mirror Shapes')
+    @batchutils.Batch(name='Mirror Shapes')
     def mirrorShapes(self, *nodes):
         """
         Mirrors all the shapes on the supplied nodes.
@@ -1142,7 +1147,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
                     log.warning(f'Unable to mirror {shape.typeName} types!')
                     continue
 
-    @undo.Undo(name='Remove Shapes')
+    @batchutils.Batch(name='Remove Shapes')
     def removeShapes(self, *nodes):
         """
         Removes all the shapes from the supplied nodes.
@@ -1166,7 +1171,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
             log.info(f'Removing shapes from: {node}')
             node.removeShapes()
 
-    @undo.Undo(name='Colorize Shapes')
+    @batchutils.Batch(name='Colorize Shapes')
     def colorizeShapes(self, *nodes, startColor=None, endColor=None):
         """
         Applies a gradient to the supplied nodes.
@@ -1177,27 +1182,28 @@ class QShapesTab(qabstracttab.QAbstractTab):
         :rtype: None
         """
 
-        # Iterate through nodes
+        # Calculate gradient colors
         #
         numNodes = len(nodes)
         factor = 1.0 / (numNodes - 1)
 
-        for (i, node) in enumerate(nodes):
+        colors = []
+
+        for i in range(numNodes):
 
-            # Calculate color
-            #
             weight = float(i) * factor
             red = (startColor.redF() * (1.0 - weight)) + (endColor.redF() * weight)
             green = (startColor.greenF() * (1.0 - weight)) + (endColor.greenF() * weight)
             blue = (startColor.blueF() * (1.0 - weight)) + (endColor.blueF() * weight)
 
-            color = (red, green, blue)
+            colors.append((red, green, blue))
 
-            # Recolor node
-            #
-            modifyutils.recolorNodes(node, color=color, colorMode=self.colorMode())
+        # Recolor nodes in bulk
+        #
+        summary = modifyutils.batchRecolorNodes(nodes, colors, colorMode=self.colorMode())
+        log.debug(f'Recolored {summary["shapes"]} shape(s) across {summary["colors"]} colour(s).')
 
-    @undo.Undo(name='Rescale Shapes')
+    @batchutils.Batch(name='Rescale Shapes')
     def rescaleShapes(self, *nodes, percentage=0.0):
         """
         Resizes the supplied shapes along the specified dimension.
@@ -1261,7 +1267,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
                 controlPoints = [om.MPoint(point) * parentMatrix * pivotMatrix.inverse() * scaleMatrix * pivotMatrix * parentMatrix.inverse() for point in shape.controlPoints()]
                 shape.setControlPoints(controlPoints)
 
-    @undo.Undo(name='Resize Helpers')
+    @batchutils.Batch(name='Resize Helpers')
     def resizeHelpers(self, *nodes, dimension=None, amount=0.0):
         """
         Resizes the supplied shapes along the specified dimension.
@@ -1377,7 +1383,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
 
                     log.warning(f'No support for {shape.apiTypeStr} shapes!')
 
-    @undo.Undo(name='Fit Helpers')
+    @batchutils.Batch(name='Fit Helpers')
     def fitHelpers(self, *nodes):
         """
         Scales the supplied helpers to fit between each node.
@@ -1417,7 +1423,7 @@ class QShapesTab(qabstracttab.QAbstractTab):
         #
         self.invalidateDimensions()
 
-    @undo.Undo(name='Reset Helpers')
+    @batchutils.Batch(name='Reset Helpers')
     def resetHelpers(self, *nodes):
         """
         Resets the local matrix on the supplied helpers.
@@ -1567,23 +1573,6 @@ class QShapesTab(qabstracttab.QAbstractTab):
             #
             self.startColorChanged.emit(self._startColor)
             self.endColorChanged.emit(self._endColor)
-
-    def invalidate(self, reason=None):
-        """
-        Refreshes the user interface.
-
-        :type reason: Union[InvalidateReason, None]
-        :rtype: None
-        """
-
-        # Call parent method
-        #
-        super(QShapesTab, self).invalidate()
-
-        # Invalidate user interface
-        #
-        self.invalidateDimensions()
-        self.invalidateGradient()
     # endregion
 
     # region Slots
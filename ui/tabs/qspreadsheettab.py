@@ -15,6 +15,10 @@ class QSpreadsheetTab(qabstracttab.QAbstractTab):
     """
 
     # region Dunderscores
+    __invalidators__ = {
+        'invalidateEditor': (qabstracttab.InvalidateReason.SELECTION_CHANGED,)
+    }
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -191,22 +195,6 @@ class QSpreadsheetTab(qabstracttab.QAbstractTab):
         else:
 
             self.attributeItemModel.invisibleRootItem = om.MObjectHandle()
-
-    def invalidate(self, reason=None):
-        """
-        Refreshes the user interface.
-
-        :type reason: Union[InvalidateReason, None]
-        :rtype: None
-        """
-
-        # Call parent method
-        #
-        super(QSpreadsheetTab, self).invalidate()
-
-        # Refresh attribute editor
-        #
-        self.invalidateEditor()
     # endregion
 
     # region Slots
@@ -0,0 +1,195 @@
+from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+from ...libs import profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class QProfilerWidget(QtWidgets.QWidget):
+    """
+    Overload of `QWidget` that displays the live profiling records.
+    """
+
+    # region Dunderscores
+    __columns__ = ('name', 'calls', 'total', 'mean', 'p50', 'p90', 'p99', 'nodes')
+    __headers__ = ('Function', 'Calls', 'Total (ms)', 'Mean (ms)', 'P50 (ms)', 'P90 (ms)', 'P99 (ms)', 'Nodes')
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :key parent: QtWidgets.QWidget
+        :key f: QtCore.Qt.WindowFlags
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        parent = kwargs.pop('parent', None)
+        f = kwargs.pop('f', QtCore.Qt.Tool)
+
+        super(QProfilerWidget, self).__init__(parent=parent, f=f)
+
+        # Edit widget properties
+        #
+        self.setWindowTitle('|| Profiler')
+        self.setMinimumSize(QtCore.QSize(600, 300))
+
+        # Initialize enabled check-box
+        #
+        self.enabledCheckBox = QtWidgets.QCheckBox('Enabled')
+        self.enabledCheckBox.setObjectName('enabledCheckBox')
+        self.enabledCheckBox.setChecked(profileutils.isEnabled())
+        self.enabledCheckBox.toggled.connect(self.on_enabledCheckBox_toggled)
+
+        self.clearPushButton = QtWidgets.QPushButton('Clear')
+        self.clearPushButton.setObjectName('clearPushButton')
+        self.clearPushButton.clicked.connect(self.on_clearPushButton_clicked)
+
+        self.exportPushButton = QtWidgets.QPushButton('Export')
+        self.exportPushButton.setObjectName('exportPushButton')
+        self.exportPushButton.clicked.connect(self.on_exportPushButton_clicked)
+
+        self.buttonsLayout = QtWidgets.QHBoxLayout()
+        self.buttonsLayout.setObjectName('buttonsLayout')
+        self.buttonsLayout.setContentsMargins(0, 0, 0, 0)
+        self.buttonsLayout.addWidget(self.enabledCheckBox)
+        self.buttonsLayout.addStretch()
+        self.buttonsLayout.addWidget(self.clearPushButton)
+        self.buttonsLayout.addWidget(self.exportPushButton)
+
+        # Initialize records table
+        #
+        self.recordsTableWidget = QtWidgets.QTableWidget(0, len(self.__columns__))
+        self.recordsTableWidget.setObjectName('recordsTableWidget')
+        self.recordsTableWidget.setHorizontalHeaderLabels(self.__headers__)
+        self.recordsTableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.recordsTableWidget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.recordsTableWidget.setAlternatingRowColors(True)
+        self.recordsTableWidget.verticalHeader().setVisible(False)
+        self.recordsTableWidget.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+
+        # Initialize central layout
+        #
+        self.centralLayout = QtWidgets.QVBoxLayout()
+        self.centralLayout.setObjectName('centralLayout')
+        self.centralLayout.addLayout(self.buttonsLayout)
+        self.centralLayout.addWidget(self.recordsTableWidget)
+
+        self.setLayout(self.centralLayout)
+
+        # Initialize refresh timer
+        #
+        self._timer = QtCore.QTimer(parent=self)
+        self._timer.setObjectName('timer')
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.invalidate)
+    # endregion
+
+    # region Events
+    def showEvent(self, event):
+        """
+        Event method called after the widget has been shown.
+
+        :type event: QtGui.QShowEvent
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QProfilerWidget, self).showEvent(event)
+
+        # Start refreshing records
+        #
+        self.invalidate()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        """
+        Event method called after the widget has been hidden.
+
+        :type event: QtGui.QHideEvent
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QProfilerWidget, self).hideEvent(event)
+
+        # Stop refreshing records
+        #
+        self._timer.stop()
+    # endregion
+
+    # region Methods
+    def invalidate(self):
+        """
+        Refreshes the records table.
+
+        :rtype: None
+        """
+
+        records = profileutils.records()
+        numRecords = len(records)
+
+        self.recordsTableWidget.setRowCount(numRecords)
+
+        for (row, record) in enumerate(records):
+
+            for (column, key) in enumerate(self.__columns__):
+
+                value = record[key]
+
+                if isinstance(value, float):
+
+                    text = f'{value * 1000.0:.3f}'
+
+                else:
+
+                    text = str(value)
+
+                item = QtWidgets.QTableWidgetItem(text)
+                item.setTextAlignment((QtCore.Qt.AlignLeft if column == 0 else QtCore.Qt.AlignRight) | QtCore.Qt.AlignVCenter)
+
+                self.recordsTableWidget.setItem(row, column, item)
+    # endregion
+
+    # region Slots
+    @QtCore.Slot(bool)
+    def on_enabledCheckBox_toggled(self, checked):
+        """
+        Slot method for the `enabledCheckBox` widget's `toggled` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        profileutils.setEnabled(checked)
+
+    @QtCore.Slot()
+    def on_clearPushButton_clicked(self):
+        """
+        Slot method for the `clearPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        profileutils.clearRecords()
+        self.invalidate()
+
+    @QtCore.Slot()
+    def on_exportPushButton_clicked(self):
+        """
+        Slot method for the `exportPushButton` widget's `clicked` signal.
+
+        :rtype: None
+        """
+
+        filePath, selectedFilter = QtWidgets.QFileDialog.getSaveFileName(self, 'Export Profiling Records', '', 'JSON Files (*.json)')
+
+        if filePath:
+
+            profileutils.exportRecords(filePath)
+    # endregion